@@ -3,13 +3,80 @@ KaggleEase: The fastest, notebook-first way to load Kaggle datasets.
 """
 __version__ = "1.3.10"
 
-from .load import load
-from .search import search
-from .magics import register_magics
-from .progress import ProgressBar, show_progress
+import sys
+import importlib
+from types import ModuleType
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access so `import kaggleease` stays cheap (no pandas, kagglehub,
+# IPython or psutil until they are needed).
+_LAZY_ATTRS = {
+    "load": "load",
+    "search": "search",
+    "iter_search": "search",
+    "aload": "aio",
+    "asearch": "aio",
+    "AsyncKaggleClient": "aio",
+    "load_many": "batch",
+    "register_magics": "magics",
+    "ProgressBar": "progress",
+    "show_progress": "progress",
+    "configure_session": "session",
+    "session_stats": "session",
+    "sync_catalog": "catalog",
+    "catalog_search": "catalog",
+    "configure_catalog": "catalog",
+    "suggest_handles": "suggest",
+    "configure_search_cache": "search_cache",
+    "clear_search_cache": "search_cache",
+    "search_cache_stats": "search_cache",
+    "configure_metadata_cache": "metadata",
+    "clear_metadata_cache": "metadata",
+    "configure_columnar_cache": "columnar",
+    "clear_columnar_cache": "columnar",
+    "configure_downloads": "download",
+    "configure_cache_budget": "eviction",
+    "cache_entries": "eviction",
+    "prune_cache": "eviction",
+    "pin_dataset": "eviction",
+    "unpin_dataset": "eviction",
+}
+
+__all__ = sorted(_LAZY_ATTRS) + ["load_ipython_extension"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+class _Package(ModuleType):
+    """
+    `load` and `search` are both submodules and the functions they export.
+    Importing a submodule binds it on the package; keep the public function
+    there instead, as the eager `from .load import load` used to.
+    """
+
+    def __setattr__(self, name, value):
+        if (
+            isinstance(value, ModuleType)
+            and _LAZY_ATTRS.get(name) == name
+            and value.__name__ == f"{__name__}.{name}"
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
 
-# Auto-register the magics when imported in an IPython environment
-register_magics()
 
 def load_ipython_extension(ipython):
     """
@@ -18,3 +85,9 @@ def load_ipython_extension(ipython):
     """
     from .magics import KaggleMagics
     ipython.register_magics(KaggleMagics)
+
+
+# Auto-register the magics when imported inside a running IPython session
+if "IPython" in sys.modules:
+    from .magics import register_magics as _register_magics
+    _register_magics()
@@ -0,0 +1,353 @@
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Generator, List, Dict, Optional, Tuple, Union
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from . import auth
+from .client import (
+    KaggleClient,
+    _format_dataset_results,
+    _format_file_listing,
+    _list_files_steps,
+    _obscured_listing,
+    _search_params,
+)
+from .errors import KaggleEaseError, NetworkError
+from .listing import _listing_steps
+from .load import (
+    _cache_first_listing,
+    _download,
+    _pop_load_options,
+    _pop_read_options,
+    _read_download,
+    _read_local,
+    _selected_size,
+    _selection,
+)
+from .planner import precheck, resolve_mode
+from .session import get_session
+
+logger = logging.getLogger(__name__)
+
+# Dedicated pools so async callers never compete for the loop's default executor
+IO_WORKERS = 16
+PARSE_WORKERS = 4
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(kind: str) -> ThreadPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(kind)
+        if executor is None:
+            workers = IO_WORKERS if kind == "io" else PARSE_WORKERS
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"kaggleease-{kind}")
+            _executors[kind] = executor
+        return executor
+
+
+async def _run(kind: str, func, *args, executor: Optional[Executor] = None, **kwargs):
+    """Runs a blocking callable on one of the KaggleEase pools (or a given executor)."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(executor or _get_executor(kind), call)
+
+
+class AsyncKaggleClient:
+    """
+    Coroutine counterpart of KaggleClient with the same return shapes and
+    error types. Use as an async context manager to close the HTTP client.
+
+    Requests go through httpx.AsyncClient when httpx is installed
+    (`pip install kaggleease[async]`); otherwise they run on the shared pooled
+    session in a dedicated I/O thread pool instead of the loop's default executor.
+    """
+    BASE_URL = KaggleClient.BASE_URL
+
+    def __init__(self, http_client=None):
+        self.auth = None
+        self._http = http_client
+        self._owns_http = http_client is None
+
+    async def __aenter__(self) -> "AsyncKaggleClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+            self._http = None
+
+    def _ensure_auth(self) -> None:
+        # Reading kaggle.json is a few microseconds of local I/O; done inline.
+        if not self.auth:
+            import kaggleease.client
+            sync = kaggleease.client.KaggleClient()
+            sync._ensure_auth()
+            self.auth = sync.auth
+
+    async def _get(self, url: str, params: Optional[Dict] = None):
+        """GET returning a response with .status_code/.json()/.text (httpx or requests)."""
+        self._ensure_auth()
+        if httpx is None:
+            return await _run("io", get_session().get, url, auth=self.auth, params=params, timeout=30)
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(max_connections=IO_WORKERS, max_keepalive_connections=IO_WORKERS),
+                transport=httpx.AsyncHTTPTransport(retries=3),
+            )
+        try:
+            return await self._http.get(url, params=params, auth=self.auth)
+        except httpx.TransportError as e:
+            raise NetworkError(f"Network error while contacting Kaggle: {e}") from e
+
+    async def search_datasets(self, query: str, top: int = 5) -> List[Dict]:
+        """
+        Search for datasets using the Kaggle REST API.
+        """
+        try:
+            response = await self._get(f"{self.BASE_URL}/datasets/list", params=_search_params(query, top))
+            if response.status_code != 200:
+                logger.error(f"Search failed with status {response.status_code}: {response.text}")
+                return []
+            return _format_dataset_results(response.json())
+        except Exception as e:
+            logger.debug(f"Kaggle REST search error: {e}")
+            return []
+
+    async def dataset_version(self, dataset_handle: str) -> Optional[int]:
+        """Returns the current version number of a dataset, or None."""
+        handle = dataset_handle.strip().strip('/')
+        if '/' not in handle:
+            return None
+        try:
+            owner, slug = handle.split('/', 1)
+            response = await self._get(f"{self.BASE_URL}/datasets/view/{owner}/{slug}")
+            if response.status_code != 200:
+                return None
+            version = response.json().get("currentVersionNumber")
+            return int(version) if version is not None else None
+        except Exception as e:
+            logger.debug(f"Kaggle REST version lookup error: {e}")
+            return None
+
+    async def _probe_dataset(self, handle: str, version: Optional[int] = None) -> Optional[List[Dict]]:
+        if '/' not in handle:
+            return None
+        owner, slug = handle.split('/', 1)
+        params = {"datasetVersionNumber": version} if version is not None else None
+        response = await self._get(f"{self.BASE_URL}/datasets/list/files/{owner}/{slug}", params=params)
+        return _format_file_listing(response.json(), "dataset") if response.status_code == 200 else None
+
+    async def _probe_competition(self, handle: str) -> Optional[List[Dict]]:
+        slug = handle.split('/')[-1]
+        response = await self._get(f"{self.BASE_URL}/competitions/storage/list/files/{slug}")
+        return _format_file_listing(response.json(), "competition") if response.status_code == 200 else None
+
+    async def _probe_search(self, handle: str) -> Optional[List[Dict]]:
+        return _obscured_listing(handle, await self.search_datasets(handle, top=1))
+
+    async def _probe(self, endpoint: str, handle: str) -> Optional[List[Dict]]:
+        return await getattr(self, f"_probe_{endpoint}")(handle)
+
+    async def list_files(self, dataset_handle: str, parallel: Optional[bool] = None,
+                         version: Optional[int] = None) -> List[Dict]:
+        """
+        List files in a dataset or competition. Detects resource type.
+
+        Same resolution order, endpoint memo, parallel mode and `version` as
+        KaggleClient.list_files(); in parallel mode losing probes are
+        cancelled outright.
+        """
+        self._ensure_auth()
+        if parallel is None:
+            parallel = KaggleClient.PARALLEL_PROBE
+
+        async def call(method, *args):
+            return await getattr(self, method)(*args)
+
+        return await _adrive(_list_files_steps(dataset_handle.strip().strip('/'), parallel, version), call)
+
+    async def _probe_parallel(self, handle: str, candidates: List[str]) -> Tuple[Optional[str], Optional[List[Dict]], Optional[Exception]]:
+        tasks = [asyncio.ensure_future(self._probe(endpoint, handle)) for endpoint in candidates]
+        first_error = None
+        try:
+            for endpoint, task in zip(candidates, tasks):
+                try:
+                    files = await task
+                except Exception as e:
+                    first_error = first_error or e
+                    continue
+                if files is not None:
+                    return endpoint, files, None
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None, None, first_error
+
+
+def _advance(steps: Generator, reply, error: Optional[Exception]) -> Tuple[bool, object]:
+    """One step of a step generator: (True, value) once it returns, else (False, request)."""
+    try:
+        return False, (steps.throw(error) if error is not None else steps.send(reply))
+    except StopIteration as done:
+        return True, done.value
+
+
+async def _adrive(steps: Generator, perform: Callable, offload: bool = False):
+    """
+    listing._drive() for a coroutine `perform`. With `offload` the generator's
+    own work between requests (cache reads and writes on disk) runs on the
+    I/O pool instead of the event loop.
+    """
+    reply, error = None, None
+    while True:
+        if offload:
+            done, value = await _run("io", _advance, steps, reply, error)
+        else:
+            done, value = _advance(steps, reply, error)
+        if done:
+            return value
+        reply, error = None, None
+        try:
+            reply = await perform(*value)
+        except Exception as e:
+            error = e
+
+
+async def _aget_dataset_files(client: AsyncKaggleClient, dataset_handle: str,
+                              version: Optional[int] = None) -> Tuple[List, int, str, str]:
+    """Async load._get_dataset_files(): the same listing steps over the async client."""
+
+    async def perform(request, *args):
+        if request == "search":
+            # search() answers from the search cache and the local catalog, as in the sync path
+            from .search import search
+            query, top = args
+            return await _run("io", search, query, top=top)
+        if request == "list_files":
+            handle, pinned = args
+            return await (client.list_files(handle, version=pinned) if pinned is not None else client.list_files(handle))
+        return await client.dataset_version(*args)
+
+    return await _adrive(_listing_steps(dataset_handle, version), perform, offload=True)
+
+
+async def asearch(query: str, top: int = 5, timeout: int = 30, _client: Optional[AsyncKaggleClient] = None) -> List[Dict[str, Union[str, int]]]:
+    """
+    Coroutine version of kaggleease.search(). Returns the same list of
+    dicts and, like search(), an empty list on failure.
+    """
+    from .search import _format_size
+
+    client = _client or AsyncKaggleClient()
+    try:
+        results = await client.search_datasets(query, top=top)
+        if not results:
+            logger.warning(f"No datasets found for query: '{query}'")
+            return []
+        return [
+            {
+                "handle": d["handle"],
+                "title": d["title"],
+                "size": _format_size(d["size"]),
+                "votes": d["votes"],
+            }
+            for d in results
+        ]
+    except Exception as e:
+        logger.error(f"An error occurred during the search operation: {e}")
+        return []
+    finally:
+        if _client is None:
+            await client.aclose()
+
+
+async def aload(
+    dataset_handle: str,
+    file: Optional[str] = None,
+    timeout: int = 300,
+    executor: Optional[Executor] = None,
+    **kwargs,
+):
+    """
+    Coroutine version of kaggleease.load().
+
+    Metadata is resolved without blocking the event loop (its cache and
+    suggestion lookups run on the KaggleEase I/O pool), the kagglehub
+    download runs on the I/O pool and parsing runs on the parse pool (or on
+    `executor`, e.g. a ProcessPoolExecutor). Raises the same
+    kaggleease.errors types as load().
+
+    Args:
+        dataset_handle (str): The Kaggle dataset handle (e.g., 'owner/slug') or slug.
+        file (str, optional): Specific filename to load.
+        timeout (int): Max time in seconds for the whole operation.
+        executor (Executor, optional): Where to run file parsing.
+        **kwargs: The other load() options (version, cache_first, files, columns,
+                  filters, engine="arrow"...), or arguments for the underlying pandas
+                  read function. stream=True needs a thread `executor`.
+
+    Example:
+        >>> df = await aload("titanic")
+    """
+    load_options = _pop_load_options(kwargs)
+    options = _pop_read_options(kwargs)
+    version = load_options.pop("version")
+    cache_first = load_options.pop("cache_first")
+    revalidate = load_options.pop("revalidate")
+    download_all = load_options.pop("download_all")
+    files = load_options["files"]
+    streaming = kwargs.get("stream") or resolve_mode(options.get("memory_plan")) == "stream"
+    if streaming and isinstance(executor, ProcessPoolExecutor):
+        raise ValueError(
+            "stream=True (or memory_plan='stream') returns a chunk iterator, which cannot be sent back "
+            "from a process pool; use a thread executor."
+        )
+
+    def parse(full_selected_path: str, **read_kwargs):
+        # Called on the I/O pool by _read_download; the parsing itself runs on the parse pool
+        return (executor or _get_executor("parse")).submit(_read_local, full_selected_path, **read_kwargs).result()
+
+    async def _aload():
+        path = None
+        local = await _run("io", _cache_first_listing, dataset_handle, version, file, cache_first, revalidate)
+        if local is not None:
+            path, listing, res_type, resolved_handle = local
+        else:
+            await _run("io", auth.setup_auth)
+            async with AsyncKaggleClient() as client:
+                listing, total_size, res_type, resolved_handle = await _aget_dataset_files(client, dataset_handle, version)
+            if not kwargs.get("stream"):
+                precheck(_selected_size(listing, total_size, files), options.get("memory_plan"))
+        selected_file, is_obscured, needed = _selection(listing, res_type, dataset_handle, file, files, download_all)
+
+        try:
+            if path is None:
+                path = await _run("io", _download, resolved_handle, res_type, version=version, files=needed)
+            return await _run("io", _read_download, path, dataset_handle, file, selected_file, is_obscured,
+                              read_local=parse, **load_options, **options, **kwargs)
+        except KaggleEaseError:
+            raise
+        except Exception as e:
+            if path is None:
+                raise KaggleEaseError(f"An error occurred while loading: {e}") from e
+            logger.error(f"Load failed: {e}. Returning path as fallback.")
+            return path
+
+    try:
+        return await asyncio.wait_for(_aload(), timeout=timeout)
+    except asyncio.TimeoutError as e:
+        raise NetworkError(f"Loading '{dataset_handle}' did not finish within {timeout}s.") from e
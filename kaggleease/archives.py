@@ -0,0 +1,255 @@
+import io
+import os
+import bz2
+import gzip
+import shutil
+import struct
+import logging
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from .errors import DataFormatError, UnsupportedFormatError
+
+logger = logging.getLogger(__name__)
+
+# Single-stream compression, read through a decompressing file object
+COMPRESSION_EXTS = ('.gz', '.bz2', '.zst')
+# Multi-member archives; a member is addressed as '<archive>/<member path>'
+ARCHIVE_EXTS = ('.zip', '.7z')
+# Inflated size estimate when the container does not record it
+ASSUMED_RATIO = 4
+# Deflate cannot compress better than this, which bounds a gzip file's inflated size
+MAX_DEFLATE_RATIO = 1032
+COPY_CHUNK_SIZE = 1024**2
+
+
+def split_archive_path(path: str) -> Tuple[str, Optional[str]]:
+    """
+    Splits 'data/archive.zip/train/a.csv' into ('data/archive.zip', 'train/a.csv').
+    Paths without an archive component come back as (path, None). Directories
+    that merely end in .zip (an extracted copy) are not treated as archives.
+    """
+    parts = path.replace(os.sep, "/").split("/")
+    for i, part in enumerate(parts[:-1]):
+        if part.lower().endswith(ARCHIVE_EXTS):
+            archive = os.sep.join(parts[:i + 1])
+            if not os.path.isdir(archive):
+                return archive, "/".join(parts[i + 1:])
+    return path, None
+
+
+def _strip_compression(name: str) -> str:
+    lower = name.lower()
+    for ext in COMPRESSION_EXTS + ARCHIVE_EXTS:
+        if lower.endswith(ext):
+            return name[:-len(ext)]
+    return name
+
+
+def format_name(path: str) -> str:
+    """
+    The lowercased name whose extension says how to parse `path`: the member
+    of an archive path, without a compression suffix ('train.csv.gz' and
+    'train.csv.zip' -> 'train.csv').
+    """
+    archive, member = split_archive_path(path)
+    return _strip_compression(member if member is not None else path).lower()
+
+
+def is_packed(path: str) -> bool:
+    """True when `path` is a compressed file or an archive member."""
+    archive, member = split_archive_path(path)
+    return member is not None or archive.lower().endswith(COMPRESSION_EXTS + ARCHIVE_EXTS)
+
+
+def _require_py7zr():
+    try:
+        import py7zr
+    except ImportError as e:
+        raise UnsupportedFormatError(
+            "Reading .7z archives requires the py7zr package.",
+            fix_suggestion="pip install py7zr  (or: pip install kaggleease[archives])"
+        ) from e
+    return py7zr
+
+
+def _open_zstd(path: str) -> BinaryIO:
+    try:
+        from compression import zstd  # Python 3.14+
+        return zstd.open(path, "rb")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as e:
+        raise UnsupportedFormatError(
+            f"Reading '{os.path.basename(path)}' requires the zstandard package.",
+            fix_suggestion="pip install zstandard  (or: pip install kaggleease[archives])"
+        ) from e
+    return zstandard.open(path, "rb")
+
+
+def list_members(archive: str) -> List[str]:
+    """File members of a .zip or .7z archive ('/'-separated), read from its index only."""
+    if archive.lower().endswith(".zip"):
+        with zipfile.ZipFile(archive) as zf:
+            return [n for n in zf.namelist() if not n.endswith("/")]
+    try:
+        py7zr = _require_py7zr()
+    except UnsupportedFormatError as e:
+        logger.debug(f"Skipping {os.path.basename(archive)}: {e.message}")
+        return []
+    with py7zr.SevenZipFile(archive) as sz:
+        return [entry.filename for entry in sz.list() if not entry.is_directory]
+
+
+def _sole_member(archive: str, names: List[str]) -> str:
+    """
+    The member to read when an archive path names no member: the one matching
+    the archive's own name ('train.csv.zip' -> 'train.csv'), else the only
+    tabular member.
+    """
+    from .readers import TABULAR_EXTS
+
+    wanted = os.path.basename(_strip_compression(archive)).lower()
+    for name in names:
+        if name.rsplit("/", 1)[-1].lower() == wanted:
+            return name
+    tabular = [n for n in names if _strip_compression(n).lower().endswith(TABULAR_EXTS)]
+    if len(tabular) == 1:
+        return tabular[0]
+    base = os.path.basename(archive)
+    raise DataFormatError(
+        f"'{base}' contains {len(tabular)} tabular files; choose one.",
+        fix_suggestion=f"Address a member as '{base}/<member>', e.g. '{base}/{tabular[0]}'." if tabular else None
+    )
+
+
+@contextmanager
+def open_packed(path: str) -> Iterator[BinaryIO]:
+    """
+    Opens a compressed file (.gz, .bz2, .zst) or an archive member
+    ('data.zip/train.csv', or a single-member 'train.csv.zip') as a binary
+    stream that decompresses as it is read, so nothing is extracted to disk.
+
+    Zip members are inflated incrementally and independently of the rest of
+    the archive. 7z members are decompressed in memory (one member at a time)
+    because py7zr cannot stream them. Plain files are opened as they are.
+
+    Raises:
+        UnsupportedFormatError: When zstandard/py7zr is needed but missing.
+        DataFormatError: When an archive path does not say which member to read.
+    """
+    archive, member = split_archive_path(path)
+    lower = archive.lower()
+    if lower.endswith(".zip"):
+        with zipfile.ZipFile(archive) as zf:
+            name = member or _sole_member(archive, [n for n in zf.namelist() if not n.endswith("/")])
+            with zf.open(name) as f:
+                yield f
+    elif lower.endswith(".7z"):
+        py7zr = _require_py7zr()
+        with py7zr.SevenZipFile(archive) as sz:
+            name = member or _sole_member(archive, [e.filename for e in sz.list() if not e.is_directory])
+            if hasattr(sz, "read"):
+                yield sz.read([name])[name]
+            else:
+                # py7zr >= 1.0 dropped read(); extract just this member
+                with tempfile.TemporaryDirectory() as tmp:
+                    sz.extract(path=tmp, targets=[name])
+                    with open(os.path.join(tmp, *name.split("/")), "rb") as f:
+                        yield f
+    elif lower.endswith(".gz"):
+        with gzip.open(archive, "rb") as f:
+            yield f
+    elif lower.endswith(".bz2"):
+        with bz2.open(archive, "rb") as f:
+            yield f
+    elif lower.endswith(".zst"):
+        with _open_zstd(archive) as f:
+            yield f
+    else:
+        with open(path, "rb") as f:
+            yield f
+
+
+def seekable(path: str):
+    """
+    `path` itself for plain files; otherwise the decompressed bytes in memory,
+    for formats that need random access (Parquet, Excel).
+    """
+    if not is_packed(path):
+        return path
+    with open_packed(path) as f:
+        return io.BytesIO(f.read())
+
+
+@contextmanager
+def as_local_file(path: str) -> Iterator[str]:
+    """
+    A real file for readers that cannot take a stream (SQLite). Packed paths
+    are decompressed to a temporary file that is removed afterwards.
+    """
+    if not is_packed(path):
+        yield path
+        return
+    fd, tmp = tempfile.mkstemp(suffix=os.path.splitext(format_name(path))[1])
+    try:
+        with os.fdopen(fd, "wb") as out, open_packed(path) as src:
+            shutil.copyfileobj(src, out, COPY_CHUNK_SIZE)
+        yield tmp
+    finally:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def uncompressed_size(path: str) -> int:
+    """
+    Bytes `path` inflates to: exact for plain files, zip and 7z members and
+    gzip files too small to inflate past 4GB (the gzip trailer only holds the
+    size modulo 2**32), otherwise estimated from the compressed size.
+    """
+    archive, member = split_archive_path(path)
+    compressed = os.path.getsize(archive)
+    lower = archive.lower()
+    try:
+        if lower.endswith(".zip"):
+            with zipfile.ZipFile(archive) as zf:
+                names = [n for n in zf.namelist() if not n.endswith("/")]
+                return zf.getinfo(member or _sole_member(archive, names)).file_size
+        if lower.endswith(".7z"):
+            py7zr = _require_py7zr()
+            with py7zr.SevenZipFile(archive) as sz:
+                entries = {e.filename: e for e in sz.list() if not e.is_directory}
+                return int(entries[member or _sole_member(archive, list(entries))].uncompressed)
+        if lower.endswith(".gz"):
+            # The trailer holds the inflated size modulo 2**32, which is only
+            # the real size when the file cannot inflate to 4GB or more
+            if compressed * MAX_DEFLATE_RATIO < 2**32:
+                with open(archive, "rb") as f:
+                    f.seek(-4, os.SEEK_END)
+                    return struct.unpack("<I", f.read(4))[0]
+        elif not lower.endswith(COMPRESSION_EXTS):
+            return compressed
+    except (KeyError, OSError, struct.error, zipfile.BadZipFile) as e:
+        logger.debug(f"Could not read the inflated size of {os.path.basename(path)}: {e}")
+    return compressed * ASSUMED_RATIO
+
+
+def archive_members(path: str) -> List[str]:
+    """
+    Member paths ('<path>/<member>') of an archive that are themselves
+    readable, so late resolution can find data that was never extracted.
+    """
+    if not path.lower().endswith(ARCHIVE_EXTS):
+        return []
+    try:
+        members = list_members(path)
+    except (OSError, zipfile.BadZipFile) as e:
+        logger.debug(f"Could not list {os.path.basename(path)}: {e}")
+        return []
+    return [os.path.join(path, *m.split("/")) for m in members]
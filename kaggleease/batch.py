@@ -0,0 +1,224 @@
+import os
+import time
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from . import auth
+from .errors import KaggleEaseError, NetworkError
+from .load import (
+    _cache_first_listing,
+    _download,
+    _get_dataset_files,
+    _pop_load_options,
+    _pop_read_options,
+    _read_download,
+    _read_local,
+    _selected_size,
+    _selection,
+)
+from .planner import precheck, resolve_mode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_DOWNLOADS = 4
+
+
+class BatchResult(dict):
+    """
+    Mapping of handle -> DataFrame, directory path, or the exception raised
+    while loading it. Per-item stage timings (seconds) are in `timings`:
+
+        {"owner/slug": {"metadata": 0.12, "download": 3.4, "parse": 0.8, "total": 4.3}}
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.timings: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        """Only the handles that failed."""
+        return {h: v for h, v in self.items() if isinstance(v, Exception)}
+
+
+def _normalize(item: Union[str, Tuple[str, Optional[str]]]) -> Tuple[str, Optional[str]]:
+    if isinstance(item, str):
+        return item, None
+    handle, file = item
+    return handle, file
+
+
+def _timed_out(handle: str, timeout: int) -> NetworkError:
+    return NetworkError(f"Loading '{handle}' did not finish within {timeout}s.")
+
+
+def load_many(
+    handles: Iterable[Union[str, Tuple[str, Optional[str]]]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_downloads: int = DEFAULT_MAX_DOWNLOADS,
+    parse_workers: Optional[int] = None,
+    parse_executor: str = "process",
+    return_exceptions: bool = False,
+    timeout: int = 300,
+    **kwargs,
+) -> BatchResult:
+    """
+    Loads many datasets concurrently.
+
+    Metadata resolution runs on `max_workers` threads, at most `max_downloads`
+    kagglehub downloads run at the same time, and parsing happens on a pool
+    of `parse_workers` processes so large CSVs are decoded on all cores.
+
+    Results are keyed by handle: an item given twice is loaded once, and the
+    same handle with different files is rejected. As in load(), a file that
+    cannot be parsed yields the download path instead of an error.
+
+    Args:
+        handles: Dataset handles, or (handle, file) tuples to pick a specific file.
+        max_workers (int): Concurrent metadata/download pipelines.
+        max_downloads (int): Concurrent downloads (bounds bandwidth use).
+        parse_workers (int, optional): Parser pool size. Defaults to the CPU count.
+        parse_executor (str): "process" (default) or "thread". Chunk iterators
+            (stream=True, memory_plan="stream") cannot be sent back from a
+            process, so those need "thread".
+        return_exceptions (bool): Store failures in the result instead of raising
+            the first one.
+        timeout (int): Seconds each item may take from metadata to parsed result.
+            It is checked between stages (a running download is not interrupted)
+            and bounds the wait for the parser; an item over it fails with NetworkError.
+        **kwargs: The other load() options (version, cache_first, files, columns,
+                  filters, engine="arrow"...) or arguments for the underlying pandas
+                  read function, applied to every item.
+
+    Returns:
+        BatchResult: handle -> DataFrame/path/exception, with per-item `timings`.
+
+    Raises:
+        KaggleEaseError: The first failure, unless return_exceptions is True.
+        ValueError: If a handle is given with different files, or options conflict.
+
+    Example:
+        >>> res = load_many(["titanic", ("owner/data", "train.csv")], max_workers=4)
+        >>> res.timings["titanic"]["download"]
+    """
+    load_options = _pop_load_options(kwargs)
+    load_options["parse_workers"] = parse_workers
+    options = _pop_read_options(kwargs)
+    version = load_options.pop("version")
+    cache_first = load_options.pop("cache_first")
+    revalidate = load_options.pop("revalidate")
+    download_all = load_options.pop("download_all")
+    files = load_options["files"]
+    streaming = kwargs.get("stream") or resolve_mode(options.get("memory_plan")) == "stream"
+    if parse_executor == "process" and streaming:
+        raise ValueError(
+            "stream=True (or memory_plan='stream') returns chunk iterators, which cannot be sent back "
+            "from a process pool; use parse_executor='thread'."
+        )
+
+    items = list(dict.fromkeys(_normalize(item) for item in handles))
+    repeated = sorted(h for h, n in Counter(h for h, _ in items).items() if n > 1)
+    if repeated:
+        raise ValueError(
+            f"load_many() keys results by handle, but {repeated} are given with different files; "
+            "load those files with separate calls."
+        )
+    result = BatchResult()
+    if not items:
+        return result
+
+    auth.setup_auth()
+    download_slots = threading.BoundedSemaphore(max(1, max_downloads))
+    parse_workers = parse_workers or os.cpu_count() or 1
+    if parse_executor == "process":
+        parser = ProcessPoolExecutor(max_workers=parse_workers)
+    elif parse_executor == "thread":
+        parser = ThreadPoolExecutor(max_workers=parse_workers, thread_name_prefix="kaggleease-parse")
+    else:
+        raise ValueError(f"parse_executor must be 'process' or 'thread', got {parse_executor!r}")
+
+    def _run_one(handle: str, file: Optional[str]):
+        timings = result.timings.setdefault(handle, {})
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        def check_deadline():
+            if time.perf_counter() > deadline:
+                raise _timed_out(handle, timeout)
+
+        path = None
+        local = _cache_first_listing(handle, version, file, cache_first, revalidate)
+        if local is not None:
+            path, listing, res_type, resolved_handle = local
+        else:
+            auth.setup_auth()
+            listing, total_size, res_type, resolved_handle = _get_dataset_files(handle, timeout=timeout, version=version)
+            if not kwargs.get("stream"):
+                precheck(_selected_size(listing, total_size, files), options.get("memory_plan"))
+        selected_file, is_obscured, needed = _selection(listing, res_type, handle, file, files, download_all)
+        timings["metadata"] = time.perf_counter() - start
+        check_deadline()
+
+        mark = time.perf_counter()
+        if path is None:
+            with download_slots:
+                path = _download(resolved_handle, res_type, version=version, files=needed)
+        timings["download"] = time.perf_counter() - mark
+        check_deadline()
+
+        def parse(full_selected_path: str, **read_kwargs):
+            future = parser.submit(_read_local, full_selected_path, **read_kwargs)
+            try:
+                return future.result(timeout=max(0.0, deadline - time.perf_counter()))
+            except FuturesTimeoutError as e:
+                future.cancel()
+                raise _timed_out(handle, timeout) from e
+
+        mark = time.perf_counter()
+        try:
+            value = _read_download(path, handle, file, selected_file, is_obscured, read_local=parse,
+                                   **load_options, **options, **kwargs)
+        except KaggleEaseError:
+            raise
+        except Exception as e:
+            # Same fallback as load(): the download is kept and its path returned
+            logger.error(f"load_many: could not read '{handle}': {e}. Returning path as fallback.")
+            value = path
+        timings["parse"] = time.perf_counter() - mark
+        timings["total"] = time.perf_counter() - start
+        return value
+
+    values = {}
+    first_error = None
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="kaggleease-batch") as pool:
+            futures = {pool.submit(_run_one, handle, file): handle for handle, file in items}
+            for future in as_completed(futures):
+                handle = futures[future]
+                try:
+                    values[handle] = future.result()
+                except Exception as e:
+                    logger.error(f"load_many: '{handle}' failed: {e}")
+                    values[handle] = e
+                    if not return_exceptions and first_error is None:
+                        first_error = e
+                        for other in futures:
+                            other.cancel()
+    finally:
+        parser.shutdown(wait=False, cancel_futures=True)
+
+    # Keep the caller's order
+    for handle, _ in items:
+        if handle in values:
+            result[handle] = values[handle]
+
+    if first_error is not None:
+        if isinstance(first_error, KaggleEaseError):
+            raise first_error
+        raise KaggleEaseError(f"An error occurred while loading: {first_error}") from first_error
+    return result
@@ -1,10 +1,138 @@
-from typing import Optional
-import kagglehub
+import os
+from typing import List, Optional, Tuple
 from pathlib import Path
 import logging
 import time
 from functools import wraps
 
+# Environment overrides for KaggleEase's own (non-kagglehub) cache state
+CACHE_DIR_ENV = "KAGGLEEASE_CACHE_DIR"
+OFFLINE_ENV = "KAGGLEEASE_OFFLINE"
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory where KaggleEase keeps its own cache files
+    (metadata, indexes, derived artifacts), creating it if needed.
+
+    Defaults to ~/.cache/kaggleease and can be overridden with the
+    KAGGLEEASE_CACHE_DIR environment variable.
+    """
+    path = Path(os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "kaggleease").expanduser()
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def is_offline() -> bool:
+    """Returns True when KAGGLEEASE_OFFLINE is set to a truthy value."""
+    return os.environ.get(OFFLINE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_kagglehub_cache_dir() -> Path:
+    """Returns kagglehub's download cache root (KAGGLEHUB_CACHE or ~/.cache/kagglehub)."""
+    return Path(os.environ.get("KAGGLEHUB_CACHE") or Path.home() / ".cache" / "kagglehub").expanduser()
+
+
+def _cached_dataset_versions(owner: str, slug: str) -> List[int]:
+    """Versions of a dataset fully downloaded by kagglehub, newest first."""
+    base = get_kagglehub_cache_dir() / "datasets" / owner / slug
+    versions = []
+    if (base / "versions").is_dir():
+        for entry in (base / "versions").iterdir():
+            if entry.name.isdigit() and (base / f"{entry.name}.complete").exists():
+                versions.append(int(entry.name))
+    return sorted(versions, reverse=True)
+
+
+def find_cached_download(
+    dataset_handle: str,
+    version: Optional[int] = None,
+    file_path: Optional[str] = None,
+) -> Optional[Tuple[Path, str, Optional[int]]]:
+    """
+    Locates a completed kagglehub download on disk without any network call.
+
+    Args:
+        dataset_handle (str): 'owner/slug' for datasets, or a competition slug.
+        version (int, optional): Dataset version to require. Defaults to the
+            newest complete version.
+        file_path (str, optional): Also accept a version for which only this
+            file was downloaded. Without it, a version with any single-file
+            download is accepted; the caller picks the file from what is on disk.
+
+    Returns:
+        Tuple[Path, str, Optional[int]]: (directory, resource_type, version), or
+        None if nothing usable is cached.
+    """
+    root = get_kagglehub_cache_dir()
+    handle = dataset_handle.strip().strip('/')
+
+    if '/' in handle:
+        owner, slug = handle.split('/', 1)
+        base = root / "datasets" / owner / slug
+        candidates = [version] if version is not None else _cached_dataset_versions(owner, slug)
+        for v in candidates:
+            path = base / "versions" / str(v)
+            if (base / f"{v}.complete").exists() and path.is_dir():
+                return path, "dataset", v
+            if _file_marked(base / ".complete" / str(v), file_path):
+                return path, "dataset", v
+        if version is None and (base / ".complete").is_dir():
+            markers = sorted(
+                (int(d.name) for d in (base / ".complete").iterdir() if d.name.isdigit()), reverse=True
+            )
+            for v in markers:
+                if _file_marked(base / ".complete" / str(v), file_path):
+                    return base / "versions" / str(v), "dataset", v
+        return None
+
+    comp = root / "competitions" / handle
+    if comp.is_dir() and (root / "competitions" / f"{handle}.complete").exists():
+        return comp, "competition", None
+    if comp.is_dir() and _file_marked(root / "competitions" / ".complete" / handle, file_path):
+        return comp, "competition", None
+    return None
+
+def _file_marked(marker_dir: Path, file_path: Optional[str]) -> bool:
+    """
+    Whether `file_path` was downloaded on its own (per-file marker under
+    marker_dir); without a file_path, whether any file was.
+    """
+    if file_path:
+        return (marker_dir / f"{file_path}.complete").exists()
+    return marker_dir.is_dir() and next(marker_dir.rglob("*.complete"), None) is not None
+
+def kagglehub_file_target(
+    resolved_handle: str,
+    resource_type: str,
+    file_path: str,
+    version: Optional[int] = None,
+) -> Tuple[Path, Path]:
+    """
+    Where kagglehub keeps a single downloaded file, and its completion marker,
+    so files fetched by KaggleEase are found by kagglehub and by
+    find_cached_download().
+
+    Returns:
+        Tuple[Path, Path]: (file path, marker path).
+    """
+    root = get_kagglehub_cache_dir()
+    file_path = file_path.strip('/')
+    if resource_type == "competition":
+        slug = resolved_handle.strip('/').split('/')[-1]
+        return (
+            root / "competitions" / slug / file_path,
+            root / "competitions" / ".complete" / slug / f"{file_path}.complete",
+        )
+    if version is None:
+        raise ValueError("A dataset version is required to place a single file in the kagglehub cache.")
+    owner, slug = resolved_handle.strip('/').split('/', 1)
+    base = root / "datasets" / owner / slug
+    return (
+        base / "versions" / str(version) / file_path,
+        base / ".complete" / str(version) / f"{file_path}.complete",
+    )
+
 def _retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
     """Decorator to implement retry logic with exponential backoff."""
     def decorator(func):
@@ -56,6 +184,7 @@ def get_dataset_path(dataset_handle: str, file_path: Optional[str] = None, timeo
         logger.debug(f"Checking cache for '{full_handle}'...")
         # The path argument to dataset_download can be a file within the bundle
         # Note: kagglehub may not directly support timeout, but we document it here
+        import kagglehub
         download_path = kagglehub.dataset_download(dataset_handle, path=file_path)
 
         logger.info(f"Dataset files are available at: {download_path}")
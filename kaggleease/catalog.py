@@ -0,0 +1,331 @@
+import os
+import math
+import re
+import time
+import sqlite3
+import logging
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DB_NAME = "catalog.sqlite"
+PREFER_ENV = "KAGGLEEASE_CATALOG_PREFER"
+# How much a dataset's popularity counts against text relevance when ranking
+VOTE_WEIGHT = 0.5
+# Full-text candidates re-ranked per requested result
+CANDIDATE_FACTOR = 20
+SORTS = ("relevance", "votes", "size")
+
+SyncResult = namedtuple("SyncResult", ["seen", "added", "updated"])
+SyncResult.__doc__ = "Datasets returned by Kaggle during a catalog sync, and how many were new or changed."
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS datasets (
+        id INTEGER PRIMARY KEY,
+        handle TEXT NOT NULL UNIQUE,
+        title TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        votes INTEGER NOT NULL,
+        synced_at REAL NOT NULL
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT)",
+]
+
+# External-content FTS5 index over datasets, kept in step by triggers
+_FTS_SCHEMA = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS datasets_fts USING fts5(handle, title, content='datasets', content_rowid='id')",
+    """
+    CREATE TRIGGER IF NOT EXISTS datasets_ai AFTER INSERT ON datasets BEGIN
+        INSERT INTO datasets_fts(rowid, handle, title) VALUES (new.id, new.handle, new.title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS datasets_ad AFTER DELETE ON datasets BEGIN
+        INSERT INTO datasets_fts(datasets_fts, rowid, handle, title) VALUES ('delete', old.id, old.handle, old.title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS datasets_au AFTER UPDATE OF handle, title ON datasets BEGIN
+        INSERT INTO datasets_fts(datasets_fts, rowid, handle, title) VALUES ('delete', old.id, old.handle, old.title);
+        INSERT INTO datasets_fts(rowid, handle, title) VALUES (new.id, new.handle, new.title);
+    END
+    """,
+]
+
+_config = {"prefer": None}
+_config_lock = threading.Lock()
+
+
+def configure_catalog(prefer: Optional[bool] = None) -> None:
+    """
+    Configures how search() uses the local catalog (see sync_catalog()).
+
+    The catalog always answers searches offline and when Kaggle's API fails.
+
+    Args:
+        prefer (bool, optional): Answer searches from the catalog whenever it
+            has matches, without any network call. Defaults to
+            KAGGLEEASE_CATALOG_PREFER (off).
+    """
+    with _config_lock:
+        if prefer is not None:
+            _config["prefer"] = bool(prefer)
+
+
+def prefer_catalog() -> bool:
+    """Returns True if searches should be answered locally when possible."""
+    if _config["prefer"] is not None:
+        return _config["prefer"]
+    return os.environ.get(PREFER_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class Catalog:
+    """
+    On-disk index of Kaggle dataset metadata (handle, title, size, votes)
+    with an FTS5 full-text index over handles and titles. Falls back to
+    substring matching where SQLite lacks FTS5. Every operation opens its
+    own connection, so it is safe to share between threads and processes.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else get_cache_dir() / DB_NAME
+        self._initialized = False
+        self.fts = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            try:
+                for statement in _FTS_SCHEMA:
+                    conn.execute(statement)
+                self.fts = True
+            except sqlite3.OperationalError as e:
+                logger.debug(f"FTS5 unavailable ({e}); catalog search uses substring matching.")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def upsert(self, datasets: List[Dict]) -> SyncResult:
+        """Adds or updates datasets (handle/title/size/votes dicts) in one transaction."""
+        added = updated = 0
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                for d in datasets:
+                    row = (d.get("title") or d["handle"], int(d.get("size") or 0), int(d.get("votes") or 0))
+                    old = conn.execute(
+                        "SELECT title, size, votes FROM datasets WHERE handle = ?", (d["handle"],)
+                    ).fetchone()
+                    if old is None:
+                        conn.execute(
+                            "INSERT INTO datasets (handle, title, size, votes, synced_at) VALUES (?, ?, ?, ?, ?)",
+                            (d["handle"],) + row + (now,),
+                        )
+                        added += 1
+                    elif tuple(old) != row:
+                        conn.execute(
+                            "UPDATE datasets SET title = ?, size = ?, votes = ?, synced_at = ? WHERE handle = ?",
+                            row + (now, d["handle"]),
+                        )
+                        updated += 1
+                    else:
+                        conn.execute("UPDATE datasets SET synced_at = ? WHERE handle = ?", (now, d["handle"]))
+        finally:
+            conn.close()
+        return SyncResult(len(datasets), added, updated)
+
+    def search(self, query: str, top: int = 5, sort_by: str = "relevance") -> List[Dict]:
+        """
+        Datasets matching every word of `query` (as a prefix) in their handle
+        or title. "relevance" blends full-text rank with votes; "votes" and
+        "size" sort the matches by those alone. An empty query lists the
+        catalog by votes.
+        """
+        if sort_by not in SORTS:
+            raise ValueError(f"sort_by must be one of {SORTS}, got {sort_by!r}")
+        words = re.findall(r"\w+", query.lower())
+        conn = self._connect()
+        try:
+            if not words:
+                rows = conn.execute(
+                    "SELECT handle, title, size, votes, 0 FROM datasets ORDER BY votes DESC LIMIT ?", (top,)
+                ).fetchall()
+            elif self.fts:
+                match = " ".join('"{}"*'.format(w.replace('"', '""')) for w in words)
+                rows = conn.execute(
+                    "SELECT d.handle, d.title, d.size, d.votes, bm25(datasets_fts) FROM datasets_fts "
+                    "JOIN datasets d ON d.id = datasets_fts.rowid WHERE datasets_fts MATCH ? "
+                    "ORDER BY bm25(datasets_fts) LIMIT ?",
+                    (match, top * CANDIDATE_FACTOR),
+                ).fetchall()
+            else:
+                clause = " AND ".join("(lower(handle) LIKE ? OR lower(title) LIKE ?)" for _ in words)
+                params = [p for w in words for p in (f"%{w}%", f"%{w}%")]
+                rows = conn.execute(
+                    f"SELECT handle, title, size, votes, 0 FROM datasets WHERE {clause} ORDER BY votes DESC LIMIT ?",
+                    params + [top * CANDIDATE_FACTOR],
+                ).fetchall()
+        finally:
+            conn.close()
+
+        if sort_by == "votes":
+            rows.sort(key=lambda r: r[3], reverse=True)
+        elif sort_by == "size":
+            rows.sort(key=lambda r: r[2], reverse=True)
+        else:
+            # bm25() is negative, lower is better
+            rows.sort(key=lambda r: r[4] - VOTE_WEIGHT * math.log1p(r[3]))
+        return [{"handle": h, "title": t, "size": s, "votes": v} for h, t, s, v, _ in rows[:top]]
+
+    def candidates(self, query: str, limit: int = 500) -> List[Tuple[str, int]]:
+        """
+        (handle, votes) of datasets sharing a word prefix with `query`, most
+        voted first: a cheap pre-filter for fuzzy matching against the catalog.
+        """
+        prefixes = sorted({w[:3] for w in re.findall(r"[a-z0-9]+", query.lower()) if len(w) >= 3})
+        if not prefixes:
+            return []
+        conn = self._connect()
+        try:
+            if self.fts:
+                rows = conn.execute(
+                    "SELECT d.handle, d.votes FROM datasets_fts JOIN datasets d ON d.id = datasets_fts.rowid "
+                    "WHERE datasets_fts MATCH ? ORDER BY d.votes DESC LIMIT ?",
+                    (" OR ".join(f'"{p}"*' for p in prefixes), limit),
+                ).fetchall()
+            else:
+                clause = " OR ".join("lower(handle) LIKE ?" for _ in prefixes)
+                rows = conn.execute(
+                    f"SELECT handle, votes FROM datasets WHERE {clause} ORDER BY votes DESC LIMIT ?",
+                    [f"%{p}%" for p in prefixes] + [limit],
+                ).fetchall()
+        finally:
+            conn.close()
+        return [tuple(r) for r in rows]
+
+    def info(self) -> Dict:
+        """Number of datasets indexed and when the catalog was last synced."""
+        conn = self._connect()
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM datasets").fetchone()[0]
+            row = conn.execute("SELECT value FROM sync_state WHERE key = 'last_sync'").fetchone()
+        finally:
+            conn.close()
+        return {"path": str(self.path), "datasets": count, "last_sync": float(row[0]) if row else None, "fts5": self.fts}
+
+    def mark_synced(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO sync_state VALUES ('last_sync', ?)", (str(time.time()),))
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM datasets")
+                conn.execute("DELETE FROM sync_state")
+        finally:
+            conn.close()
+
+
+_catalogs: Dict[Path, Catalog] = {}
+
+
+def get_catalog() -> Catalog:
+    """Returns the Catalog bound to the current cache directory."""
+    path = get_cache_dir() / DB_NAME
+    catalog = _catalogs.get(path)
+    if catalog is None:
+        catalog = _catalogs.setdefault(path, Catalog(path))
+    return catalog
+
+
+def sync_catalog(
+    query: str = "",
+    filters: Optional[Dict] = None,
+    max_results: Optional[int] = None,
+    full: bool = False,
+    page_size: int = 100,
+) -> SyncResult:
+    """
+    Crawls Kaggle's dataset listing into the local catalog.
+
+    By default the sync is incremental: datasets are read most recently
+    updated first, and the crawl stops after a full page of datasets the
+    catalog already has unchanged. Writes happen a page at a time, so large
+    crawls run in bounded memory.
+
+    Args:
+        query (str): Only index datasets matching this search ("" for all).
+        filters (dict, optional): Search filters, as for iter_search().
+        max_results (int, optional): Stop after this many datasets.
+        full (bool): Crawl everything instead of stopping at known datasets.
+        page_size (int): Datasets per API request and per write.
+
+    Returns:
+        SyncResult: How many datasets were seen, added and updated.
+
+    Raises:
+        NetworkError: If Kaggle cannot be reached.
+    """
+    from .search import iter_search
+
+    filters = dict(filters or {})
+    if not full:
+        filters.setdefault("sort_by", "updated")
+    catalog = get_catalog()
+    seen = added = updated = 0
+    batch: List[Dict] = []
+
+    def flush() -> int:
+        nonlocal seen, added, updated
+        result = catalog.upsert(batch)
+        seen += result.seen
+        added += result.added
+        updated += result.updated
+        batch.clear()
+        return result.added + result.updated
+
+    results = iter_search(query, filters=filters, max_results=max_results, page_size=page_size)
+    try:
+        for dataset in results:
+            batch.append(dataset)
+            if len(batch) < page_size:
+                continue
+            if not flush() and not full:
+                logger.info("Catalog is up to date; stopping the sync early.")
+                break
+    finally:
+        results.close()
+    if batch:
+        flush()
+    catalog.mark_synced()
+    logger.info(f"Catalog sync: {seen} datasets seen, {added} added, {updated} updated.")
+    return SyncResult(seen, added, updated)
+
+
+def catalog_search(query: str, top: int = 5, sort_by: str = "relevance") -> List[Dict]:
+    """
+    Searches the local catalog without touching the network. Returns
+    handle/title/size (bytes)/votes dicts, or [] if nothing matches or no
+    catalog has been synced.
+    """
+    try:
+        return get_catalog().search(query, top=top, sort_by=sort_by)
+    except sqlite3.Error as e:
+        logger.debug(f"Catalog search failed: {e}")
+        return []
@@ -1,13 +1,40 @@
-from typing import Optional
+import json
+import sys
+from typing import Dict, List, Optional
 import click
-import pandas as pd
 import logging
-from .load import load as core_load
-from .search import search as core_search
 from .errors import KaggleEaseError
 
+# Only `load`/`preview` import the data stack (pandas, kagglehub); the
+# metadata commands are meant to be called from scripts and start fast.
+
 logger = logging.getLogger(__name__)
 
+
+def _report_error(e: KaggleEaseError) -> None:
+    click.secho(f"Error: {e.message}", fg='red', bold=True, err=True)
+    if hasattr(e, 'fix_suggestion') and e.fix_suggestion:
+        click.secho(f"Suggestion: {e.fix_suggestion}", fg='yellow', err=True)
+    if hasattr(e, 'docs_link') and e.docs_link:
+        click.secho(f"Docs: {e.docs_link}", fg='cyan', err=True)
+
+
+def _render_table(rows: List[Dict], columns: List[str]) -> str:
+    """Left-aligned plain-text table, one row per line."""
+    cells = [[str(row.get(c, "")) for c in columns] for row in rows]
+    widths = [max([len(c)] + [len(r[i]) for r in cells]) for i, c in enumerate(columns)]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths)).rstrip()]
+    lines += ["  ".join(v.ljust(w) for v, w in zip(r, widths)).rstrip() for r in cells]
+    return "\n".join(lines)
+
+
+def _emit(rows: List[Dict], columns: List[str], as_json: bool) -> None:
+    if as_json:
+        click.echo(json.dumps(rows))
+    else:
+        click.echo(_render_table(rows, columns))
+
+
 @click.group()
 def cli():
     """A minimal CLI mirror for KaggleEase."""
@@ -19,16 +46,13 @@ def cli():
 @click.option('--timeout', default=300, help='Timeout in seconds for the operation.')
 def load(dataset: str, file: Optional[str], timeout: int) -> None:
     """Loads a dataset and prints its head."""
+    from .load import load as core_load
     try:
         df = core_load(dataset, file=file, timeout=timeout)
         logger.info(f"Successfully loaded {dataset}.")
         print(df.head())
     except KaggleEaseError as e:
-        click.secho(f"Error: {e.message}", fg='red', bold=True, err=True)
-        if hasattr(e, 'fix_suggestion') and e.fix_suggestion:
-            click.secho(f"Suggestion: {e.fix_suggestion}", fg='yellow', err=True)
-        if hasattr(e, 'docs_link') and e.docs_link:
-            click.secho(f"Docs: {e.docs_link}", fg='cyan', err=True)
+        _report_error(e)
 
 @cli.command()
 @click.argument('dataset')
@@ -44,16 +68,234 @@ def preview(ctx, dataset: str, file: Optional[str], timeout: int) -> None:
 @click.argument('query')
 @click.option('--timeout', default=30, help='Timeout in seconds for the search operation.')
 @click.option('--top', default=5, help='Maximum number of results to return.')
-def search(query: str, timeout: int, top: int) -> None:
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON.')
+@click.option('--file-type', default=None, help='Only datasets with this file type (csv, sqlite, json, bigQuery, parquet).')
+@click.option('--license', 'license_', default=None, help='Only datasets under this license family (cc, gpl, odb, other).')
+@click.option('--sort-by', default=None, help='Order: relevance, hottest, votes, updated, active or published.')
+@click.option('--min-size', default=None, help='Minimum dataset size, e.g. 10MB.')
+@click.option('--max-size', default=None, help='Maximum dataset size, e.g. 1GB.')
+def search(
+    query: str,
+    timeout: int,
+    top: int,
+    as_json: bool,
+    file_type: Optional[str] = None,
+    license_: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    min_size: Optional[str] = None,
+    max_size: Optional[str] = None,
+) -> None:
     """Searches for datasets and prints the results."""
-    results = core_search(query, top=top, timeout=timeout)
-    if results:
-        # Use pandas to create a nicely formatted table
-        df = pd.DataFrame(results)
-        print(df.to_string(index=False))
+    from .search import _format_size, iter_search, search as core_search
+    filters = {"file_type": file_type, "license": license_, "sort_by": sort_by, "min_size": min_size, "max_size": max_size}
+    if any(v is not None for v in filters.values()):
+        try:
+            results = [
+                dict(r, size=_format_size(r["size"]))
+                for r in iter_search(query, filters=filters, max_results=top, page_size=min(top, 100), timeout=timeout)
+            ]
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        except KaggleEaseError as e:
+            _report_error(e)
+            sys.exit(1)
+    else:
+        results = core_search(query, top=top, timeout=timeout)
+    if results or as_json:
+        _emit(results, ["handle", "title", "size", "votes"], as_json)
+    else:
+        click.echo("No results found.")
+
+@cli.command()
+@click.argument('dataset')
+@click.option('--timeout', default=30, help='Timeout in seconds for the API call.')
+@click.option('--json', 'as_json', is_flag=True, help='Print the listing as JSON.')
+def files(dataset: str, timeout: int, as_json: bool) -> None:
+    """Lists the files of a dataset or competition."""
+    from .listing import _get_dataset_files
+    from .search import _format_size
+    try:
+        listing, _, _, _ = _get_dataset_files(dataset, timeout=timeout)
+    except KaggleEaseError as e:
+        _report_error(e)
+        sys.exit(1)
+
+    if as_json:
+        _emit([f._asdict() for f in listing], [], True)
+    else:
+        rows = [{"name": f.name, "size": _format_size(f.size)} for f in listing]
+        _emit(rows, ["name", "size"], False)
+
+@cli.command()
+@click.argument('dataset')
+@click.option('--timeout', default=30, help='Timeout in seconds for the API call.')
+@click.option('--json', 'as_json', is_flag=True, help='Print the summary as JSON.')
+def info(dataset: str, timeout: int, as_json: bool) -> None:
+    """Shows type, version, size and local cache state of a dataset."""
+    from .cache import find_cached_download
+    from .listing import _get_dataset_files
+    from .metadata import cache_enabled, get_metadata_cache
+    from .search import _format_size
+    try:
+        listing, total_size, res_type, resolved_handle = _get_dataset_files(dataset, timeout=timeout)
+    except KaggleEaseError as e:
+        _report_error(e)
+        sys.exit(1)
+
+    entry = get_metadata_cache().get(dataset) if cache_enabled() else None
+    local = find_cached_download(resolved_handle)
+    summary = {
+        "handle": dataset,
+        "resolved_handle": resolved_handle,
+        "type": res_type,
+        "version": entry.version if entry else None,
+        "files": len(listing),
+        "size": total_size,
+        "local_path": str(local[0]) if local else None,
+    }
+    if as_json:
+        click.echo(json.dumps(summary))
+        return
+    summary["size"] = _format_size(total_size)
+    width = max(len(k) for k in summary)
+    for key, value in summary.items():
+        click.echo(f"{key.ljust(width)}  {'-' if value is None else value}")
+
+@cli.group()
+def cache():
+    """Inspects and trims the local download cache."""
+    pass
+
+def _entry_row(entry) -> Dict:
+    import time
+    return {
+        "handle": entry.handle,
+        "type": entry.kind,
+        "size": entry.size,
+        "last_access": time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.last_access)),
+        "pinned": "yes" if entry.pinned else "",
+    }
+
+@cache.command('ls')
+@click.option('--json', 'as_json', is_flag=True, help='Print the entries as JSON.')
+def cache_ls(as_json: bool) -> None:
+    """Lists cached datasets and competitions, most recently used first."""
+    from .eviction import cache_entries
+    from .search import _format_size
+    entries = cache_entries()
+    if as_json:
+        _emit([e._asdict() for e in entries], [], True)
+        return
+    rows = [dict(_entry_row(e), size=_format_size(e.size)) for e in entries]
+    _emit(rows, ["handle", "type", "size", "last_access", "pinned"], False)
+
+@cache.command('du')
+@click.option('--json', 'as_json', is_flag=True, help='Print the usage as JSON.')
+def cache_du(as_json: bool) -> None:
+    """Shows the disk space used by cached downloads and the budget."""
+    from .cache import get_kagglehub_cache_dir
+    from .eviction import cache_entries, get_budget
+    from .search import _format_size
+    entries = cache_entries()
+    summary = {
+        "path": str(get_kagglehub_cache_dir()),
+        "entries": len(entries),
+        "pinned": sum(1 for e in entries if e.pinned),
+        "size": sum(e.size for e in entries),
+        "budget": get_budget(),
+    }
+    if as_json:
+        click.echo(json.dumps(summary))
+        return
+    summary["size"] = _format_size(summary["size"])
+    summary["budget"] = _format_size(summary["budget"]) if summary["budget"] else None
+    width = max(len(k) for k in summary)
+    for key, value in summary.items():
+        click.echo(f"{key.ljust(width)}  {'-' if value is None else value}")
+
+@cache.command('prune')
+@click.option('--max-size', default=None, help='Target size, e.g. 20GB. Defaults to KAGGLEEASE_CACHE_MAX_SIZE.')
+@click.option('--dry-run', is_flag=True, help='Only show what would be evicted.')
+def cache_prune(max_size: Optional[str], dry_run: bool) -> None:
+    """Evicts least recently used, unpinned downloads until the cache fits."""
+    from .eviction import get_budget, parse_size, prune_cache
+    from .search import _format_size
+    try:
+        target = parse_size(max_size) if max_size is not None else get_budget()
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--max-size')
+    if target is None:
+        raise click.UsageError("No budget: pass --max-size or set KAGGLEEASE_CACHE_MAX_SIZE.")
+    evicted = prune_cache(max_bytes=target, dry_run=dry_run)
+    verb = "Would evict" if dry_run else "Evicted"
+    for entry in evicted:
+        click.echo(f"{verb} {entry.handle} ({_format_size(entry.size)})")
+    click.echo(f"{verb} {len(evicted)} entries, {_format_size(sum(e.size for e in evicted))}.")
+
+@cache.command('pin')
+@click.argument('handle')
+@click.option('--remove', is_flag=True, help='Unpin instead.')
+def cache_pin(handle: str, remove: bool) -> None:
+    """Protects a dataset (owner/slug) or competition from eviction."""
+    from .eviction import pin_dataset, unpin_dataset
+    (unpin_dataset if remove else pin_dataset)(handle)
+    click.echo(f"{'Unpinned' if remove else 'Pinned'} {handle}.")
+
+@cli.group()
+def catalog():
+    """Builds and queries the local dataset catalog for offline search."""
+    pass
+
+@catalog.command('sync')
+@click.argument('query', default='')
+@click.option('--max-results', type=int, default=None, help='Stop after this many datasets.')
+@click.option('--file-type', default=None, help='Only datasets with this file type (csv, sqlite, json, bigQuery, parquet).')
+@click.option('--full', is_flag=True, help='Crawl everything instead of stopping at datasets already indexed.')
+def catalog_sync(query: str, max_results: Optional[int], file_type: Optional[str], full: bool) -> None:
+    """Indexes Kaggle datasets (matching QUERY, if given) into the local catalog."""
+    from .catalog import sync_catalog
+    try:
+        result = sync_catalog(query, filters={"file_type": file_type}, max_results=max_results, full=full)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    except KaggleEaseError as e:
+        _report_error(e)
+        sys.exit(1)
+    click.echo(f"Indexed {result.seen} datasets ({result.added} new, {result.updated} updated).")
+
+@catalog.command('search')
+@click.argument('query')
+@click.option('--top', default=5, help='Maximum number of results to return.')
+@click.option('--sort-by', type=click.Choice(['relevance', 'votes', 'size']), default='relevance')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON.')
+def catalog_search_cmd(query: str, top: int, sort_by: str, as_json: bool) -> None:
+    """Searches the local catalog without any network call."""
+    from .catalog import catalog_search
+    from .search import _format_size
+    results = catalog_search(query, top=top, sort_by=sort_by)
+    if as_json:
+        _emit(results, [], True)
+    elif results:
+        _emit([dict(r, size=_format_size(r["size"])) for r in results], ["handle", "title", "size", "votes"], False)
     else:
         click.echo("No results found.")
 
+@catalog.command('info')
+@click.option('--json', 'as_json', is_flag=True, help='Print the summary as JSON.')
+def catalog_info(as_json: bool) -> None:
+    """Shows where the catalog lives, its size and its last sync."""
+    import time
+    from .catalog import get_catalog
+    summary = get_catalog().info()
+    if as_json:
+        click.echo(json.dumps(summary))
+        return
+    if summary["last_sync"]:
+        summary["last_sync"] = time.strftime("%Y-%m-%d %H:%M", time.localtime(summary["last_sync"]))
+    width = max(len(k) for k in summary)
+    for key, value in summary.items():
+        click.echo(f"{key.ljust(width)}  {'-' if value is None else value}")
+
 @cli.command()
 @click.option('--shell', type=click.Choice(['bash', 'zsh', 'fish']), required=True)
 def completion(shell: str) -> None:
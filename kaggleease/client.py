@@ -1,21 +1,129 @@
-import requests
+import os
 import logging
-from typing import List, Dict, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, List, Dict, Optional, Tuple
 from .auth import get_kaggle_credentials, setup_auth
-from .errors import AuthError, DatasetNotFoundError
+from .errors import AuthError, DatasetNotFoundError, NetworkError
+from .listing import _drive
+from .session import get_session
 
 logger = logging.getLogger(__name__)
 
+BASE_URL = "https://www.kaggle.com/api/v1"
+
+
+# Server-side filters of /datasets/list: filter name -> (API parameter, allowed values)
+SEARCH_FILTERS = {
+    "file_type": ("filetype", ("all", "csv", "sqlite", "json", "bigQuery", "parquet")),
+    "license": ("license", ("all", "cc", "gpl", "odb", "other")),
+    "sort_by": ("sortBy", ("relevance", "hottest", "votes", "updated", "active", "published")),
+    "min_size": ("minSize", None),
+    "max_size": ("maxSize", None),
+    "tags": ("tagids", None),
+    "user": ("user", None),
+}
+
+
+def _filter_params(filters: Optional[Dict]) -> Dict:
+    """
+    Maps search filters (see SEARCH_FILTERS) to /datasets/list parameters.
+    Sizes may be bytes or strings like "500MB"; tags a list of tag ids.
+
+    Raises:
+        ValueError: For unknown filters or values.
+    """
+    params = {}
+    for key, value in (filters or {}).items():
+        if key not in SEARCH_FILTERS:
+            raise ValueError(f"Unknown search filter {key!r}; expected one of {sorted(SEARCH_FILTERS)}")
+        if value is None:
+            continue
+        param, allowed = SEARCH_FILTERS[key]
+        if allowed is not None and value not in allowed:
+            raise ValueError(f"{key} must be one of {allowed}, got {value!r}")
+        if key in ("min_size", "max_size"):
+            from .eviction import parse_size
+            value = parse_size(value)
+        elif key == "tags" and not isinstance(value, str):
+            value = ",".join(str(t) for t in value)
+        params[param] = value
+    return params
+
+
+def _search_params(query: str, top: int, page: int = 1, filters: Optional[Dict] = None) -> Dict:
+    params = {
+        "search": query,
+        "sortBy": "relevance",  # Use relevance for better fuzzy matches
+        "pageSize": top,
+        "page": page
+    }
+    params.update(_filter_params(filters))
+    return params
+
+
+def _format_dataset_results(results: List[Dict]) -> List[Dict]:
+    """Normalizes a /datasets/list payload into handle/title/size/votes dicts."""
+    formatted = []
+    for d in results:
+        handle = d.get("ref") or d.get("handle")
+        if not handle:
+            # Some responses use ownerRef/slug instead of ref
+            owner = d.get("ownerRef")
+            slug = d.get("slug")
+            if owner and slug:
+                handle = f"{owner}/{slug}"
+
+        if handle:
+            formatted.append({
+                "handle": handle,
+                "title": d.get("title", handle),
+                "size": int(d.get("totalBytes", 0) or 0),
+                "votes": int(d.get("voteCount", 0) or d.get("votes", 0) or 0)
+            })
+    return formatted
+
+
+def _format_file_listing(data, resource_type: str) -> List[Dict]:
+    """Normalizes a dataset/competition file listing payload."""
+    # Competitions often return a different structure
+    files = data if isinstance(data, list) else data.get("files", [])
+    return [{"name": f.get("name"), "size": f.get("totalBytes", 0), "type": resource_type} for f in files]
+
+
+def _obscured_listing(handle: str, search_results: List[Dict]) -> Optional[List[Dict]]:
+    """
+    Builds the placeholder listing used when search confirms a dataset exists
+    but its files could not be listed.
+    """
+    for r in search_results:
+        if r['handle'].lower() == handle.lower():
+            # Signal to load.py: "Dataset exists, but files are obscured. Download everything."
+            return [{"name": f"__AUTO_RESOLVE_{handle}__", "size": r['size'], "type": "dataset"}]
+    return None
+
+
 class KaggleClient:
     """
     A minimal internal client to interact with the Kaggle REST API directly.
     Replaces the heavy 'kaggle' package for metadata and search.
+
+    All instances share one pooled keep-alive session (see kaggleease.session),
+    so creating a client per call does not cost a new TCP/TLS handshake.
     """
-    BASE_URL = "https://www.kaggle.com/api/v1"
+    BASE_URL = BASE_URL
+    # Probe dataset/competition endpoints and search concurrently in list_files()
+    PARALLEL_PROBE = os.environ.get("KAGGLEEASE_PARALLEL_PROBE", "").strip().lower() in ("1", "true", "yes", "on")
 
     def __init__(self):
         self.auth = None
 
+    @property
+    def session(self):
+        """The shared, process-wide pooled HTTP session."""
+        return get_session()
+
     def _ensure_auth(self):
         """Ensure credentials are loaded and set for Basic Auth."""
         if not self.auth:
@@ -28,87 +136,233 @@ class KaggleClient:
                 )
             self.auth = (username, key)
 
-    def search_datasets(self, query: str, top: int = 5) -> List[Dict]:
+    def search_datasets(self, query: str, top: int = 5, timeout: int = 30, raise_errors: bool = False) -> List[Dict]:
         """
         Search for datasets using the Kaggle REST API.
+
+        Failures return an empty list, or raise NetworkError with
+        raise_errors=True so callers can tell them from "no results".
         """
         try:
-            self._ensure_auth()
-            url = f"{self.BASE_URL}/datasets/list"
-            params = {
-                "search": query,
-                "sortBy": "relevance",  # Use relevance for better fuzzy matches
-                "pageSize": top,
-                "page": 1
-            }
-            response = requests.get(url, auth=self.auth, params=params, timeout=30)
-            
-            if response.status_code != 200:
-                logger.error(f"Search failed with status {response.status_code}: {response.text}")
-                return []
-            
-            results = response.json()
-            formatted = []
-            for d in results:
-                handle = d.get("ref") or d.get("handle")
-                if not handle:
-                    # Some responses use ownerRef/slug instead of ref
-                    owner = d.get("ownerRef")
-                    slug = d.get("slug")
-                    if owner and slug:
-                        handle = f"{owner}/{slug}"
-                
-                if handle:
-                    formatted.append({
-                        "handle": handle,
-                        "title": d.get("title", handle),
-                        "size": int(d.get("totalBytes", 0) or 0),
-                        "votes": int(d.get("voteCount", 0) or d.get("votes", 0) or 0)
-                    })
-            return formatted
+            return self.search_page(query, page=1, page_size=top, timeout=timeout)
         except Exception as e:
+            if raise_errors:
+                raise
             logger.debug(f"Kaggle REST search error: {e}")
             return []
 
-    def list_files(self, dataset_handle: str) -> List[Dict]:
+    def search_page(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        filters: Optional[Dict] = None,
+        timeout: int = 30,
+    ) -> List[Dict]:
         """
-        List files in a dataset or competition. Detects resource type.
+        One page of /datasets/list results. Unlike search_datasets(), failures
+        raise instead of looking like an empty page.
+
+        Raises:
+            NetworkError: If the page cannot be fetched.
         """
         self._ensure_auth()
+        params = _search_params(query, page_size, page=page, filters=filters)
+        try:
+            response = self.session.get(f"{self.BASE_URL}/datasets/list", auth=self.auth, params=params, timeout=timeout)
+        except Exception as e:
+            raise NetworkError(f"Search page {page} for '{query}' failed: {e}") from e
+        if response.status_code != 200:
+            raise NetworkError(f"Search page {page} for '{query}' failed with status {response.status_code}.")
+        return _format_dataset_results(response.json())
+
+    def dataset_version(self, dataset_handle: str) -> Optional[int]:
+        """
+        Returns the current version number of a dataset, or None if it
+        cannot be determined (competitions, errors, unexpected payloads).
+        """
         handle = dataset_handle.strip().strip('/')
-        
-        # 1. Try Dataset API
-        if '/' in handle:
+        if '/' not in handle:
+            return None
+        try:
+            self._ensure_auth()
             owner, slug = handle.split('/', 1)
-            url = f"{self.BASE_URL}/datasets/list/files/{owner}/{slug}"
-            response = requests.get(url, auth=self.auth, timeout=30)
-            if response.status_code == 200:
-                data = response.json()
-                files = data if isinstance(data, list) else data.get("files", [])
-                return [{"name": f.get("name"), "size": f.get("totalBytes", 0), "type": "dataset"} for f in files]
-
-        # 2. Try Competition API
-        # Many handles like 'titanic' are competitions
+            url = f"{self.BASE_URL}/datasets/view/{owner}/{slug}"
+            response = self.session.get(url, auth=self.auth, timeout=30)
+            if response.status_code != 200:
+                return None
+            version = response.json().get("currentVersionNumber")
+            return int(version) if version is not None else None
+        except Exception as e:
+            logger.debug(f"Kaggle REST version lookup error: {e}")
+            return None
+
+    def _probe_dataset(self, handle: str, version: Optional[int] = None) -> Optional[List[Dict]]:
+        """Dataset files endpoint (latest or a given version). Returns None if the handle is not a dataset."""
+        if '/' not in handle:
+            return None
+        owner, slug = handle.split('/', 1)
+        url = f"{self.BASE_URL}/datasets/list/files/{owner}/{slug}"
+        params = {"datasetVersionNumber": version} if version is not None else None
+        response = self.session.get(url, params=params, auth=self.auth, timeout=30)
+        if response.status_code == 200:
+            return _format_file_listing(response.json(), "dataset")
+        return None
+
+    def _probe_competition(self, handle: str) -> Optional[List[Dict]]:
+        """Competition files endpoint. Many handles like 'titanic' are competitions."""
         slug = handle.split('/')[-1]
         comp_url = f"{self.BASE_URL}/competitions/storage/list/files/{slug}"
-        comp_response = requests.get(comp_url, auth=self.auth, timeout=30)
-        
+        comp_response = self.session.get(comp_url, auth=self.auth, timeout=30)
         if comp_response.status_code == 200:
-            data = comp_response.json()
-            # Competitions often return a different structure
-            files = data if isinstance(data, list) else data.get("files", [])
-            return [{"name": f.get("name"), "size": f.get("totalBytes", 0), "type": "competition"} for f in files]
-
-        # 3. Final Stand: Search verification for metadata ONLY
-        # If we can't find files but search finds the handle, we signal "Unknown Files"
-        search_results = self.search_datasets(handle, top=1)
-        for r in search_results:
-            if r['handle'].lower() == handle.lower():
-                # Signal to load.py: "Dataset exists, but files are obscured. Download everything."
-                return [{"name": f"__AUTO_RESOLVE_{handle}__", "size": r['size'], "type": "dataset"}]
-
-        # 4. Actual 404
-        raise DatasetNotFoundError(
-            f"Dataset or Competition '{handle}' not found or inaccessible.",
-            fix_suggestion="Check the spelling or try searching for it using kaggleease.search()"
-        )
+            return _format_file_listing(comp_response.json(), "competition")
+        return None
+
+    def _probe_search(self, handle: str) -> Optional[List[Dict]]:
+        """
+        Search verification for metadata ONLY. If we can't find files but search
+        finds the handle, we signal "Unknown Files".
+        """
+        return _obscured_listing(handle, self.search_datasets(handle, top=1))
+
+    def _probe(self, endpoint: str, handle: str) -> Optional[List[Dict]]:
+        return getattr(self, f"_probe_{endpoint}")(handle)
+
+    def list_files(self, dataset_handle: str, parallel: Optional[bool] = None,
+                   version: Optional[int] = None) -> List[Dict]:
+        """
+        List files in a dataset or competition. Detects resource type.
+
+        Candidate endpoints are tried in order: dataset, competition, then a
+        search fallback. The endpoint that answered is remembered per handle so
+        later lookups go straight to it.
+
+        Args:
+            dataset_handle (str): 'owner/slug' or a bare slug.
+            parallel (bool, optional): Query the dataset, competition and search
+                endpoints concurrently; answers are still ranked in candidate
+                order, so a dataset wins over a competition with the same slug
+                and search only counts when both come back empty. Defaults to
+                KaggleClient.PARALLEL_PROBE.
+            version (int, optional): List this version of a dataset instead of
+                the latest. Only the dataset endpoint is asked.
+        """
+        self._ensure_auth()
+        if parallel is None:
+            parallel = self.PARALLEL_PROBE
+        steps = _list_files_steps(dataset_handle.strip().strip('/'), parallel, version)
+        return _drive(steps, lambda method, *args: getattr(self, method)(*args))
+
+    def _probe_parallel(self, handle: str, candidates: List[str]) -> Tuple[Optional[str], Optional[List[Dict]], Optional[Exception]]:
+        """
+        Runs the probes for `candidates` at once but takes their answers in
+        candidate order, so the result never depends on which request returns
+        first. Returns (endpoint, files, first error).
+        """
+        executor = _get_probe_executor()
+        futures = [executor.submit(self._probe, endpoint, handle) for endpoint in candidates]
+        first_error = None
+        try:
+            for endpoint, future in zip(candidates, futures):
+                try:
+                    files = future.result()
+                except Exception as e:
+                    first_error = first_error or e
+                    continue
+                if files is not None:
+                    return endpoint, files, None
+        finally:
+            for future in futures:
+                future.cancel()
+        return None, None, first_error
+
+
+def _list_files_steps(handle: str, parallel: bool, version: Optional[int] = None) -> Generator:
+    """
+    The decisions of list_files() with the HTTP left out, shared by
+    KaggleClient and AsyncKaggleClient. Yields (method, *args) calls on the
+    client ("_probe_dataset", "_probe" and "_probe_parallel") and returns
+    the file listing.
+    """
+    if version is not None:
+        files = yield ("_probe_dataset", handle, version)
+        if files is None:
+            raise DatasetNotFoundError(f"Version {version} of dataset '{handle}' not found or inaccessible.")
+        return files
+
+    key = handle.lower()
+    remembered = remembered_endpoint(key)
+    if remembered:
+        files = yield ("_probe", remembered, handle)
+        if files is not None:
+            return files
+        forget_endpoint(key)
+
+    candidates = probe_candidates(handle)
+    endpoint, files = None, None
+    if parallel:
+        # Search starts speculatively with the authoritative probes but ranks last,
+        # so it only answers when every authoritative probe came back empty
+        endpoint, files, error = yield ("_probe_parallel", handle, candidates + ["search"])
+        if files is None and error is not None:
+            raise error
+    else:
+        for candidate in candidates + ["search"]:
+            files = yield ("_probe", candidate, handle)
+            if files is not None:
+                endpoint = candidate
+                break
+
+    if files is not None:
+        remember_endpoint(key, endpoint)
+        return files
+
+    # Actual 404
+    raise DatasetNotFoundError(
+        f"Dataset or Competition '{handle}' not found or inaccessible.",
+        fix_suggestion="Check the spelling or try searching for it using kaggleease.search()"
+    )
+
+
+def probe_candidates(handle: str) -> List[str]:
+    """Authoritative endpoints for a handle, in order of precedence (search comes last)."""
+    return ["dataset", "competition"] if '/' in handle else ["competition"]
+
+
+# Endpoint ('dataset' | 'competition' | 'search') that last answered for a handle,
+# least recently used first
+_endpoint_memo: "OrderedDict[str, str]" = OrderedDict()
+_endpoint_memo_lock = threading.Lock()
+ENDPOINT_MEMO_SIZE = 1024
+
+
+def remembered_endpoint(key: str) -> Optional[str]:
+    with _endpoint_memo_lock:
+        endpoint = _endpoint_memo.get(key)
+        if endpoint is not None:
+            _endpoint_memo.move_to_end(key)
+        return endpoint
+
+
+def remember_endpoint(key: str, endpoint: str) -> None:
+    with _endpoint_memo_lock:
+        _endpoint_memo[key] = endpoint
+        _endpoint_memo.move_to_end(key)
+        while len(_endpoint_memo) > ENDPOINT_MEMO_SIZE:
+            _endpoint_memo.popitem(last=False)
+
+
+def forget_endpoint(key: str) -> None:
+    with _endpoint_memo_lock:
+        _endpoint_memo.pop(key, None)
+
+_probe_executor = None
+_probe_executor_lock = threading.Lock()
+
+
+def _get_probe_executor() -> ThreadPoolExecutor:
+    global _probe_executor
+    with _probe_executor_lock:
+        if _probe_executor is None:
+            _probe_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="kaggleease-probe")
+        return _probe_executor
@@ -0,0 +1,249 @@
+import os
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import pandas as pd
+
+from .archives import format_name, split_archive_path
+from .cache import get_cache_dir
+from .eviction import parse_size
+from .readers import _apply_arrow, _apply_pandas, _needed_columns, _normalize_filters, _to_pandas, read_file
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_ENV = "KAGGLEEASE_COLUMNAR_CACHE"
+MAX_SIZE_ENV = "KAGGLEEASE_COLUMNAR_MAX_SIZE"
+DEFAULT_MAX_SIZE = 5 * 1024**3
+ARTIFACT_DIR = "columnar"
+# Text/Excel formats are slow to parse; Parquet is already columnar.
+CONVERTIBLE_EXTS = ('.csv', '.json', '.jsonl', '.ndjson', '.xlsx', '.xls')
+
+_config = {"enabled": None, "compression": None, "max_bytes": None}
+_config_lock = threading.Lock()
+
+
+def configure_columnar_cache(
+    enabled: Optional[bool] = None,
+    compression: Optional[str] = None,
+    max_size: Optional[Union[int, str]] = None,
+) -> None:
+    """
+    Configures the CSV -> Arrow IPC (Feather v2) conversion cache.
+
+    Args:
+        enabled (bool, optional): Turn the cache on for every load(). Defaults to
+            the KAGGLEEASE_COLUMNAR_CACHE environment variable (off).
+        compression (str, optional): "lz4" or "zstd" for smaller artifacts. The
+            default (uncompressed) keeps artifacts memory-mappable.
+        max_size (int or str, optional): Disk space for artifacts, e.g. "20GB";
+            least recently used ones are deleted beyond it. 0 removes the cap.
+            Defaults to KAGGLEEASE_COLUMNAR_MAX_SIZE, else 5 GiB.
+    """
+    with _config_lock:
+        if enabled is not None:
+            _config["enabled"] = bool(enabled)
+        if compression is not None:
+            _config["compression"] = None if compression == "uncompressed" else compression
+        if max_size is not None:
+            _config["max_bytes"] = parse_size(max_size)
+
+
+def columnar_cache_enabled() -> bool:
+    if _config["enabled"] is not None:
+        return _config["enabled"]
+    return os.environ.get(COLUMNAR_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_max_size() -> Optional[int]:
+    """The artifact size cap in bytes, or None when unlimited."""
+    value = _config["max_bytes"]
+    if value is None:
+        env = os.environ.get(MAX_SIZE_ENV, "").strip()
+        try:
+            value = parse_size(env) if env else DEFAULT_MAX_SIZE
+        except ValueError:
+            logger.warning(f"Ignoring invalid {MAX_SIZE_ENV}={env!r}")
+            value = DEFAULT_MAX_SIZE
+    return value or None
+
+
+def _artifact_dir() -> Path:
+    path = get_cache_dir() / ARTIFACT_DIR
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _artifact_path(source: str, backend: str, kwargs: dict) -> Path:
+    """
+    Artifact location for a source file. The name combines a hash of the
+    source path with a hash of everything that invalidates it: size, mtime,
+    the reader backend and reader kwargs. Columns and filters are not part
+    of it; the artifact holds the whole table and they are applied on read.
+    The kagglehub path already encodes the dataset version
+    (.../versions/<n>/...).
+    """
+    real = os.path.realpath(source)
+    # Archive members are invalidated by their archive
+    st = os.stat(split_archive_path(real)[0])
+    source_key = hashlib.sha1(real.encode("utf-8")).hexdigest()[:16]
+    state = f"{st.st_size}:{st.st_mtime_ns}:{backend}:{sorted(kwargs.items())!r}"
+    state_key = hashlib.sha1(state.encode("utf-8")).hexdigest()[:16]
+    return _artifact_dir() / f"{source_key}-{state_key}.arrow"
+
+
+def _drop_stale(artifact: Path) -> None:
+    """Removes artifacts of the same source built from an older state."""
+    prefix = artifact.name.split("-", 1)[0] + "-"
+    for old in artifact.parent.glob(f"{prefix}*.arrow"):
+        if old != artifact:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def _evict(keep: Path) -> None:
+    """
+    Deletes least recently used artifacts (by mtime, which hits refresh)
+    until the directory fits get_max_size(). `keep` is never deleted.
+    """
+    max_bytes = get_max_size()
+    if max_bytes is None:
+        return
+    artifacts = []
+    for path in keep.parent.glob("*.arrow"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        artifacts.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in artifacts)
+    for _, size, path in sorted(artifacts, key=lambda a: a[0]):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+            total -= size
+            logger.debug(f"Evicted columnar cache artifact {path.name}")
+        except OSError:
+            pass
+
+
+def _project(data, columns, dnf):
+    """Applies columns/filters to a full table or DataFrame as read_file() would."""
+    if columns is None and not dnf:
+        return data
+    if isinstance(data, pd.DataFrame):
+        return _apply_pandas(data, columns, dnf)
+    return _apply_arrow(data, columns, dnf)
+
+
+def _read_artifact(artifact: Path) -> "pa.Table":
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    # Memory-mapped, zero-copy for uncompressed artifacts
+    with pa.memory_map(str(artifact), "r") as source:
+        table = ipc.open_file(source).read_all()
+    try:
+        os.utime(artifact)
+    except OSError:
+        pass
+    return table
+
+
+def _from_artifact(table: "pa.Table", artifact: Path, backend: str, dtype_backend: Optional[str] = None,
+                   columns=None, dnf=None):
+    """The cached table as read_file() would return it for these columns/filters."""
+    if backend == "arrow":
+        return _project(table, columns, dnf)
+    # Only the needed columns are converted; filters run in pandas so the index
+    # matches an uncached read. The stored pandas metadata turns string[pyarrow]
+    # back into StringDtype, so the requested dtype_backend is applied again.
+    needed = _needed_columns(columns, dnf)
+    if needed is not None:
+        table = table.select(needed)
+    df = _to_pandas(table, str(artifact), {"dtype_backend": dtype_backend} if dtype_backend else {})
+    return _project(df, columns, dnf)
+
+
+def _write_artifact(artifact: Path, data) -> None:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data)
+    options = ipc.IpcWriteOptions(compression=_config["compression"])
+    tmp = artifact.with_name(f"{artifact.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        os.replace(tmp, artifact)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def read_with_columnar_cache(full_selected_path: str, backend: str = "pandas", **kwargs) -> Union[pd.DataFrame, "pa.Table", str]:
+    """
+    Reads a file through the columnar cache.
+
+    On a hit the Arrow IPC artifact is memory-mapped instead of re-parsing
+    the source. On a miss the whole source is parsed and written atomically
+    for next time, and the least recently used artifacts beyond
+    get_max_size() are deleted. Either way `columns` and `filters` are
+    applied to the cached table, so reads with different projections share
+    one artifact. Any artifact problem falls back to reading the source.
+    """
+    if not format_name(full_selected_path).endswith(CONVERTIBLE_EXTS):
+        return read_file(full_selected_path, backend=backend, **kwargs)
+
+    columns = kwargs.pop("columns", None)
+    filters = kwargs.pop("filters", None)
+    try:
+        dnf = _normalize_filters(filters)
+        artifact = _artifact_path(full_selected_path, backend, kwargs)
+    except (OSError, TypeError) as e:
+        logger.debug(f"Columnar cache unavailable for {full_selected_path}: {e}")
+        return read_file(full_selected_path, backend=backend, columns=columns, filters=filters, **kwargs)
+
+    if artifact.exists():
+        try:
+            logger.info(f"Loading {os.path.basename(full_selected_path)} from columnar cache...")
+            table = _read_artifact(artifact)
+        except Exception as e:
+            logger.warning(f"Columnar cache artifact {artifact.name} is unreadable ({e}). Rebuilding.")
+            try:
+                artifact.unlink()
+            except OSError:
+                pass
+        else:
+            return _from_artifact(table, artifact, backend, kwargs.get("dtype_backend"), columns, dnf)
+
+    data = read_file(full_selected_path, backend=backend, **kwargs)
+    if isinstance(data, str):
+        return data
+    try:
+        _write_artifact(artifact, data)
+        _drop_stale(artifact)
+        _evict(artifact)
+    except Exception as e:
+        logger.debug(f"Could not write columnar cache artifact for {full_selected_path}: {e}")
+    return _project(data, columns, dnf)
+
+
+def clear_columnar_cache() -> None:
+    """Deletes every cached columnar artifact."""
+    for artifact in _artifact_dir().glob("*.arrow"):
+        try:
+            artifact.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,180 @@
+import os
+import re
+import logging
+from fnmatch import fnmatchcase
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from .dtypes import concat_chunks
+from .errors import DataFormatError
+from .archives import archive_members
+from .readers import is_tabular
+
+logger = logging.getLogger(__name__)
+
+COMBINE_MODES = ("concat", "dict")
+SCHEMA_MODES = ("union", "intersection", "strict")
+
+
+def _natural_key(name: str):
+    """Sort key that orders part-2 before part-10."""
+    return [int(t) if t.isdigit() else t.lower() for t in re.split(r"(\d+)", name)]
+
+
+def match_files(names: List[str], patterns: Union[str, List[str]]) -> List[str]:
+    """
+    Glob-matches dataset-relative file names ('/'-separated) against one or
+    more patterns. Patterns without a '/' also match bare file names, so
+    "*.csv" finds CSVs in subdirectories and archives. Only tabular files
+    (also compressed ones, see readers.is_tabular) are returned, in natural
+    order.
+    """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    matched = set()
+    for name in names:
+        if not is_tabular(name):
+            continue
+        base = name.rsplit("/", 1)[-1]
+        for pattern in patterns:
+            pattern = pattern.strip("/")
+            if fnmatchcase(name, pattern) or ("/" not in pattern and fnmatchcase(base, pattern)):
+                matched.add(name)
+                break
+    return sorted(matched, key=_natural_key)
+
+
+def scan_files(root: str) -> List[str]:
+    """
+    Lists every file under a download directory as a '/'-separated relative
+    name, including the members of unextracted archives ('data.zip/a.csv').
+    """
+    names = []
+    for dirpath, _, fs in os.walk(root):
+        for f in fs:
+            full = os.path.join(dirpath, f)
+            for path in [full] + archive_members(full):
+                names.append(os.path.relpath(path, root).replace(os.sep, "/"))
+    return names
+
+
+def _add_source_column(data, source_column: str, name: str):
+    if isinstance(data, pd.DataFrame):
+        data[source_column] = pd.Categorical([name] * len(data))
+        return data
+    import pyarrow as pa
+    column = pa.array([name] * data.num_rows, type=pa.string()).dictionary_encode()
+    return data.append_column(source_column, column)
+
+
+def _read_shard(reader: Callable, path: str, name: str, source_column: Optional[str], kwargs: dict):
+    """Pool worker: reads one shard and tags it with its source file."""
+    data = reader(path, **kwargs)
+    if isinstance(data, str):
+        raise DataFormatError(f"Could not read '{name}' as tabular data.")
+    if source_column:
+        data = _add_source_column(data, source_column, name)
+    return data
+
+
+def _column_names(data) -> List[str]:
+    return list(data.columns) if isinstance(data, pd.DataFrame) else list(data.column_names)
+
+
+def _align(parts: Dict[str, object], schema: str) -> Dict[str, object]:
+    """Checks or narrows shard columns before concatenation."""
+    columns = {name: _column_names(data) for name, data in parts.items()}
+    first_name, first = next(iter(columns.items()))
+
+    if schema == "strict":
+        for name, cols in columns.items():
+            if set(cols) != set(first):
+                raise DataFormatError(
+                    f"Shard '{name}' has columns {cols}, expected {first} (from '{first_name}').",
+                    fix_suggestion='Use schema="union" to fill missing columns with nulls, '
+                                   'or schema="intersection" to keep only shared columns.'
+                )
+        return parts
+
+    if schema == "intersection":
+        shared = [c for c in first if all(c in cols for cols in columns.values())]
+        if not shared:
+            raise DataFormatError("The matched files have no columns in common.")
+        return {
+            name: data[shared] if isinstance(data, pd.DataFrame) else data.select(shared)
+            for name, data in parts.items()
+        }
+    return parts
+
+
+def _concat(parts: List, backend: str):
+    if backend == "arrow":
+        import pyarrow as pa
+        try:
+            return pa.concat_tables(parts, promote_options="permissive")
+        except TypeError:
+            # pyarrow < 14
+            return pa.concat_tables(parts, promote=True)
+    # Keeps categoricals (e.g. from optimize_dtypes) across shards
+    return concat_chunks(parts)
+
+
+def check_modes(combine: str, schema: str) -> None:
+    if combine not in COMBINE_MODES:
+        raise ValueError(f"combine must be one of {COMBINE_MODES}, got {combine!r}")
+    if schema not in SCHEMA_MODES:
+        raise ValueError(f"schema must be one of {SCHEMA_MODES}, got {schema!r}")
+
+
+def read_many(
+    root: str,
+    names: List[str],
+    reader: Callable,
+    backend: str = "pandas",
+    combine: str = "concat",
+    source_column: Optional[str] = None,
+    schema: str = "union",
+    parse_workers: Optional[int] = None,
+    **kwargs,
+):
+    """
+    Parses several files of one download in parallel and combines them.
+
+    Shards are parsed on a process pool (`parse_workers`, default: all cores),
+    so decoding scales with the number of files. With combine="concat" they
+    are concatenated in the order of `names`; columns missing from a shard
+    are filled with nulls (schema="union"), dropped (schema="intersection"),
+    or rejected (schema="strict"). With combine="dict" a {name: frame}
+    mapping is returned instead.
+
+    Args:
+        root (str): Download directory.
+        names (List[str]): '/'-separated file names relative to root.
+        reader (Callable): Picklable function reading one path, e.g. load._read_local.
+        backend (str): "pandas" or "arrow"; selects the concatenation.
+        combine (str): "concat" or "dict".
+        source_column (str, optional): Add a column with each row's source file name.
+        schema (str): "union", "intersection" or "strict".
+        parse_workers (int, optional): Parser pool size.
+        **kwargs: Passed to `reader` for every file.
+    """
+    check_modes(combine, schema)
+    workers = min(parse_workers or os.cpu_count() or 1, len(names))
+    paths = [os.path.join(root, *name.split("/")) for name in names]
+    kwargs["backend"] = backend
+    logger.info(f"Reading {len(names)} files with {workers} parser process(es)...")
+
+    if workers <= 1:
+        results = [_read_shard(reader, p, n, source_column, kwargs) for p, n in zip(paths, names)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_read_shard, reader, p, n, source_column, kwargs) for p, n in zip(paths, names)]
+            results = [f.result() for f in futures]
+
+    parts = dict(zip(names, results))
+    if combine == "dict":
+        return parts
+    parts = _align(parts, schema)
+    return _concat(list(parts.values()), backend)
@@ -0,0 +1,454 @@
+import os
+import re
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from .client import BASE_URL as API_BASE_URL
+from .errors import IntegrityError, KaggleEaseError, NetworkError
+from .session import get_session
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the ranged download engine
+DEFAULT_CONNECTIONS = 4
+MIN_PART_SIZE = 8 * 1024**2
+# Read size per network call; bytes of an interrupted read are lost, so keep it small
+CHUNK_SIZE = 64 * 1024
+DEFAULT_PART_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+# Progress is written to the state file at least this often per part
+STATE_SAVE_BYTES = 16 * 1024**2
+
+# Single files go through this engine ("ranged") or kagglehub's path= download
+DOWNLOADER_ENV = "KAGGLEEASE_DOWNLOADER"
+DOWNLOADERS = ("ranged", "kagglehub")
+
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+_config = {
+    "connections": DEFAULT_CONNECTIONS,
+    "min_part_size": MIN_PART_SIZE,
+    "part_retries": DEFAULT_PART_RETRIES,
+    "downloader": None,
+    "lock_timeout": None,
+}
+
+
+def configure_downloads(
+    connections: Optional[int] = None,
+    min_part_size: Optional[int] = None,
+    part_retries: Optional[int] = None,
+    downloader: Optional[str] = None,
+    lock_timeout: Optional[float] = None,
+) -> None:
+    """
+    Configures the ranged download engine.
+
+    Args:
+        connections (int, optional): Parallel byte-range connections per file.
+        min_part_size (int, optional): Files are only split into parts of at least this many bytes.
+        part_retries (int, optional): Retries per part; each resumes where the part stopped.
+        downloader (str, optional): How load() fetches single files: "ranged" (this
+            engine, the default) or "kagglehub". Overrides KAGGLEEASE_DOWNLOADER.
+        lock_timeout (float, optional): Seconds to wait for another process that is
+            downloading the same file before failing. 0 waits indefinitely (the default).
+    """
+    if lock_timeout is not None:
+        _config["lock_timeout"] = max(0.0, float(lock_timeout))
+    if downloader is not None:
+        if downloader not in DOWNLOADERS:
+            raise ValueError(f"downloader must be one of {DOWNLOADERS}, got {downloader!r}")
+        _config["downloader"] = downloader
+    if connections is not None:
+        _config["connections"] = max(1, int(connections))
+    if min_part_size is not None:
+        _config["min_part_size"] = max(1, int(min_part_size))
+    if part_retries is not None:
+        _config["part_retries"] = max(0, int(part_retries))
+
+
+def get_downloader() -> str:
+    """The configured single-file downloader, else KAGGLEEASE_DOWNLOADER, else "ranged"."""
+    if _config["downloader"]:
+        return _config["downloader"]
+    value = os.environ.get(DOWNLOADER_ENV, "").strip().lower()
+    return value if value in DOWNLOADERS else "ranged"
+
+
+def get_lock_timeout() -> Optional[float]:
+    """Seconds to wait for a concurrent download of the same file, or None for no limit."""
+    return _config["lock_timeout"] or None
+
+
+def _header(response, name: str) -> Optional[str]:
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _expected_md5(response) -> Optional[str]:
+    """
+    MD5 of the whole file published by the server, as hex. GCS's x-goog-hash
+    always covers the whole object; Content-MD5 covers the response body, so
+    it is only trusted on a full (200) response, never on a ranged one.
+    """
+    candidates = []
+    goog = _header(response, "x-goog-hash")
+    if goog:
+        candidates += [p.split("=", 1)[1] for p in goog.split(",") if p.strip().startswith("md5=")]
+    content_md5 = _header(response, "Content-MD5")
+    if content_md5 and response.status_code == 200:
+        candidates.append(content_md5)
+    for value in candidates:
+        try:
+            return base64.b64decode(value.strip()).hex()
+        except ValueError:
+            continue
+    return None
+
+
+def _is_zip_response(response) -> bool:
+    """True if the server says the body is a zip archive (type or attachment name)."""
+    content_type = (_header(response, "Content-Type") or "").split(";")[0].strip().lower()
+    if content_type in ("application/zip", "application/x-zip-compressed"):
+        return True
+    disposition = _header(response, "Content-Disposition") or ""
+    match = re.search(r"filename\*?=(?:UTF-8'')?\"?([^\";]+)", disposition, re.IGNORECASE)
+    return bool(match) and match.group(1).strip().lower().endswith(".zip")
+
+
+def _probe(session, url: str, auth, timeout: int) -> Dict:
+    """
+    Issues a one-byte ranged GET to learn the final URL (after redirects),
+    the size, whether ranges are honoured, the validators and whether the
+    body is served as a zip archive.
+    """
+    response = session.get(url, headers={"Range": "bytes=0-0"}, auth=auth, stream=True,
+                           allow_redirects=True, timeout=timeout)
+    try:
+        if response.status_code == 206:
+            content_range = _header(response, "Content-Range") or ""
+            match = re.match(r"bytes \d+-\d+/(\d+)", content_range)
+            size = int(match.group(1)) if match else None
+            ranges = size is not None
+        elif response.status_code == 200:
+            length = _header(response, "Content-Length")
+            size = int(length) if length and length.isdigit() else None
+            ranges = False
+        else:
+            raise NetworkError(f"Download of {url} failed with status {response.status_code}.")
+        return {
+            "url": response.url if isinstance(response.url, str) else url,
+            "size": size,
+            "ranges": ranges,
+            "validator": _header(response, "ETag") or _header(response, "Last-Modified") or str(size),
+            "md5": _expected_md5(response),
+            "zipped": _is_zip_response(response),
+        }
+    finally:
+        response.close()
+
+
+def _plan_parts(size: int, connections: int, min_part_size: int) -> List[List[int]]:
+    """Splits [0, size) into [start, end, position] parts."""
+    count = max(1, min(connections, size // min_part_size or 1))
+    step = -(-size // count)
+    return [[start, min(start + step, size), start] for start in range(0, size, step)] or [[0, 0, 0]]
+
+
+class _State:
+    """Progress of a partial download, persisted next to the .part file."""
+
+    def __init__(self, path: str, validator: str, size: int, parts: List[List[int]]):
+        self.path = path
+        self.validator = validator
+        self.size = size
+        self.parts = parts
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, validator: str, size: int) -> Optional["_State"]:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("validator") != validator or data.get("size") != size:
+            return None
+        return cls(path, validator, size, data["parts"])
+
+    def save(self) -> None:
+        with self._lock:
+            tmp = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump({"validator": self.validator, "size": self.size, "parts": self.parts}, f)
+            os.replace(tmp, self.path)
+
+    @property
+    def done(self) -> int:
+        return sum(pos - start for start, _, pos in self.parts)
+
+
+def _fetch_part(session, url: str, auth, part_path: str, part: List[int], state: _State, timeout: int) -> None:
+    """Fetches one byte range, resuming from its recorded position on every retry."""
+    _, end, _ = part
+    failures = 0
+    while part[2] < end:
+        try:
+            response = session.get(url, headers={"Range": f"bytes={part[2]}-{end - 1}"}, auth=auth,
+                                   stream=True, timeout=timeout)
+            try:
+                if response.status_code != 206:
+                    raise NetworkError(f"Range request failed with status {response.status_code}.")
+                unsaved = 0
+                with open(part_path, "r+b") as f:
+                    f.seek(part[2])
+                    for block in response.iter_content(CHUNK_SIZE):
+                        block = block[:end - part[2]]
+                        f.write(block)
+                        part[2] += len(block)
+                        unsaved += len(block)
+                        if unsaved >= STATE_SAVE_BYTES:
+                            f.flush()
+                            state.save()
+                            unsaved = 0
+                        if part[2] >= end:
+                            break
+            finally:
+                response.close()
+            if part[2] < end:
+                raise NetworkError(f"Connection closed at byte {part[2]} of range ending at {end}.")
+        except Exception as e:
+            failures += 1
+            state.save()
+            if failures > _config["part_retries"]:
+                raise NetworkError(f"Download failed after {failures} attempts: {e}") from e
+            delay = RETRY_BASE_DELAY * (2 ** (failures - 1))
+            logger.debug(f"Range {part[0]}-{end} interrupted at {part[2]} ({e}); resuming in {delay}s")
+            time.sleep(delay)
+
+
+def _fetch_whole(session, url: str, auth, part_path: str, timeout: int) -> None:
+    """Single-stream download for servers that ignore Range (cannot resume)."""
+    failures = 0
+    while True:
+        try:
+            response = session.get(url, auth=auth, stream=True, timeout=timeout)
+            try:
+                if response.status_code != 200:
+                    raise NetworkError(f"Download failed with status {response.status_code}.")
+                with open(part_path, "wb") as f:
+                    for block in response.iter_content(CHUNK_SIZE):
+                        f.write(block)
+                return
+            finally:
+                response.close()
+        except Exception as e:
+            failures += 1
+            if failures > _config["part_retries"]:
+                raise NetworkError(f"Download failed after {failures} attempts: {e}") from e
+            time.sleep(RETRY_BASE_DELAY * (2 ** (failures - 1)))
+
+
+def _file_digest(path: str, algorithm: str) -> str:
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _discard(*paths: str) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def download_file(
+    url: str,
+    dest: str,
+    auth=None,
+    session=None,
+    connections: Optional[int] = None,
+    checksum: Optional[str] = None,
+    timeout: int = 60,
+) -> str:
+    """
+    Downloads `url` to `dest` with parallel, resumable byte-range requests.
+
+    The file is split into up to `connections` ranges fetched concurrently
+    into `dest.part`; progress is recorded in `dest.part.json`. A dropped
+    connection only re-requests the missing bytes of its range, and a later
+    call resumes an interrupted download as long as the server reports the
+    same ETag/size. Servers that ignore Range get a single stream.
+
+    The result is checked against the expected size and a checksum: the
+    `checksum` argument ("sha256:<hex>", "md5:<hex>", ...) or else the MD5
+    the server publishes (x-goog-hash / Content-MD5). On a mismatch the
+    partial data is discarded and IntegrityError is raised. The finished
+    file is moved into place atomically.
+
+    Returns:
+        str: `dest`.
+
+    Raises:
+        NetworkError: If the download cannot be completed within the retry budget.
+        IntegrityError: If the size or checksum does not match.
+    """
+    _download(url, dest, auth, session, connections, checksum, timeout)
+    return dest
+
+
+def _download(url: str, dest: str, auth, session, connections: Optional[int], checksum: Optional[str],
+              timeout: int) -> Dict:
+    """download_file(), returning what the server reported about the file (see _probe())."""
+    session = session or get_session()
+    connections = connections or _config["connections"]
+    part_path, state_path = dest + PART_SUFFIX, dest + STATE_SUFFIX
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+
+    info = _probe(session, url, auth, timeout)
+    final_url = info["url"]
+    # Never forward Kaggle credentials to the storage host we were redirected to
+    part_auth = auth if urlsplit(final_url).netloc == urlsplit(url).netloc else None
+    size = info["size"]
+
+    if info["ranges"] and size:
+        state = _State.load(state_path, info["validator"], size) if os.path.exists(part_path) else None
+        if state is None:
+            state = _State(state_path, info["validator"], size,
+                           _plan_parts(size, connections, _config["min_part_size"]))
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+            state.save()
+        else:
+            logger.info(f"Resuming {os.path.basename(dest)} at {state.done}/{size} bytes")
+
+        pending = [part for part in state.parts if part[2] < part[1]]
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="kaggleease-range") as pool:
+                futures = [pool.submit(_fetch_part, session, final_url, part_auth, part_path, part, state, timeout)
+                           for part in pending]
+                try:
+                    for future in futures:
+                        future.result()
+                finally:
+                    state.save()
+    else:
+        _fetch_whole(session, final_url, part_auth, part_path, timeout)
+
+    actual = os.path.getsize(part_path)
+    if size is not None and actual != size:
+        _discard(part_path, state_path)
+        raise IntegrityError(f"Downloaded {actual} bytes of {os.path.basename(dest)}, expected {size}.")
+
+    expected = checksum or (f"md5:{info['md5']}" if info["md5"] else None)
+    if expected:
+        algorithm, _, digest = expected.partition(":")
+        actual_digest = _file_digest(part_path, algorithm.lower())
+        if actual_digest.lower() != digest.lower():
+            _discard(part_path, state_path)
+            raise IntegrityError(
+                f"Checksum mismatch for {os.path.basename(dest)}: expected {expected}, got {algorithm}:{actual_digest}."
+            )
+
+    os.replace(part_path, dest)
+    _discard(state_path)
+    return info
+
+
+def file_url(resolved_handle: str, resource_type: str, file_path: str, version: Optional[int] = None) -> str:
+    """Kaggle REST URL that serves (redirects to) a single file."""
+    quoted = quote(file_path.strip('/'))
+    if resource_type == "competition":
+        slug = resolved_handle.strip('/').split('/')[-1]
+        return f"{API_BASE_URL}/competitions/data/download/{slug}/{quoted}"
+    owner, slug = resolved_handle.strip('/').split('/', 1)
+    url = f"{API_BASE_URL}/datasets/download/{owner}/{slug}/{quoted}"
+    return f"{url}?datasetVersionNumber={version}" if version is not None else url
+
+
+def _unwrap_zip(path: str, file_path: str, zipped: bool) -> None:
+    """
+    Kaggle serves some large single files zipped; replace the archive with the
+    file. Only done when the response said it was a zip (`zipped`): files that
+    are zips by format (.npz, .kmz, .xlsx...) are left alone.
+    """
+    if not zipped or file_path.lower().endswith(".zip") or not zipfile.is_zipfile(path):
+        return
+    with zipfile.ZipFile(path) as archive:
+        names = [n for n in archive.namelist() if not n.endswith("/")]
+        member = next((n for n in names if os.path.basename(n) == os.path.basename(file_path)), None)
+        if member is None and len(names) == 1:
+            member = names[0]
+        if member is None:
+            return
+        tmp = f"{path}.unzip"
+        with archive.open(member) as src, open(tmp, "wb") as dst:
+            while True:
+                block = src.read(CHUNK_SIZE)
+                if not block:
+                    break
+                dst.write(block)
+    os.replace(tmp, path)
+
+
+def fetch_file(
+    resolved_handle: str,
+    resource_type: str,
+    file_path: str,
+    version: Optional[int] = None,
+    force: bool = False,
+) -> Tuple[str, Optional[int]]:
+    """
+    Downloads a single dataset or competition file with download_file() into
+    kagglehub's cache layout and writes kagglehub's completion marker, so the
+    file is reused by kagglehub, find_cached_download() and later loads.
+
+    Args:
+        resolved_handle (str): 'owner/slug' or a competition slug.
+        resource_type (str): "dataset" or "competition".
+        file_path (str): Path of the file inside the dataset.
+        version (int, optional): Dataset version. Defaults to the current one.
+        force (bool): Download again even if the file is cached.
+
+    Returns:
+        Tuple[str, Optional[int]]: (local file path, dataset version).
+    """
+    from .cache import kagglehub_file_target
+    import kaggleease.client
+
+    client = kaggleease.client.KaggleClient()
+    client._ensure_auth()
+    if resource_type == "dataset" and version is None:
+        version = client.dataset_version(resolved_handle)
+        if version is None:
+            raise NetworkError(f"Could not determine the current version of '{resolved_handle}'.")
+
+    dest, marker = kagglehub_file_target(resolved_handle, resource_type, file_path, version)
+    if not force and dest.exists() and marker.exists():
+        return str(dest), version
+
+    url = file_url(resolved_handle, resource_type, file_path, version)
+    logger.info(f"Downloading {file_path} from '{resolved_handle}'...")
+    try:
+        info = _download(url, str(dest), client.auth, None, None, None, 60)
+    except KaggleEaseError:
+        raise
+    except Exception as e:
+        raise NetworkError(f"Download of '{file_path}' failed: {e}") from e
+    _unwrap_zip(str(dest), file_path, info["zipped"])
+
+    marker.parent.mkdir(parents=True, exist_ok=True)
+    marker.touch()
+    return str(dest), version
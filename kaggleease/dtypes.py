@@ -0,0 +1,329 @@
+import re
+import logging
+import importlib.util
+from collections import namedtuple
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    infer_dtype,
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    is_string_dtype,
+    union_categoricals,
+)
+
+from .readers import DEFAULT_BATCH_ROWS, can_stream, iter_file, read_file
+
+logger = logging.getLogger(__name__)
+
+# A string column becomes categorical when it has at most this share of unique values
+CATEGORY_MAX_RATIO = 0.5
+# ISO-8601 dates, optionally with a time part: 2021-03-04, 2021-03-04 12:00:01, 2021-03-04T12:00Z
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?$")
+DATE_SAMPLE_SIZE = 1000
+# format="ISO8601" needs pandas 2; older versions infer ISO dates on their own
+_DATE_FORMAT = {"format": "ISO8601"} if int(pd.__version__.split(".")[0]) >= 2 else {}
+
+DtypeReport = namedtuple("DtypeReport", ["before_bytes", "after_bytes", "changes"])
+DtypeReport.__doc__ = """
+Memory effect of DtypeOptimizer: deep bytes before and after, and the
+{column: (old dtype, new dtype)} changes that were made.
+"""
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    """Deep in-memory size of a DataFrame, index included."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrinks integer and float columns to the smallest dtype that holds their
+    values exactly (floats only become float32 when no precision is lost).
+    """
+    for col in df.columns:
+        dtype = df[col].dtype
+        if is_bool_dtype(dtype):
+            continue
+        if is_integer_dtype(dtype):
+            # Signed only: mixing uint64/int64 chunks would promote to float64
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+        elif is_float_dtype(dtype):
+            df[col] = df[col].astype(_float_dtype(df[col]))
+    return df
+
+
+def _float_dtype(series: pd.Series):
+    """
+    float32 when every value survives the round trip to it exactly, else the
+    column's own dtype. (pd.to_numeric(downcast="float") only checks the
+    values are close, so 123456.789 would become 123456.7890625.)
+    """
+    if series.dtype == np.float64:
+        narrow = series.astype(np.float32)
+        if narrow.astype(np.float64).equals(series):
+            return np.dtype(np.float32)
+    return series.dtype
+
+
+def _is_text(series: pd.Series) -> bool:
+    if not (is_object_dtype(series.dtype) or is_string_dtype(series.dtype)):
+        return False
+    return infer_dtype(series, skipna=True) == "string"
+
+
+def categorical_candidates(df: pd.DataFrame, max_ratio: float = CATEGORY_MAX_RATIO) -> List[str]:
+    """String columns whose values repeat enough to be cheaper as categoricals."""
+    if not len(df):
+        return []
+    candidates = []
+    for col in df.columns:
+        series = df[col]
+        if not (is_object_dtype(series.dtype) or is_string_dtype(series.dtype)):
+            continue
+        if series.nunique(dropna=True) <= max_ratio * len(series):
+            candidates.append(col)
+    return candidates
+
+
+def date_candidates(df: pd.DataFrame) -> List[str]:
+    """String columns whose sampled values are all ISO-8601 dates."""
+    candidates = []
+    for col in df.columns:
+        series = df[col]
+        if not _is_text(series):
+            continue
+        values = series.dropna().head(DATE_SAMPLE_SIZE)
+        if len(values) and all(DATE_PATTERN.match(v) for v in values):
+            candidates.append(col)
+    return candidates
+
+
+def to_categorical(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """Parses ISO-8601 strings; raises instead of turning other values into NaT."""
+    return pd.to_datetime(series, errors="raise", **_DATE_FORMAT)
+
+
+def _arrow_string_dtype():
+    if importlib.util.find_spec("pyarrow") is None:
+        return None
+    return pd.StringDtype("pyarrow")
+
+
+class DtypeOptimizer:
+    """
+    Shrinks DataFrames chunk by chunk with decisions that stay consistent
+    across chunks.
+
+    Column roles (date, categorical, string) are decided on the first chunk
+    and applied to every later one; a date column whose later values do not
+    parse is kept as text from then on (and logged) rather than losing them.
+    Each numeric column is pinned to the dtype chosen for the first chunk and
+    later chunks are cast to it; it only widens when a chunk does not fit,
+    so later chunks never overflow an earlier choice. Categorical columns keep a growing category list whose
+    earlier entries never move, so a code means the same value in every
+    chunk. The bytes before and after are accumulated into report().
+
+    Args:
+        downcast (bool): Downcast integers and floats.
+        categorical_columns (List[str], optional): Columns to make categorical.
+            Defaults to low-cardinality string columns of the first chunk.
+        strings (bool): Store the remaining text columns as pyarrow strings.
+        dates (bool): Parse text columns that hold ISO-8601 dates.
+        nullable_integers (bool): Use nullable integer dtypes (Int8...) for
+            every integer column, so a chunk with gaps does not switch the
+            column from int8 to Int8. Used when streaming.
+
+    Float columns holding whole numbers and gaps (integers that pandas read
+    as float64 because of missing values) become nullable integers.
+    """
+
+    def __init__(
+        self,
+        downcast: bool = True,
+        categorical_columns: Optional[List[str]] = None,
+        strings: bool = True,
+        dates: bool = True,
+        nullable_integers: bool = False,
+    ):
+        self.downcast = downcast
+        self.nullable_integers = nullable_integers
+        self.categorical_columns = categorical_columns
+        self.strings = strings
+        self.dates = dates
+        self.date_columns: List[str] = []
+        self.string_columns: List[str] = []
+        self._decided = False
+        self._numeric: Dict[str, np.dtype] = {}
+        self._nullable = set()
+        self._categories: Dict[str, pd.Index] = {}
+        self._original: Dict[str, object] = {}
+        self._before = 0
+        self._after = 0
+
+    def _decide(self, chunk: pd.DataFrame) -> None:
+        self._original = {col: chunk[col].dtype for col in chunk.columns}
+        self.date_columns = date_candidates(chunk) if self.dates else []
+        if self.categorical_columns is None:
+            self.categorical_columns = [
+                c for c in categorical_candidates(chunk) if c not in self.date_columns and _is_text(chunk[c])
+            ]
+        if self.strings and _arrow_string_dtype() is not None:
+            taken = set(self.date_columns) | set(self.categorical_columns)
+            self.string_columns = [
+                c for c in chunk.columns
+                if c not in taken and _is_text(chunk[c]) and not isinstance(chunk[c].dtype, pd.StringDtype)
+            ]
+        self._decided = True
+
+    def _numeric_dtype(self, col: str, series: pd.Series):
+        if is_integer_dtype(series.dtype):
+            narrow = pd.to_numeric(series, downcast="integer").dtype
+        else:
+            # Whole numbers with gaps (ints read as float64 because of NaN)
+            # become a nullable integer dtype
+            present = series.dropna()
+            if len(present) < len(series) and len(present) and (present % 1 == 0).all() \
+                    and present.abs().max() < 2 ** 53:
+                narrow = pd.to_numeric(present.astype("int64"), downcast="integer").dtype
+                self._nullable.add(col)
+            else:
+                narrow = _float_dtype(series)
+        pinned = self._numeric.get(col)
+        target = np.dtype(narrow) if pinned is None else np.promote_types(pinned, narrow)
+        if pinned is not None and target != pinned:
+            logger.info(f"Widening column '{col}' from {pinned} to {target} for values that do not fit")
+        self._numeric[col] = target
+        return self._pandas_dtype(col, target)
+
+    def _pandas_dtype(self, col: str, dtype: np.dtype):
+        if dtype.kind == "i" and (self.nullable_integers or col in self._nullable):
+            return pd.api.types.pandas_dtype(dtype.name.capitalize())
+        return dtype
+
+    def _categorical(self, col: str, series: pd.Series) -> pd.Categorical:
+        known = self._categories.get(col, pd.Index([], dtype=object))
+        new = pd.Index(series.dropna().unique()).difference(known, sort=False)
+        if len(new):
+            known = known.append(new)
+            self._categories[col] = known
+        return pd.Categorical(series, categories=known)
+
+    def apply(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Optimizes one chunk (in place where possible) and returns it."""
+        if not self._decided:
+            self._decide(chunk)
+        self._before += frame_bytes(chunk)
+
+        for col in chunk.columns:
+            series = chunk[col]
+            if col in self.date_columns:
+                try:
+                    chunk[col] = _parse_dates(series)
+                except (ValueError, TypeError, OverflowError) as e:
+                    logger.warning(f"Column '{col}' has values that are not ISO-8601 dates ({e}); keeping it as text.")
+                    self.date_columns.remove(col)
+            elif col in self.categorical_columns:
+                chunk[col] = self._categorical(col, series)
+            elif col in self.string_columns:
+                chunk[col] = series.astype(_arrow_string_dtype())
+            elif self.downcast and (is_integer_dtype(series.dtype) or is_float_dtype(series.dtype)) \
+                    and not is_bool_dtype(series.dtype):
+                chunk[col] = series.astype(self._numeric_dtype(col, series))
+
+        self._after += frame_bytes(chunk)
+        return chunk
+
+    def iter(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Optimizes a stream of chunks, logging the report when it ends."""
+        for chunk in chunks:
+            yield self.apply(chunk)
+        log_report(self.report())
+
+    def report(self) -> DtypeReport:
+        changes = {}
+        for col, old in self._original.items():
+            if col in self.date_columns:
+                new = "datetime64[ns]"
+            elif col in self.categorical_columns:
+                new = "category"
+            elif col in self.string_columns:
+                new = "string[pyarrow]"
+            else:
+                new = self._numeric.get(col)
+                new = old if new is None else self._pandas_dtype(col, new)
+            if str(new) != str(old):
+                changes[col] = (str(old), str(new))
+        return DtypeReport(self._before, self._after, changes)
+
+
+def log_report(report: DtypeReport) -> None:
+    from .progress import ProgressBar
+    if not report.before_bytes:
+        return
+    saved = report.before_bytes - report.after_bytes
+    logger.info(
+        f"Optimized dtypes of {len(report.changes)} column(s): "
+        f"{ProgressBar._format_bytes(report.before_bytes)} -> {ProgressBar._format_bytes(report.after_bytes)} "
+        f"(saved {ProgressBar._format_bytes(max(saved, 0))}, {saved / report.before_bytes:.0%})"
+    )
+
+
+def concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates optimized chunks without losing their dtypes: categorical
+    columns are re-coded onto the union of all chunks' categories (plain
+    pd.concat would fall back to object), and numeric columns take the
+    smallest dtype that fits every chunk.
+    """
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+
+    categorical = {
+        col for chunk in chunks for col in chunk.columns
+        if isinstance(chunk[col].dtype, pd.CategoricalDtype)
+    }
+    for col in categorical:
+        categories = union_categoricals(
+            [chunk[col].astype("category") for chunk in chunks if col in chunk.columns],
+            ignore_order=True,
+        ).categories
+        for chunk in chunks:
+            if col in chunk.columns:
+                chunk[col] = pd.Categorical(chunk[col], categories=categories)
+
+    ignore_index = all(isinstance(chunk.index, pd.RangeIndex) for chunk in chunks)
+    return pd.concat(chunks, ignore_index=ignore_index, sort=False)
+
+
+def read_optimized(path: str, optimizer: DtypeOptimizer, batch_rows: int = DEFAULT_BATCH_ROWS, **kwargs) -> pd.DataFrame:
+    """
+    Reads `path` into one DataFrame through `optimizer`. Streamable formats
+    are shrunk chunk by chunk before being kept, so peak memory is the
+    optimized result plus one chunk; others are optimized after a full read.
+    The report is stored in df.attrs["dtype_report"].
+    """
+    if can_stream(path):
+        df = concat_chunks([optimizer.apply(c) for c in iter_file(path, batch_rows=batch_rows, **kwargs)])
+    else:
+        data = read_file(path, **kwargs)
+        if isinstance(data, str):
+            return data
+        df = optimizer.apply(data)
+    report = optimizer.report()
+    df.attrs["dtype_report"] = report
+    log_report(report)
+    return df
@@ -44,3 +44,13 @@ class DatasetNotFoundError(KaggleEaseError):
     """Raised when a dataset cannot be found on Kaggle."""
     def __init__(self, message: str, fix_suggestion: Optional[str] = "Check the spelling of your dataset handle or use search() to find it."):
         super().__init__(message, fix_suggestion=fix_suggestion)
+
+class InsufficientMemoryError(KaggleEaseError):
+    """Raised when a file is estimated not to fit in memory, even with smaller dtypes."""
+    def __init__(self, message: str, fix_suggestion: Optional[str] = "Pass stream=True, select fewer columns, or add filters."):
+        super().__init__(message, fix_suggestion=fix_suggestion)
+
+class IntegrityError(NetworkError):
+    """Raised when a downloaded file does not match its expected size or checksum."""
+    def __init__(self, message: str, fix_suggestion: Optional[str] = "The partial download was discarded; retry the load."):
+        super().__init__(message, fix_suggestion=fix_suggestion)
@@ -0,0 +1,354 @@
+import os
+import re
+import time
+import uuid
+import shutil
+import sqlite3
+import logging
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .cache import get_cache_dir, get_kagglehub_cache_dir
+from .locks import FileLock, entry_lock, lock_path
+
+logger = logging.getLogger(__name__)
+
+BUDGET_ENV = "KAGGLEEASE_CACHE_MAX_SIZE"
+DB_NAME = "downloads.sqlite"
+TRASH_DIR = ".kaggleease-trash"
+
+CacheEntry = namedtuple("CacheEntry", ["handle", "kind", "path", "size", "last_access", "pinned"])
+CacheEntry.__doc__ = """
+One dataset (all of its cached versions) or competition in kagglehub's
+cache: its size in bytes, last access (epoch seconds) and pin state.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    kind TEXT NOT NULL,
+    handle TEXT NOT NULL,
+    last_access REAL,
+    pinned INTEGER NOT NULL DEFAULT 0,
+    size INTEGER,
+    PRIMARY KEY (kind, handle)
+)
+"""
+
+_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+_config = {"max_bytes": None}
+_config_lock = threading.Lock()
+_initialized = set()
+# Budget each cache directory was last pruned against by this process
+_pruned_budget = {}
+
+
+def parse_size(value: Union[int, str]) -> int:
+    """Parses 500000000, "500MB", "20G" or "1.5 TiB" into bytes (binary units)."""
+    if isinstance(value, int):
+        return value
+    match = re.fullmatch(r"\s*([\d.]+)\s*([kmgt]?)(i?b)?\s*", str(value).lower())
+    if not match:
+        raise ValueError(f"Invalid size: {value!r} (expected e.g. 500MB or 20GB)")
+    return int(float(match.group(1)) * _UNITS[match.group(2)])
+
+
+def configure_cache_budget(max_bytes: Optional[Union[int, str]] = None) -> None:
+    """
+    Caps the disk space of downloaded datasets and competitions. After each
+    download, least recently used entries are evicted until the cache fits;
+    pinned entries are never evicted.
+
+    Args:
+        max_bytes (int or str, optional): Budget, e.g. 50 * 1024**3 or "50GB".
+            0 removes the budget. Defaults to KAGGLEEASE_CACHE_MAX_SIZE (none).
+    """
+    with _config_lock:
+        if max_bytes is not None:
+            _config["max_bytes"] = parse_size(max_bytes)
+
+
+def get_budget() -> Optional[int]:
+    """The effective cache budget in bytes, or None when unlimited."""
+    value = _config["max_bytes"]
+    if value is None:
+        env = os.environ.get(BUDGET_ENV, "").strip()
+        try:
+            value = parse_size(env) if env else None
+        except ValueError:
+            logger.warning(f"Ignoring invalid {BUDGET_ENV}={env!r}")
+            value = None
+    return value or None
+
+
+def _connect() -> sqlite3.Connection:
+    path = get_cache_dir() / DB_NAME
+    conn = sqlite3.connect(str(path), timeout=30)
+    if path not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA)
+        try:
+            conn.execute("ALTER TABLE downloads ADD COLUMN size INTEGER")
+        except sqlite3.OperationalError:
+            pass  # already there
+        conn.commit()
+        _initialized.add(path)
+    return conn
+
+
+def _kind_of(handle: str) -> str:
+    return "dataset" if "/" in handle.strip("/") else "competition"
+
+
+def _key(handle: str) -> str:
+    return handle.strip().strip("/").lower()
+
+
+def _execute(query: str, params: tuple) -> None:
+    try:
+        conn = _connect()
+        try:
+            conn.execute(query, params)
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Cache access log write failed: {e}")
+
+
+def record_access(handle: str, kind: Optional[str] = None) -> None:
+    """Marks a cached dataset or competition as just used (for LRU eviction)."""
+    _execute(
+        "INSERT INTO downloads (kind, handle, last_access) VALUES (?, ?, ?) "
+        "ON CONFLICT (kind, handle) DO UPDATE SET last_access = excluded.last_access",
+        (kind or _kind_of(handle), _key(handle), time.time()),
+    )
+
+
+def _set_pinned(handle: str, pinned: bool) -> None:
+    _execute(
+        "INSERT INTO downloads (kind, handle, pinned) VALUES (?, ?, ?) "
+        "ON CONFLICT (kind, handle) DO UPDATE SET pinned = excluded.pinned",
+        (_kind_of(handle), _key(handle), int(pinned)),
+    )
+
+
+def pin_dataset(handle: str) -> None:
+    """Protects a dataset ('owner/slug') or competition (slug) from eviction."""
+    _set_pinned(handle, True)
+
+
+def unpin_dataset(handle: str) -> None:
+    """Makes a pinned dataset or competition evictable again."""
+    _set_pinned(handle, False)
+
+
+def _access_log() -> dict:
+    try:
+        conn = _connect()
+        try:
+            rows = conn.execute("SELECT kind, handle, last_access, pinned FROM downloads").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Cache access log read failed: {e}")
+        return {}
+    return {(kind, handle): (last_access, bool(pinned)) for kind, handle, last_access, pinned in rows}
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.lstat(os.path.join(root, f)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _cached_dirs() -> Iterable[Tuple[str, str, Path]]:
+    """(handle, kind, directory) of every dataset and competition kagglehub has cached."""
+    root = get_kagglehub_cache_dir()
+    datasets = root / "datasets"
+    if datasets.is_dir():
+        for owner in datasets.iterdir():
+            if not owner.is_dir() or owner.name.startswith("."):
+                continue
+            for slug in owner.iterdir():
+                if slug.is_dir() and not slug.name.startswith("."):
+                    yield f"{owner.name}/{slug.name}", "dataset", slug
+    competitions = root / "competitions"
+    if competitions.is_dir():
+        for comp in competitions.iterdir():
+            if comp.is_dir() and not comp.name.startswith("."):
+                yield comp.name, "competition", comp
+
+
+def _entry_dir(handle: str, kind: str) -> Path:
+    root = get_kagglehub_cache_dir()
+    if kind == "competition":
+        return root / "competitions" / handle.strip("/").split("/")[-1]
+    owner, slug = handle.strip("/").split("/", 1)
+    return root / "datasets" / owner / slug
+
+
+def _size_changed(handle: str, kind: str, size: int) -> bool:
+    """Records an entry's size; True if it differs from the last recorded one."""
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT size FROM downloads WHERE kind = ? AND handle = ?", (kind, _key(handle))
+            ).fetchone()
+            if row is not None and row[0] == size:
+                return False
+            conn.execute(
+                "INSERT INTO downloads (kind, handle, size) VALUES (?, ?, ?) "
+                "ON CONFLICT (kind, handle) DO UPDATE SET size = excluded.size",
+                (kind, _key(handle), size),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Cache size bookkeeping failed: {e}")
+    return True
+
+
+def cache_entries() -> List[CacheEntry]:
+    """
+    Lists the cached datasets and competitions, most recently used first.
+    Entries never loaded through KaggleEase use their directory's mtime as
+    last access.
+    """
+    log = _access_log()
+    entries = []
+    for handle, kind, path in _cached_dirs():
+        last_access, pinned = log.get((kind, _key(handle)), (None, False))
+        if last_access is None:
+            try:
+                last_access = path.stat().st_mtime
+            except OSError:
+                continue
+        entries.append(CacheEntry(handle, kind, str(path), _dir_size(path), last_access, pinned))
+    return sorted(entries, key=lambda e: e.last_access, reverse=True)
+
+
+def cache_usage() -> Tuple[int, Optional[int]]:
+    """(bytes used by cached downloads, budget in bytes or None)."""
+    return sum(e.size for e in cache_entries()), get_budget()
+
+
+def _remove(entry: CacheEntry) -> None:
+    """
+    Deletes an entry so a concurrent reader never sees a completion marker
+    without its files: competition markers go first, then the directory is
+    renamed out of the cache in one step and deleted from there.
+    """
+    root = get_kagglehub_cache_dir()
+    trash = root / TRASH_DIR
+    trash.mkdir(parents=True, exist_ok=True)
+    doomed = [Path(entry.path)]
+    if entry.kind == "competition":
+        (root / "competitions" / f"{entry.handle}.complete").unlink(missing_ok=True)
+        doomed.append(root / "competitions" / ".complete" / entry.handle)
+    for path in doomed:
+        if path.exists():
+            target = trash / uuid.uuid4().hex
+            os.replace(path, target)
+            shutil.rmtree(target, ignore_errors=True)
+
+
+def _empty_trash() -> None:
+    """Deletes what earlier evictions could not (e.g. files that were open on Windows)."""
+    trash = get_kagglehub_cache_dir() / TRASH_DIR
+    if not trash.is_dir():
+        return
+    for leftover in trash.iterdir():
+        shutil.rmtree(leftover, ignore_errors=True)
+        if leftover.exists():
+            logger.debug(f"Could not delete evicted data at {leftover} yet")
+
+
+def prune_cache(
+    max_bytes: Optional[Union[int, str]] = None,
+    dry_run: bool = False,
+    keep: Iterable[str] = (),
+) -> List[CacheEntry]:
+    """
+    Evicts least recently used downloads until the cache fits `max_bytes`.
+
+    Pinned entries, handles in `keep` and entries locked by another process
+    (being downloaded or evicted) are skipped. Concurrent pruners take turns
+    on a shared lock, so each sees the others' deletions.
+
+    Args:
+        max_bytes (int or str, optional): Target size. Defaults to the configured budget.
+        dry_run (bool): Only report what would be evicted.
+        keep (Iterable[str]): Handles not to evict, e.g. the one being loaded.
+
+    Returns:
+        List[CacheEntry]: The evicted (or, with dry_run, evictable) entries.
+    """
+    budget = parse_size(max_bytes) if max_bytes is not None else get_budget()
+    if budget is None:
+        return []
+    keep = {_key(h) for h in keep}
+
+    with FileLock(lock_path("evict")):
+        if not dry_run:
+            _empty_trash()
+        entries = cache_entries()
+        total = sum(e.size for e in entries)
+        evicted = []
+        for entry in sorted(entries, key=lambda e: e.last_access):
+            if total <= budget:
+                break
+            if entry.pinned or _key(entry.handle) in keep:
+                continue
+            if dry_run:
+                evicted.append(entry)
+                total -= entry.size
+                continue
+            lock = entry_lock(entry.handle, entry.kind)
+            if not lock.acquire(blocking=False):
+                logger.debug(f"Skipping busy cache entry {entry.handle}")
+                continue
+            try:
+                _remove(entry)
+            except OSError as e:
+                logger.warning(f"Could not evict {entry.handle}: {e}")
+                continue
+            finally:
+                lock.release()
+            evicted.append(entry)
+            total -= entry.size
+            logger.info(f"Evicted {entry.kind} '{entry.handle}' from the cache")
+        if total > budget:
+            logger.warning(f"Download cache is still over budget after eviction ({total} > {budget} bytes)")
+    return evicted
+
+
+def after_download(handle: str, kind: str) -> None:
+    """
+    Bookkeeping after load() fetched or reused a download: records the access
+    and, when a budget is set, evicts other entries to fit it. Only this
+    entry is measured; the whole cache is walked only when it changed size
+    (something was downloaded) or the budget changed, so reusing a cached
+    download stays cheap. Never raises.
+    """
+    try:
+        record_access(handle, kind)
+        budget = get_budget()
+        if budget is None:
+            return
+        changed = _size_changed(handle, kind, _dir_size(_entry_dir(handle, kind)))
+        cache_dir = get_cache_dir()
+        if changed or _pruned_budget.get(cache_dir) != budget:
+            prune_cache(keep=[handle])
+            _pruned_budget[cache_dir] = budget
+    except Exception as e:
+        logger.debug(f"Cache bookkeeping for {handle} failed: {e}")
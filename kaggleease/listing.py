@@ -0,0 +1,225 @@
+"""
+Dataset file listings: the metadata cache, version revalidation and the
+REST round-trip. Kept free of pandas/kagglehub so metadata-only callers
+(search, the CLI's files/info commands) start quickly.
+"""
+import logging
+from collections import namedtuple
+from typing import Callable, Generator, List, Optional, Tuple
+
+from .errors import DatasetNotFoundError, KaggleEaseError, NetworkError
+
+logger = logging.getLogger(__name__)
+
+KaggleFile = namedtuple('KaggleFile', ['name', 'size', 'type'])
+
+def _to_kaggle_files(files: List[dict]) -> List[KaggleFile]:
+    """Converts raw file dicts from the client (or metadata cache) into KaggleFile tuples."""
+    return [KaggleFile(f['name'], f['size'], f.get('type', 'dataset')) for f in files]
+
+def _from_metadata_entry(entry) -> Tuple[List, int, str, str]:
+    """Rebuilds the _get_dataset_files() result from a cached MetadataEntry."""
+    standard_files = _to_kaggle_files(entry.files)
+    return standard_files, sum(f.size for f in standard_files), entry.resource_type, entry.resolved_handle
+
+def _cached_listing(dataset_handle: str):
+    """
+    Looks up the persistent metadata cache for a handle.
+
+    Returns:
+        tuple: (store, entry, result). `result` is the ready-to-use listing when
+        the entry is fresh (or offline mode is on); otherwise None and the caller
+        must revalidate or fetch. `store` is None when the cache is disabled.
+
+    Raises:
+        NetworkError: In offline mode, if the handle has never been cached.
+    """
+    from . import metadata
+    if not metadata.cache_enabled():
+        return None, None, None
+
+    store = metadata.get_metadata_cache()
+    entry = store.get(dataset_handle)
+
+    if entry is not None and (metadata.offline_mode() or store.is_fresh(entry)):
+        logger.debug(f"Metadata cache hit for '{dataset_handle}'")
+        return store, entry, _from_metadata_entry(entry)
+
+    if metadata.offline_mode():
+        raise NetworkError(
+            f"Offline mode is enabled and no cached metadata exists for '{dataset_handle}'.",
+            fix_suggestion="Load it once while online, or disable offline mode (KAGGLEEASE_OFFLINE=0)."
+        )
+    return store, entry, None
+
+def _needs_version_check(entry) -> bool:
+    return entry is not None and entry.resource_type == "dataset"
+
+def _store_listing(store, dataset_handle: str, result: Tuple[List, int, str, str], version: Optional[int]) -> None:
+    files, _, resource_type, resolved_handle = result
+    store.put(dataset_handle, resolved_handle, resource_type, [f._asdict() for f in files], version=version)
+
+def _get_dataset_files(dataset_handle: str, timeout: int = 300, version: Optional[int] = None) -> Tuple[List, int, str, str]:
+    """
+    Finds files for a dataset handle, consulting the persistent metadata cache first.
+
+    Fresh cache entries are returned without any network call. Stale dataset
+    entries are revalidated against the dataset's current version number and
+    only re-listed when it changed. In offline mode cached entries are served
+    regardless of age. The cache holds the latest version's listing, so a
+    pinned `version` is always listed from Kaggle.
+
+    Args:
+        dataset_handle (str): The Kaggle dataset handle or slug.
+        timeout (int): Timeout in seconds for API calls.
+        version (int, optional): Dataset version to list. Defaults to the latest.
+
+    Returns:
+        Tuple[List, int, str, str]: (standard_files, total_size, resource_type, resolved_handle)
+
+    Raises:
+        NetworkError: In offline mode, if the handle has never been cached.
+    """
+    return _drive(_listing_steps(dataset_handle, version), _perform)
+
+def _perform(request: str, *args):
+    """Carries out a _listing_steps() request with the blocking client."""
+    if request == "search":
+        from .search import search
+        query, top = args
+        return search(query, top=top)
+    import kaggleease.client
+    client = kaggleease.client.KaggleClient()
+    if request == "list_files":
+        handle, version = args
+        return client.list_files(handle, version=version) if version is not None else client.list_files(handle)
+    return client.dataset_version(*args)
+
+def _drive(steps: Generator, perform: Callable):
+    """
+    Runs a step generator such as _listing_steps(): every request it yields
+    is handed to `perform(*request)` and the result sent back (or the
+    exception thrown in) until the generator returns its value.
+    """
+    reply, error = None, None
+    while True:
+        try:
+            request = steps.throw(error) if error is not None else steps.send(reply)
+        except StopIteration as done:
+            return done.value
+        reply, error = None, None
+        try:
+            reply = perform(*request)
+        except Exception as e:
+            error = e
+
+def _listing_steps(dataset_handle: str, version: Optional[int] = None) -> Generator:
+    """
+    The decisions of _get_dataset_files() with the network left out, shared
+    by the blocking and async loaders. Yields ("dataset_version", handle),
+    ("list_files", handle, version) and ("search", query, top) requests and
+    returns the (standard_files, total_size, resource_type, resolved_handle) tuple.
+    """
+    if version is not None:
+        from .metadata import offline_mode
+        if offline_mode():
+            raise NetworkError(
+                f"Offline mode is enabled and version {version} of '{dataset_handle}' is not downloaded.",
+                fix_suggestion="Load it once while online, or disable offline mode (KAGGLEEASE_OFFLINE=0)."
+            )
+        return (yield from _fetch_steps(dataset_handle, version))
+
+    store, entry, cached = _cached_listing(dataset_handle)
+    if cached is not None:
+        return cached
+    if store is None:
+        return (yield from _fetch_steps(dataset_handle))
+
+    if _needs_version_check(entry):
+        version = yield ("dataset_version", entry.resolved_handle)
+        if version is not None and version == entry.version:
+            logger.debug(f"Metadata for '{dataset_handle}' still current (version {version})")
+            store.touch(dataset_handle)
+            return _from_metadata_entry(entry)
+
+    try:
+        result = yield from _fetch_steps(dataset_handle)
+    except KaggleEaseError:
+        raise
+    except Exception as e:
+        if entry is None:
+            raise
+        logger.warning(f"Metadata refresh for '{dataset_handle}' failed ({e}). Using cached listing.")
+        return _from_metadata_entry(entry)
+
+    if version is None and result[2] == "dataset":
+        # Recorded with the listing so the first revalidation compares versions instead of re-listing
+        version = yield ("dataset_version", result[3])
+    _store_listing(store, dataset_handle, result, version)
+    return result
+
+def _is_not_found(error_msg: str) -> bool:
+    return "not found" in error_msg or "404" in error_msg or "inaccessible" in error_msg
+
+def _not_found_error(dataset_handle: str, error_msg: str, potential: Optional[List[dict]]) -> KaggleEaseError:
+    """
+    Builds the user-facing error for a handle that could not be listed,
+    with "Did you mean" suggestions taken from `potential` search results.
+    """
+    # Intelligence: Try to find what they meant
+    fix = "Check the spelling of your dataset handle or use search() to find it."
+
+    if potential:
+        # Filter out the handle itself if it's already failing
+        names = [p['handle'] for p in potential if p['handle'].lower() != dataset_handle.lower()]
+        if names:
+            fix = f"Did you mean one of these? {', '.join(names)}"
+        else:
+            fix = "This dataset might be private or require you to accept rules on the Kaggle website."
+
+    error_class = DatasetNotFoundError
+    final_msg = f"Dataset '{dataset_handle}' not found or inaccessible."
+
+    if "403" in error_msg or "access denied" in error_msg:
+        from .errors import AuthError
+        error_class = AuthError
+        final_msg = f"Access denied for dataset '{dataset_handle}'."
+        fix = "This dataset might be private or require you to accept rules on the Kaggle website."
+
+    return error_class(final_msg, fix_suggestion=fix)
+
+def _fetch_steps(dataset_handle: str, version: Optional[int] = None) -> Generator:
+    """
+    Lists a handle over the network (a step of _listing_steps()), handling
+    implicit resolution and "Did you mean" suggestions.
+    """
+    try:
+        files = yield ("list_files", dataset_handle, version)
+        return _listing_result(files, dataset_handle)
+
+    except Exception as e:
+        error_msg = str(e).lower()
+        # Implicit resolution (e.g. 'titanic' -> search or competition)
+        if '/' not in dataset_handle and ("not found" in error_msg or "404" in error_msg):
+             from .suggest import _resolution_steps
+             resolved = yield from _resolution_steps(dataset_handle)
+             if resolved:
+                 logger.info(f"Implicitly resolved '{dataset_handle}' to '{resolved}'")
+                 return (yield from _listing_steps(resolved, version))
+        
+        if _is_not_found(error_msg):
+            potential = None
+            if '/' in dataset_handle:
+                from .suggest import _suggestion_steps
+                potential = yield from _suggestion_steps(dataset_handle, top=3)
+            raise _not_found_error(dataset_handle, error_msg, potential) from e
+        raise e
+
+def _listing_result(files: List[dict], dataset_handle: str) -> Tuple[List, int, str, str]:
+    """Turns a raw client listing into the (files, total_size, type, handle) tuple."""
+    # files is a list of dicts like [{"name": "...", "size": ..., "type": "..."}]
+    resource_type = files[0].get("type", "dataset") if files else "dataset"
+    standard_files = _to_kaggle_files(files)
+
+    total_size = sum(f.size for f in standard_files)
+    return standard_files, total_size, resource_type, dataset_handle
@@ -1,21 +1,28 @@
 import os
 import re
-from typing import Tuple, List, Optional, Union
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Iterator, Tuple, List, Optional, Union
 import pandas as pd
 from pathlib import Path
 import logging
 from . import auth
-from .cache import get_dataset_path
 from .errors import (
     DataFormatError,
     DatasetNotFoundError,
-    MultipleFilesError,
     UnsupportedFormatError,
+    InsufficientMemoryError,
     KaggleEaseError,
-    NetworkError,
 )
 import kagglehub
-from .progress import check_memory_safety
+from .listing import KaggleFile, _get_dataset_files
+from .dtypes import DtypeOptimizer, read_optimized
+from .planner import plan_load, plan_optimizer, precheck, resolve_mode
+from .archives import archive_members
+from .readers import BACKENDS, TABULAR_EXTS, DEFAULT_BATCH_ROWS, is_tabular, read_file, iter_file, list_tabular_files
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
@@ -54,70 +61,6 @@ def _validate_dataset_handle(dataset_handle: str) -> None:
             f"Invalid characters in dataset handle: '{dataset_handle}'. "
             "Only alphanumeric characters, hyphens, and underscores are allowed."
         )
-def _get_dataset_files(dataset_handle: str, timeout: int = 300) -> Tuple[List, int, str, str]:
-    """
-    Finds files for a dataset handle, handles implicit resolution and competitions.
-    
-    Args:
-        dataset_handle (str): The Kaggle dataset handle or slug.
-        timeout (int): Timeout in seconds for API calls.
-
-    Returns:
-        Tuple[List, int, str, str]: (standard_files, total_size, resource_type, resolved_handle)
-    """
-    try:
-        import kaggleease.client
-        client = kaggleease.client.KaggleClient()
-        files = client.list_files(dataset_handle)
-        
-        # files is a list of dicts like [{"name": "...", "size": ..., "type": "..."}]
-        resource_type = files[0].get("type", "dataset") if files else "dataset"
-        
-        from collections import namedtuple
-        KaggleFile = namedtuple('KaggleFile', ['name', 'size', 'type'])
-        standard_files = [KaggleFile(f['name'], f['size'], f.get('type', 'dataset')) for f in files]
-        
-        total_size = sum(f.size for f in standard_files)
-        return standard_files, total_size, resource_type, dataset_handle
-
-    except Exception as e:
-        error_msg = str(e).lower()
-        # Implicit resolution (e.g. 'titanic' -> search or competition)
-        if '/' not in dataset_handle and ("not found" in error_msg or "404" in error_msg):
-             from .search import search
-             results = search(dataset_handle, top=1)
-             if results:
-                 resolved = results[0]['handle']
-                 logger.info(f"Implicitly resolved '{dataset_handle}' to '{resolved}'")
-                 return _get_dataset_files(resolved, timeout=timeout)
-        
-        if "not found" in error_msg or "404" in error_msg or "inaccessible" in error_msg:
-            # Intelligence: Try to find what they meant
-            fix = "Check the spelling of your dataset handle or use search() to find it."
-            
-            if '/' in dataset_handle:
-                from .search import search
-                owner, slug = dataset_handle.split('/')
-                potential = search(slug, top=3)
-                if potential:
-                    # Filter out the handle itself if it's already failing
-                    names = [p['handle'] for p in potential if p['handle'].lower() != dataset_handle.lower()]
-                    if names:
-                        fix = f"Did you mean one of these? {', '.join(names)}"
-                    else:
-                        fix = "This dataset might be private or require you to accept rules on the Kaggle website."
-            
-            error_class = DatasetNotFoundError
-            final_msg = f"Dataset '{dataset_handle}' not found or inaccessible."
-            
-            if "403" in error_msg or "access denied" in error_msg:
-                from .errors import AuthError
-                error_class = AuthError
-                final_msg = f"Access denied for dataset '{dataset_handle}'."
-                fix = "This dataset might be private or require you to accept rules on the Kaggle website."
-            
-            raise error_class(final_msg, fix_suggestion=fix) from e
-        raise e
 
 def _resolve_file_path(files: List, dataset_handle: str, file_name: Optional[str] = None) -> str:
     """
@@ -150,13 +93,12 @@ def _resolve_file_path(files: List, dataset_handle: str, file_name: Optional[str
             )
 
     # Case 2: Auto-resolution
-    supported_exts = (".csv", ".parquet", ".json", ".xlsx", ".xls", ".sqlite", ".db")
-    supported_files = [f for f in file_names if f.lower().endswith(supported_exts)]
+    supported_files = list_tabular_files(file_names)
 
     if not supported_files:
         from .errors import UnsupportedFormatError
         raise UnsupportedFormatError(
-            "No supported tabular files found (CSV, Parquet, JSON, Excel, or SQLite).\n"
+            "No supported tabular files found (CSV, Parquet, Arrow/Feather, JSON, Excel, or SQLite).\n"
             f"Available files: {', '.join(file_names)}"
         )
 
@@ -165,28 +107,112 @@ def _resolve_file_path(files: List, dataset_handle: str, file_name: Optional[str
         raise MultipleFilesError(
             "Multiple supported files found. Please specify which one to load.\n"
             f"Found: {', '.join(supported_files[:10])}{'...' if len(supported_files) > 10 else ''}\n"
-            f'Fix: load("{dataset_handle}", file="{supported_files[0]}")'
+            f'Fix: load("{dataset_handle}", file="{supported_files[0]}"), '
+            f'or load("{dataset_handle}", files="*{os.path.splitext(supported_files[0])[1]}") to combine them'
         )
 
     return supported_files[0]
 
-def load(dataset_handle: str, file: Optional[str] = None, timeout: int = 300, **kwargs) -> Union[pd.DataFrame, str]:
+def load(
+    dataset_handle: str,
+    file: Optional[str] = None,
+    timeout: int = 300,
+    stream: bool = False,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    engine: str = "pandas",
+    dtype_backend: Optional[str] = None,
+    columnar_cache: Optional[bool] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List] = None,
+    version: Optional[int] = None,
+    cache_first: Optional[bool] = None,
+    revalidate: bool = True,
+    files: Optional[Union[str, List[str]]] = None,
+    combine: str = "concat",
+    source_column: Optional[str] = None,
+    schema: str = "union",
+    parse_workers: Optional[int] = None,
+    memory_plan: Optional[str] = None,
+    optimize_dtypes: bool = False,
+    download_all: bool = False,
+    **kwargs,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame], "pa.Table", "pa.RecordBatchReader", str]:
     """
     The universal gateway to load Kaggle data into memory or disk.
     
     This function handles authentication, dataset resolution, downloads, 
-    and automatic loading of various tabular formats (CSV, Parquet, JSON, Excel, SQLite).
+    and automatic loading of various tabular formats (CSV, Parquet, Arrow/Feather, JSON, Excel, SQLite).
     
     Args:
         dataset_handle (str): The Kaggle dataset handle (e.g., 'owner/slug') or slug (e.g., 'titanic').
         file (str, optional): Specific filename to load. If omitted, KaggleEase auto-resolves the best file.
         timeout (int): Max time in seconds for the download operation. Default is 300s.
+        stream (bool): Return an iterator of DataFrames instead of one DataFrame.
+                       CSV, Parquet (row groups), Arrow/Feather (record batches), JSON Lines
+                       and SQLite (cursor paging) are read with bounded memory. Plain Parquet
+                       and Arrow/Feather files are memory-mapped, so processes loading the
+                       same cached file share its pages.
+        batch_rows (int): Maximum rows per DataFrame when streaming.
+        engine (str): "pandas" (default) or "arrow". The Arrow engine parses CSV with
+                      pyarrow's multithreaded reader and Parquet with pyarrow.parquet and
+                      returns a pyarrow.Table (a RecordBatchReader with stream=True),
+                      never converting to pandas. Pandas parser engines such as "c",
+                      "python" or "pyarrow" are passed through to the pandas reader.
+        dtype_backend (str, optional): pandas dtype backend, e.g. "pyarrow" for
+                      Arrow-backed columns (CSV is then parsed by the pyarrow parser).
+        columnar_cache (bool, optional): Keep a memory-mappable Arrow IPC copy of parsed
+                      CSV/JSON/Excel files and read it on later loads. Invalidated when the
+                      source size, mtime, dataset version or reader options change.
+                      Defaults to KAGGLEEASE_COLUMNAR_CACHE (off).
+        columns (List[str], optional): Only read these columns. Pushed down to Parquet
+                      column pruning, CSV/Excel `usecols` and the SQLite SELECT list.
+        filters (List, optional): Row filters as (column, op, value) tuples (AND-ed),
+                      or a list of such lists (OR-ed). Ops: ==, !=, <, <=, >, >=, in,
+                      not in. Pushed down to Parquet row-group pruning and SQLite WHERE;
+                      CSV is filtered chunk by chunk while parsing.
+        version (int, optional): Dataset version to load. Defaults to the latest.
+        cache_first (bool, optional): If the handle (and version) is already downloaded,
+                      pick the file from the local directory and read it immediately,
+                      skipping authentication and the metadata round-trip. Defaults to
+                      KAGGLEEASE_CACHE_FIRST, and is always on in offline mode.
+        revalidate (bool): On a cache-first hit, refresh metadata on a background
+                      thread (and log if a newer version exists). Set False to skip.
+        files (str or List[str], optional): Glob pattern(s) such as "train/*.csv" selecting
+                      several files (e.g. part-0001.csv ... part-0200.csv). They are parsed
+                      in parallel on a process pool and combined.
+        combine (str): With `files`: "concat" (default) returns one DataFrame/Table,
+                      "dict" returns {file name: DataFrame}.
+        source_column (str, optional): With `files`: add a column holding each row's
+                      source file name.
+        schema (str): With `files`: "union" (default) fills columns missing from a file
+                      with nulls, "intersection" keeps only shared columns, "strict"
+                      raises DataFormatError when files disagree.
+        parse_workers (int, optional): With `files`: parser processes. Defaults to all cores.
+        memory_plan (str, optional): How to guard against running out of memory. "auto"
+                      (default, or KAGGLEEASE_MEMORY_PLAN) samples the downloaded file,
+                      estimates its in-memory size and loads it as is, with downcast
+                      numerics, or additionally with categorical strings, whichever first
+                      fits in half the available RAM; otherwise raises
+                      InsufficientMemoryError with the plan. "stream" returns a chunk
+                      iterator instead of raising. "warn" only logs a warning based on the
+                      download size (the old behaviour); "off" disables the check.
+        optimize_dtypes (bool): Shrink the DataFrame while reading it: downcast numerics,
+                      nullable integers for whole-number columns with gaps, category for
+                      low-cardinality strings, pyarrow-backed strings for the rest, and
+                      datetimes for ISO-8601 date columns. Decisions are made on the first
+                      chunk and kept for every chunk; a numeric column only widens when a
+                      chunk does not fit, and with stream=True integers are always nullable.
+                      The memory saved is logged and stored in df.attrs["dtype_report"].
+        download_all (bool): Download the whole dataset or competition. By default only
+                      the file being read (or the files matching `files`) is fetched,
+                      unless the listing cannot tell which file that will be.
         **kwargs: Additional arguments passed to the underlying pandas read function 
-                  (e.g., `chunksize=1000`, `index_col=0`).
+                  (e.g., `index_col=0`).
 
     Returns:
-        Union[pd.DataFrame, str]: A pandas DataFrame if a supported tabular file is found,
-                                 otherwise the local directory path string.
+        A pandas DataFrame (or an iterator of DataFrames with stream=True), or with
+        engine="arrow" a pyarrow.Table (or RecordBatchReader), if a supported tabular
+        file is found; otherwise the local directory path string.
 
     Raises:
         DatasetNotFoundError: If the repository handle is invalid or not reachable.
@@ -197,105 +223,521 @@ def load(dataset_handle: str, file: Optional[str] = None, timeout: int = 300, **
     Example:
         >>> df = load("titanic")
         >>> df_custom = load("user/data", file="raw.csv", index_col="id")
+        >>> for chunk in load("user/big-data", stream=True, batch_rows=50_000):
+        ...     process(chunk)
+        >>> table = load("user/wide-data", engine="arrow")
+        >>> df = load("user/big", columns=["id", "price"], filters=[("price", ">", 100)])
+        >>> df = load("user/sharded", files="train/*.csv", source_column="source")
     """
-    auth.setup_auth()
-    
-    # 1. Resolve files, resource type, and resolved handle
-    files, total_size, res_type, resolved_handle = _get_dataset_files(dataset_handle, timeout=timeout)
-    
-    # Check memory safety
-    from .progress import check_memory_safety
-    check_memory_safety(total_size)
+    backend = _normalize_engine(engine, kwargs)
+    if files is not None:
+        if stream:
+            raise ValueError("stream=True cannot be combined with files=; stream each file separately.")
+        from .combine import check_modes
+        check_modes(combine, schema)
+    resolve_mode(memory_plan)
+    if dtype_backend is not None:
+        kwargs["dtype_backend"] = dtype_backend
+
+    # 0. Cache-first: serve a completed local download without touching the network
+    local = _cache_first_listing(dataset_handle, version, file, cache_first, revalidate)
+
+    path = None
+    if local is not None:
+        path, listing, res_type, resolved_handle = local
+    else:
+        auth.setup_auth()
+
+        # 1. Resolve files, resource type, and resolved handle
+        listing, total_size, res_type, resolved_handle = _get_dataset_files(dataset_handle, timeout=timeout, version=version)
+
+        # Check memory safety (streaming keeps memory bounded by batch_rows)
+        if not stream:
+            precheck(_selected_size(listing, total_size, files), memory_plan)
 
     # 2. Resolve specific file path if possible
+    selected_file, is_obscured, needed = _selection(listing, res_type, dataset_handle, file, files, download_all)
+
+    # 3. Download only the needed file(s), unless the whole dataset is requested
+    try:
+        if path is None:
+            path = _download(resolved_handle, res_type, version=version, files=needed)
+
+        # 4. Read the selected file (late resolution / fallback scan), or the matching files
+        return _read_download(
+            path,
+            dataset_handle,
+            file,
+            selected_file,
+            is_obscured,
+            files=files,
+            combine=combine,
+            source_column=source_column,
+            schema=schema,
+            parse_workers=parse_workers,
+            stream=stream,
+            batch_rows=batch_rows,
+            backend=backend,
+            columnar_cache=columnar_cache,
+            memory_plan=memory_plan,
+            optimize_dtypes=optimize_dtypes,
+            columns=columns,
+            filters=filters,
+            **kwargs,
+        )
+
+    except Exception as e:
+        if isinstance(e, KaggleEaseError):
+            raise e
+        # Final fallback: return the path instead of crashing
+        if path is None:
+            raise KaggleEaseError(f"An error occurred while loading: {e}") from e
+        logger.error(f"Load failed: {e}. Returning path as fallback.")
+        return path
+
+def _cache_first_listing(dataset_handle: str, version: Optional[int], file: Optional[str],
+                         cache_first: Optional[bool], revalidate: bool):
+    """
+    load()'s cache-first step: a completed local download, found without any
+    network call (metadata is refreshed in the background when `revalidate`).
+
+    Returns:
+        tuple: (path, listing, resource_type, resolved_handle), or None to go online.
+    """
+    if not (cache_first if cache_first is not None else _cache_first_default()):
+        return None
+    local = _resolve_from_local_cache(dataset_handle, version, file)
+    if local is None:
+        return None
+    path, res_type, resolved_handle, local_version = local
+    logger.debug(f"Cache-first hit for '{dataset_handle}' at {path}")
+    from .eviction import record_access
+    record_access(resolved_handle, res_type)
+    if revalidate:
+        _revalidate_in_background(dataset_handle, resolved_handle, res_type, local_version)
+    return path, _local_listing(path, res_type), res_type, resolved_handle
+
+def _selected_size(listing: List, total_size: int, files: Optional[Union[str, List[str]]]) -> int:
+    """Listed size of what a load reads: the files matching `files`, else the whole listing."""
+    if files is not None:
+        from .combine import match_files
+        matched = set(match_files([f.name for f in listing], files))
+        if matched:
+            return sum(f.size for f in listing if f.name in matched)
+    return total_size
+
+def _selection(listing: List, res_type: str, dataset_handle: str, file: Optional[str],
+               files: Optional[Union[str, List[str]]], download_all: bool) -> Tuple[Optional[str], bool, Optional[List[str]]]:
+    """What a load reads and downloads: (selected_file, is_obscured, files to fetch)."""
+    if files is not None:
+        return None, False, _files_to_fetch(listing, patterns=files, download_all=download_all)
+    selected_file, is_obscured = _select_file(listing, res_type, dataset_handle, file)
+    return selected_file, is_obscured, _files_to_fetch(listing, selected_file, is_obscured, download_all=download_all)
+
+def _read_download(path: str, dataset_handle: str, file: Optional[str], selected_file: Optional[str],
+                   is_obscured: bool, files: Optional[Union[str, List[str]]] = None, combine: str = "concat",
+                   source_column: Optional[str] = None, schema: str = "union", parse_workers: Optional[int] = None,
+                   read_local=None, **kwargs):
+    """
+    load()'s read step on a download: the files matching `files`, else the
+    selected (or late-resolved) file, else the directory path itself.
+    `read_local` replaces _read_local, e.g. to parse on another executor.
+    """
+    if files is not None:
+        kwargs.pop("stream", None)
+        return _read_matching(
+            path,
+            files,
+            dataset_handle,
+            combine=combine,
+            source_column=source_column,
+            schema=schema,
+            parse_workers=parse_workers,
+            **kwargs,
+        )
+
+    full_selected_path = _locate_file(path, file, selected_file, is_obscured)
+    if full_selected_path is None:
+        if kwargs.get("stream"):
+            raise UnsupportedFormatError(f"No tabular data found in '{dataset_handle}' to stream.")
+        logger.info(f"ℹ️ No tabular data found in '{dataset_handle}'. Returning directory path.")
+        return path
+    return (read_local or _read_local)(full_selected_path, **kwargs)
+
+def _read_matching(path: str, patterns: Union[str, List[str]], dataset_handle: str, combine: str = "concat",
+                   source_column: Optional[str] = None, schema: str = "union",
+                   parse_workers: Optional[int] = None, backend: str = "pandas", **kwargs):
+    """Glob-matches files in a download and reads them in parallel (load(files=...))."""
+    from .combine import match_files, read_many, scan_files
+
+    # Each shard is planned on its own; shards must come back as frames
+    if resolve_mode(kwargs.get("memory_plan")) == "stream":
+        kwargs["memory_plan"] = "auto"
+
+    names = match_files(scan_files(path), patterns)
+    if not names:
+        raise DataFormatError(
+            f"No tabular files in '{dataset_handle}' match {patterns!r}.",
+            fix_suggestion="Patterns are matched against paths relative to the dataset root, e.g. 'train/*.csv'."
+        )
+    return read_many(
+        path,
+        names,
+        _read_local,
+        backend=backend,
+        combine=combine,
+        source_column=source_column,
+        schema=schema,
+        parse_workers=parse_workers,
+        **kwargs,
+    )
+
+CACHE_FIRST_ENV = "KAGGLEEASE_CACHE_FIRST"
+
+def _cache_first_default() -> bool:
+    """Cache-first is on when KAGGLEEASE_CACHE_FIRST is set or in offline mode."""
+    from .metadata import offline_mode
+    if os.environ.get(CACHE_FIRST_ENV, "").strip().lower() in ("1", "true", "yes", "on"):
+        return True
+    return offline_mode()
+
+def _resolve_from_local_cache(dataset_handle: str, version: Optional[int], file: Optional[str]):
+    """
+    Finds a completed kagglehub download for a handle using only local state.
+    Bare slugs are tried as competitions, then through the resolved handle
+    recorded in the metadata cache.
+
+    Returns:
+        tuple: (path, resource_type, resolved_handle, version) or None.
+    """
+    from .cache import find_cached_download
+
+    handle = dataset_handle.strip().strip('/')
+    found = find_cached_download(handle, version=version, file_path=file)
+    resolved_handle = handle
+    if found is None and '/' not in handle:
+        from .metadata import cache_enabled, get_metadata_cache
+        entry = get_metadata_cache().get(handle) if cache_enabled() else None
+        if entry is not None and entry.resolved_handle.lower() != handle.lower():
+            resolved_handle = entry.resolved_handle
+            found = find_cached_download(resolved_handle, version=version, file_path=file)
+    if found is None:
+        return None
+    path, res_type, local_version = found
+    return str(path), res_type, resolved_handle, local_version
+
+def _local_listing(path: str, res_type: str) -> List[KaggleFile]:
+    """Builds a KaggleFile listing from a local download directory."""
+    files = []
+    for root, _, fs in os.walk(path):
+        for f in fs:
+            full = os.path.join(root, f)
+            try:
+                size = os.path.getsize(full)
+            except OSError:
+                size = 0
+            files.append(KaggleFile(os.path.relpath(full, path).replace(os.sep, '/'), size, res_type))
+    return files
+
+# Handles with a background revalidation in flight
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+def _revalidate_in_background(dataset_handle: str, resolved_handle: str, res_type: str, local_version: Optional[int]) -> None:
+    """
+    Refreshes the metadata cache for a handle on a daemon thread and logs when
+    a newer dataset version than the local copy is available. Nothing is done
+    while the cached listing is fresh, and at most one refresh per handle runs
+    at a time.
+    """
+    from .metadata import cache_enabled, get_metadata_cache, offline_mode
+    if offline_mode():
+        return
+    store = get_metadata_cache() if cache_enabled() else None
+    entry = store.get(dataset_handle) if store is not None else None
+    if entry is not None and store.is_fresh(entry):
+        return
+
+    key = dataset_handle.strip().strip('/').lower()
+    with _revalidating_lock:
+        if key in _revalidating:
+            return
+        _revalidating.add(key)
+
+    def _revalidate():
+        try:
+            auth.setup_auth()
+            _get_dataset_files(dataset_handle)
+            if res_type == "dataset" and local_version is not None:
+                refreshed = store.get(dataset_handle) if store is not None else None
+                latest = refreshed.version if refreshed is not None else None
+                if latest is None:
+                    import kaggleease.client
+                    latest = kaggleease.client.KaggleClient().dataset_version(resolved_handle)
+                if latest is not None and latest > local_version:
+                    logger.info(
+                        f"A newer version of '{resolved_handle}' is available (v{latest}, cached v{local_version}). "
+                        "Pass cache_first=False to download it."
+                    )
+        except Exception as e:
+            logger.debug(f"Background revalidation of '{dataset_handle}' failed: {e}")
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(key)
+
+    threading.Thread(target=_revalidate, name="kaggleease-revalidate", daemon=True).start()
+
+def _read_local(
+    full_selected_path: str,
+    stream: bool = False,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    backend: str = "pandas",
+    columnar_cache: Optional[bool] = None,
+    memory_plan: Optional[str] = None,
+    optimize_dtypes: bool = False,
+    **kwargs,
+):
+    """Reads a downloaded file with load()'s reader options applied."""
+    if optimize_dtypes and backend != "pandas":
+        logger.warning("optimize_dtypes only applies to pandas results; ignoring it for engine='arrow'.")
+        optimize_dtypes = False
+
+    if stream:
+        chunks = iter_file(full_selected_path, batch_rows=batch_rows, backend=backend, **kwargs)
+        return DtypeOptimizer(nullable_integers=True).iter(chunks) if optimize_dtypes else chunks
+
+    mode = resolve_mode(memory_plan)
+    plan = None
+    if mode in ("auto", "stream"):
+        plan = plan_load(
+            full_selected_path,
+            stream_fallback=(mode == "stream"),
+            optimizable=(backend == "pandas"),
+            **kwargs,
+        )
+        if plan.strategy != "full":
+            logger.info(str(plan))
+        if plan.strategy == "refuse":
+            raise InsufficientMemoryError(
+                f"Loading {os.path.basename(full_selected_path)} is estimated to need more memory "
+                f"than is available, even with smaller dtypes.\n{plan}"
+            )
+        if plan.strategy == "stream":
+            logger.warning(f"{os.path.basename(full_selected_path)} does not fit in memory; returning a chunk iterator.")
+            return _read_local(full_selected_path, stream=True, batch_rows=batch_rows, backend=backend,
+                               optimize_dtypes=optimize_dtypes, **kwargs)
+
+    if optimize_dtypes:
+        return read_optimized(full_selected_path, DtypeOptimizer(), batch_rows=batch_rows, **kwargs)
+    if plan is not None and plan.strategy in ("downcast", "categorical"):
+        return read_optimized(full_selected_path, plan_optimizer(plan), batch_rows=batch_rows, **kwargs)
+
+    from .columnar import columnar_cache_enabled, read_with_columnar_cache
+    if columnar_cache if columnar_cache is not None else columnar_cache_enabled():
+        return read_with_columnar_cache(full_selected_path, backend=backend, **kwargs)
+    return read_file(full_selected_path, backend=backend, **kwargs)
+
+def _pop_read_options(kwargs: dict) -> dict:
+    """
+    Splits load()-level reader options out of **kwargs (in place) for callers
+    that forward everything through kwargs, such as aload() and load_many().
+    """
+    options = {"backend": _normalize_engine(kwargs.pop("engine", "pandas"), kwargs)}
+    if kwargs.get("dtype_backend") is None:
+        kwargs.pop("dtype_backend", None)
+    for name in ("columnar_cache", "memory_plan", "optimize_dtypes"):
+        if name in kwargs:
+            options[name] = kwargs.pop(name)
+    return options
+
+# load() options that decide what is fetched and combined, with their defaults
+LOAD_OPTIONS = {
+    "version": None,
+    "cache_first": None,
+    "revalidate": True,
+    "files": None,
+    "combine": "concat",
+    "source_column": None,
+    "schema": "union",
+    "parse_workers": None,
+    "download_all": False,
+}
+
+def _pop_load_options(kwargs: dict) -> dict:
+    """
+    Splits load()'s fetch options (LOAD_OPTIONS) out of **kwargs (in place),
+    validated as load() validates them, for aload() and load_many().
+    """
+    options = {name: kwargs.pop(name, default) for name, default in LOAD_OPTIONS.items()}
+    if options["files"] is not None:
+        if kwargs.get("stream"):
+            raise ValueError("stream=True cannot be combined with files=; stream each file separately.")
+        from .combine import check_modes
+        check_modes(options["combine"], options["schema"])
+    return options
+
+def _normalize_engine(engine: str, kwargs: dict) -> str:
+    """
+    Maps load()'s `engine` to a result backend. Any other name is a pandas
+    reader engine ("c", "pyarrow", "openpyxl", "odf", "calamine"...) and is
+    kept as a reader kwarg for backward compatibility.
+    """
+    if not isinstance(engine, str):
+        raise ValueError(f"engine must be one of {BACKENDS} or a pandas reader engine name, got {engine!r}")
+    if engine in BACKENDS:
+        return engine
+    kwargs["engine"] = engine
+    return "pandas"
+
+def _select_file(files: List, res_type: str, dataset_handle: str, file: Optional[str]) -> Tuple[Optional[str], bool]:
+    """
+    Picks the file to load from the metadata listing.
+
+    Returns:
+        Tuple[Optional[str], bool]: (selected_file, is_obscured). When is_obscured
+        is True the file must be resolved after download by scanning the directory.
+    """
     is_obscured = any("__AUTO_RESOLVE_" in f.name for f in files)
     
     selected_file = file
     if not is_obscured:
         try:
-             # This filters for CSV/Parquet/JSON/Excel/SQLite
+             # This filters for CSV/Parquet/Arrow/JSON/Excel/SQLite
              selected_file = _resolve_file_path(files, dataset_handle, file)
         except Exception:
-             # If resolution fails but it's a competition or obscured, we swap to late-res
-             if res_type == "competition":
-                 is_obscured = True 
-             else:
-                 # If no tabular files found in metadata, we might want to just download and return path
-                 is_obscured = True
-
-    # 3. Download via KaggleHub
-    # import kagglehub (Moved to top-level)
-    try:
-        if res_type == "competition":
-            comp_slug = resolved_handle.split('/')[-1]
-            path = kagglehub.competition_download(comp_slug)
-        else:
-            path = kagglehub.dataset_download(resolved_handle)
-            
-        # 4. Late Resolution / Fallback SCAN
-        # Supported extensions for auto-loading
-        tabular_exts = ('.csv', '.parquet', '.json', '.xlsx', '.xls', '.sqlite', '.db')
-        
-        if is_obscured or not selected_file:
-            available_files = []
-            for root, _, fs in os.walk(path):
-                for f in fs:
-                    if f.lower().endswith(tabular_exts):
-                        available_files.append(os.path.join(root, f))
-            
-            if not available_files:
-                 logger.info(f"ℹ️ No tabular data found in '{dataset_handle}'. Returning directory path.")
-                 return path
-                 
-            # If multiple, prefer the one matching 'file' if provided
-            if file:
-                matches = [f for f in available_files if file.lower() in f.lower()]
-                full_selected_path = matches[0] if matches else available_files[0]
-            else:
-                full_selected_path = available_files[0]
-        else:
-            # Standard path construction
-            if os.path.isabs(selected_file):
-                full_selected_path = selected_file
+             # If resolution fails (competition, no tabular files in metadata, ambiguity)
+             # we swap to late resolution after the download
+             is_obscured = True
+    return selected_file, is_obscured
+
+def _files_to_fetch(listing: List, selected_file: Optional[str] = None, is_obscured: bool = False,
+                    patterns: Optional[Union[str, List[str]]] = None, download_all: bool = False) -> Optional[List[str]]:
+    """
+    The files a load actually needs, so only those are downloaded. Returns None
+    when the whole dataset has to be fetched: on request, or when the listing
+    cannot tell which file will be read (obscured or auto-resolved names).
+    """
+    if download_all or any("__AUTO_RESOLVE_" in f.name for f in listing):
+        return None
+    if patterns is not None:
+        from .combine import match_files
+        return match_files([f.name for f in listing], patterns) or None
+    if is_obscured or not selected_file or os.path.isabs(selected_file):
+        return None
+    return [selected_file]
+
+def _download(resolved_handle: str, res_type: str, version: Optional[int] = None,
+              files: Optional[List[str]] = None) -> str:
+    """
+    Downloads (or reuses from cache) a dataset or competition. With `files`
+    only those files are fetched. Either way the download root is returned,
+    and dataset-relative names resolve under it.
+
+    Each file (or the whole download) is single-flight across processes and
+    threads: one caller downloads while the others wait, then reuse it.
+    """
+    from .eviction import after_download
+
+    if files:
+        path = None
+        for name in files:
+            with _single_flight(resolved_handle, res_type, version, name):
+                path = _download_file(resolved_handle, res_type, name, version=version)
+    else:
+        with _single_flight(resolved_handle, res_type, version, None):
+            if res_type == "competition":
+                path = kagglehub.competition_download(resolved_handle.split('/')[-1])
+            elif version is not None:
+                path = kagglehub.dataset_download(f"{resolved_handle}/versions/{version}")
             else:
-                full_selected_path = os.path.join(path, selected_file)
+                path = kagglehub.dataset_download(resolved_handle)
+    after_download(resolved_handle, res_type)
+    return path
 
-        # 5. Load into Pandas based on extension
-        f_lower = full_selected_path.lower()
-        logger.info(f"Loading {os.path.basename(full_selected_path)}...")
-        
-        if f_lower.endswith('.csv'):
-            return pd.read_csv(full_selected_path, **kwargs)
-        elif f_lower.endswith('.parquet'):
-            return pd.read_parquet(full_selected_path, **kwargs)
-        elif f_lower.endswith('.json'):
-            return pd.read_json(full_selected_path, **kwargs)
-        elif f_lower.endswith(('.xlsx', '.xls')):
-            return pd.read_excel(full_selected_path, **kwargs)
-        elif f_lower.endswith(('.sqlite', '.db')):
-            import sqlite3
-            conn = sqlite3.connect(full_selected_path)
-            # Try to get the first table name
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            table_name = cursor.fetchone()
-            if table_name:
-                df = pd.read_sql_query(f"SELECT * FROM {table_name[0]}", conn, **kwargs)
-                conn.close()
-                return df
-            conn.close()
-            return full_selected_path # Return path if no tables found
-        else:
-            logger.warning(f"Unsupported format for auto-loading: {f_lower}. Returning path.")
-            return full_selected_path
+@contextmanager
+def _single_flight(resolved_handle: str, res_type: str, version: Optional[int], file_path: Optional[str]):
+    from .download import get_lock_timeout
+    from .errors import NetworkError
+    from .locks import download_lock
 
-    except Exception as e:
-        from .errors import DatasetNotFoundError, AuthError
-        if isinstance(e, (DatasetNotFoundError, AuthError, KaggleEaseError)):
-            raise e
-        logger.error(f"Load failed: {e}. Returning path as fallback.")
-        # Final fallback: return the path instead of crashing
+    target = f"v{version if version is not None else 'latest'}-{file_path or '*'}"
+    with ExitStack() as stack:
+        # Only waiting for the lock is translated; a TimeoutError raised by
+        # the download itself propagates unchanged
+        try:
+            stack.enter_context(download_lock(resolved_handle, res_type, target, timeout=get_lock_timeout()))
+        except TimeoutError as e:
+            raise NetworkError(
+                str(e), fix_suggestion="Another process is still downloading it; retry later or raise configure_downloads(lock_timeout=...)."
+            ) from e
+        yield
+
+def _download_file(resolved_handle: str, res_type: str, file_path: str, version: Optional[int] = None) -> str:
+    """
+    Fetches one file with the ranged download engine (resumable, parallel),
+    falling back to kagglehub's single-file download. Returns the download root.
+    """
+    from .download import fetch_file, get_downloader
+    from .errors import NetworkError
+
+    if get_downloader() == "ranged":
         try:
-            return path
-        except:
-            raise KaggleEaseError(f"An error occurred while loading: {e}")
+            local, _ = fetch_file(resolved_handle, res_type, file_path, version=version)
+            return _download_root(local, file_path)
+        except NetworkError as e:
+            logger.warning(f"Ranged download of '{file_path}' failed ({e}); retrying with kagglehub.")
+
+    if res_type == "competition":
+        local = kagglehub.competition_download(resolved_handle.split('/')[-1], path=file_path)
+    elif version is not None:
+        local = kagglehub.dataset_download(f"{resolved_handle}/versions/{version}", path=file_path)
+    else:
+        local = kagglehub.dataset_download(resolved_handle, path=file_path)
+    return _download_root(local, file_path)
+
+def _download_root(local: str, file_path: str) -> str:
+    """The directory a downloaded file's dataset-relative path starts from."""
+    local = os.path.normpath(str(local))
+    if os.path.isdir(local):
+        return local
+    relative = os.path.normpath(file_path.strip('/'))
+    if local.endswith(os.sep + relative):
+        return local[:-len(relative) - 1]
+    return os.path.dirname(local)
+
+def _scan_tabular_files(path: str) -> List[str]:
+    """
+    Recursively lists supported tabular files under a downloaded directory:
+    plain files first, then compressed files (train.csv.gz), then members of
+    archives that were never extracted (data.zip/train.csv).
+    """
+    plain, compressed, members = [], [], []
+    for root, _, fs in os.walk(path):
+        for f in fs:
+            full = os.path.join(root, f)
+            if is_tabular(f):
+                (plain if f.lower().endswith(TABULAR_EXTS) else compressed).append(full)
+            else:
+                members.extend(m for m in archive_members(full) if is_tabular(m))
+    return plain + compressed + members
+
+def _locate_file(path: str, file: Optional[str], selected_file: Optional[str], is_obscured: bool) -> Optional[str]:
+    """
+    Returns the absolute path of the file to read, or None if the download
+    contains no tabular data.
+    """
+    if is_obscured or not selected_file:
+        available_files = _scan_tabular_files(path)
+        if not available_files:
+            return None
+
+        # If multiple, prefer the one matching 'file' if provided
+        if file:
+            matches = [f for f in available_files if file.lower() in f.lower()]
+            return matches[0] if matches else available_files[0]
+        return available_files[0]
+
+    # Standard path construction
+    if os.path.isabs(selected_file):
+        return selected_file
+    return os.path.join(path, selected_file)
@@ -0,0 +1,257 @@
+import os
+import re
+import json
+import time
+import errno
+import socket
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+from .cache import get_cache_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+LOCK_DIR = "locks"
+POLL_INTERVAL = 0.05
+# Marker locks (filesystems without flock) whose owner is gone, or that are
+# older than this, are broken by the next process that wants them
+STALE_LOCK_AGE = 3600
+# A waiter logs who it is waiting for this often
+WAIT_LOG_INTERVAL = 30
+# errnos meaning "the filesystem cannot lock", as opposed to "somebody holds it"
+_UNSUPPORTED = {errno.ENOLCK, errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL}
+
+
+def _try_lock(fd: int, shared: bool = False) -> bool:
+    """
+    Takes an OS lock without blocking. Returns False when it is held
+    elsewhere; raises OSError when the filesystem does not support locks.
+    """
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+        else:
+            # No shared locks on Windows; readers exclude each other too
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError as e:
+        if e.errno in _UNSUPPORTED:
+            raise
+        return False
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _owner() -> Dict:
+    return {"pid": os.getpid(), "host": socket.gethostname(), "since": time.time()}
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "posix":
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+    try:
+        import psutil
+        return bool(psutil.pid_exists(pid))
+    except Exception:
+        return True
+
+
+def _read_owner(path: str) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            owner = json.loads(f.read() or "null")
+        return owner if isinstance(owner, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _is_stale(marker: str) -> bool:
+    """A marker lock whose owner died on this host, or that is too old."""
+    try:
+        age = time.time() - os.path.getmtime(marker)
+    except OSError:
+        return False
+    owner = _read_owner(marker)
+    if owner is None:
+        # Unreadable: being written right now, or left half-written by a crash
+        return age > 5
+    if owner.get("host") == socket.gethostname() and not _pid_alive(int(owner.get("pid", 0))):
+        return True
+    return age > STALE_LOCK_AGE
+
+
+class FileLock:
+    """
+    Lock shared by every process (and thread) using the same lock file.
+
+    It is an OS lock (flock / LockFile), so it is released when its holder
+    exits or crashes; the lock file itself is never deleted, which would let
+    two holders lock different inodes. The holder's pid and host are written
+    into it for diagnostics. With shared=True any number of shared holders
+    coexist while an exclusive holder waits (POSIX only; elsewhere shared
+    locks are exclusive).
+
+    On filesystems without OS locks (some network mounts) an O_EXCL marker
+    file next to the lock file is used instead. Markers of processes that
+    died on this host, or older than STALE_LOCK_AGE, are broken.
+
+    One instance must not be shared between threads; create one per use.
+    """
+
+    def __init__(self, path: Union[str, Path], shared: bool = False):
+        self.path = str(path)
+        self.shared = shared
+        self._fd: Optional[int] = None
+        self._marker: Optional[str] = None
+
+    @property
+    def locked(self) -> bool:
+        return self._fd is not None or self._marker is not None
+
+    def holder(self) -> Optional[Dict]:
+        """{pid, host, since} of the last exclusive holder, if recorded."""
+        return _read_owner(self._marker_path()) or _read_owner(self.path)
+
+    def _marker_path(self) -> str:
+        return f"{self.path}.owner"
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Takes the lock. Returns False if it is held elsewhere and `blocking` is
+        False, or `timeout` seconds pass first.
+        """
+        if self.locked:
+            raise RuntimeError(f"Lock {self.path} is already held by this instance.")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while not _try_lock(fd, self.shared):
+                if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                    os.close(fd)
+                    return False
+                time.sleep(POLL_INTERVAL)
+        except OSError as e:
+            os.close(fd)
+            logger.debug(f"OS locks unavailable for {self.path} ({e}); using a marker file.")
+            return self._acquire_marker(blocking, deadline)
+        self._fd = fd
+        if not self.shared:
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, json.dumps(_owner()).encode("utf-8"))
+        return True
+
+    def _acquire_marker(self, blocking: bool, deadline: Optional[float]) -> bool:
+        marker = self._marker_path()
+        while True:
+            try:
+                fd = os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if _is_stale(marker):
+                    logger.warning(f"Breaking stale lock {marker} (held by {_read_owner(marker)})")
+                    try:
+                        os.remove(marker)
+                    except FileNotFoundError:
+                        pass
+                    continue
+                if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                    return False
+                time.sleep(POLL_INTERVAL)
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(_owner()))
+            self._marker = marker
+            return True
+
+    def release(self) -> None:
+        if self._marker is not None:
+            try:
+                os.remove(self._marker)
+            except FileNotFoundError:
+                pass
+            self._marker = None
+        if self._fd is None:
+            return
+        try:
+            _unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def lock_path(name: str) -> Path:
+    """Lock file for a named resource (e.g. 'dataset-owner-slug') in KaggleEase's cache dir."""
+    safe = re.sub(r"[^A-Za-z0-9_.-]+", "-", name.strip().lower()).strip("-")
+    return get_cache_dir() / LOCK_DIR / f"{safe}.lock"
+
+
+def _entry_name(handle: str, kind: str) -> str:
+    return f"{kind}-{handle.strip('/').replace('/', '__')}"
+
+
+def entry_lock(handle: str, kind: str, shared: bool = False) -> FileLock:
+    """
+    The lock guarding one cached dataset or competition. Downloads hold it
+    shared, eviction exclusively, so nothing is evicted mid-download.
+    """
+    return FileLock(lock_path(_entry_name(handle, kind)), shared=shared)
+
+
+@contextmanager
+def download_lock(handle: str, kind: str, target: str, timeout: Optional[float] = None) -> Iterator[None]:
+    """
+    Single-flight guard for downloading `target` (a file, or the whole
+    dataset) of a dataset or competition. The first caller, in any process
+    or thread, downloads; the others wait here and then find it cached.
+
+    Raises:
+        TimeoutError: If the lock is not obtained within `timeout` seconds.
+    """
+    lock = FileLock(lock_path(f"{_entry_name(handle, kind)}-{target}"))
+    if not lock.acquire(blocking=False):
+        waited = 0.0
+        while True:
+            holder = lock.holder() or {}
+            logger.info(
+                f"Waiting for {holder.get('host', 'another process')} (pid {holder.get('pid', '?')}) "
+                f"to finish downloading {handle}..."
+            )
+            step = WAIT_LOG_INTERVAL if timeout is None else min(WAIT_LOG_INTERVAL, timeout - waited)
+            if lock.acquire(timeout=max(step, 0)):
+                break
+            waited += step
+            if timeout is not None and waited >= timeout:
+                raise TimeoutError(f"Timed out after {timeout}s waiting for the download lock of {handle}.")
+    try:
+        with entry_lock(handle, kind, shared=True):
+            yield
+    finally:
+        lock.release()
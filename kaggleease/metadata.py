@@ -0,0 +1,215 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import List, Dict, Optional, Union
+
+from .cache import get_cache_dir, is_offline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600  # 1 day
+TTL_ENV = "KAGGLEEASE_METADATA_TTL"
+DB_NAME = "metadata.sqlite"
+
+MetadataEntry = namedtuple(
+    "MetadataEntry",
+    ["handle", "resolved_handle", "resource_type", "files", "total_size", "version", "fetched_at"],
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_listings (
+    handle TEXT PRIMARY KEY,
+    resolved_handle TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    files TEXT NOT NULL,
+    total_size INTEGER NOT NULL,
+    version INTEGER,
+    fetched_at REAL NOT NULL
+)
+"""
+
+_config = {"ttl": None, "offline": None, "enabled": True}
+_config_lock = threading.Lock()
+
+
+def configure_metadata_cache(
+    ttl: Optional[float] = None,
+    offline: Optional[bool] = None,
+    enabled: Optional[bool] = None,
+) -> None:
+    """
+    Configures the persistent file-listing cache used by load().
+
+    Args:
+        ttl (float, optional): Seconds a cached listing is trusted without
+            revalidation. Defaults to KAGGLEEASE_METADATA_TTL or one day.
+        offline (bool, optional): Never touch the network; serve cached
+            listings regardless of age. Defaults to KAGGLEEASE_OFFLINE.
+        enabled (bool, optional): Set to False to bypass the cache entirely.
+    """
+    with _config_lock:
+        if ttl is not None:
+            _config["ttl"] = float(ttl)
+        if offline is not None:
+            _config["offline"] = bool(offline)
+        if enabled is not None:
+            _config["enabled"] = bool(enabled)
+
+
+def get_ttl() -> float:
+    """Returns the effective metadata TTL in seconds."""
+    if _config["ttl"] is not None:
+        return _config["ttl"]
+    try:
+        return float(os.environ.get(TTL_ENV, DEFAULT_TTL))
+    except ValueError:
+        return float(DEFAULT_TTL)
+
+
+def offline_mode() -> bool:
+    """Returns True if metadata must be served from the cache only."""
+    if _config["offline"] is not None:
+        return _config["offline"]
+    return is_offline()
+
+
+def cache_enabled() -> bool:
+    return _config["enabled"]
+
+
+class MetadataCache:
+    """
+    SQLite-backed store of dataset file listings, keyed by the handle the
+    user asked for. Safe to share between threads and processes: every
+    operation opens its own short-lived connection.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else get_cache_dir() / DB_NAME
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def _key(handle: str) -> str:
+        return handle.strip().strip("/").lower()
+
+    def get(self, handle: str) -> Optional[MetadataEntry]:
+        """Returns the cached listing for a handle, or None."""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT handle, resolved_handle, resource_type, files, total_size, version, fetched_at "
+                    "FROM file_listings WHERE handle = ?",
+                    (self._key(handle),),
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Metadata cache read failed: {e}")
+            return None
+        if not row:
+            return None
+        return MetadataEntry(row[0], row[1], row[2], json.loads(row[3]), row[4], row[5], row[6])
+
+    def put(
+        self,
+        handle: str,
+        resolved_handle: str,
+        resource_type: str,
+        files: List[Dict],
+        version: Optional[int] = None,
+    ) -> None:
+        """Stores (or replaces) the listing for a handle."""
+        total_size = sum(int(f.get("size") or 0) for f in files)
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_listings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self._key(handle), resolved_handle, resource_type, json.dumps(files),
+                     total_size, version, time.time()),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Metadata cache write failed: {e}")
+
+    def touch(self, handle: str, version: Optional[int] = None) -> None:
+        """Marks a listing as freshly validated without rewriting it."""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "UPDATE file_listings SET fetched_at = ?, version = COALESCE(?, version) WHERE handle = ?",
+                    (time.time(), version, self._key(handle)),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Metadata cache touch failed: {e}")
+
+    def invalidate(self, handle: Optional[str] = None) -> None:
+        """Drops one listing, or every listing when handle is None."""
+        try:
+            conn = self._connect()
+            try:
+                if handle is None:
+                    conn.execute("DELETE FROM file_listings")
+                else:
+                    conn.execute("DELETE FROM file_listings WHERE handle = ?", (self._key(handle),))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Metadata cache invalidation failed: {e}")
+
+    def handles(self) -> List[str]:
+        """Every handle asked for and resolved to, e.g. for typo suggestions."""
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute("SELECT handle, resolved_handle FROM file_listings").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Metadata cache read failed: {e}")
+            return []
+        return list(dict.fromkeys(h for row in rows for h in row))
+
+    @staticmethod
+    def is_fresh(entry: MetadataEntry, ttl: Optional[float] = None) -> bool:
+        ttl = get_ttl() if ttl is None else ttl
+        return (time.time() - entry.fetched_at) < ttl
+
+
+_caches: Dict[Path, MetadataCache] = {}
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Returns the MetadataCache bound to the current cache directory."""
+    path = get_cache_dir() / DB_NAME
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches.setdefault(path, MetadataCache(path))
+    return cache
+
+
+def clear_metadata_cache(handle: Optional[str] = None) -> None:
+    """Removes cached file listings (all of them if no handle is given)."""
+    get_metadata_cache().invalidate(handle)
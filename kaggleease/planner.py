@@ -0,0 +1,206 @@
+import os
+import sqlite3
+import logging
+from collections import namedtuple
+from typing import List, Optional
+
+import pandas as pd
+
+from .archives import format_name, is_packed, open_packed, seekable, uncompressed_size
+from .dtypes import DtypeOptimizer, categorical_candidates, downcast_numeric, frame_bytes, to_categorical
+from .progress import MEMORY_THRESHOLD, ProgressBar, check_memory_safety
+from .readers import (
+    ARROW_IPC_EXTS,
+    _apply_pandas,
+    _first_sqlite_table,
+    _ipc_num_rows,
+    _needed_columns,
+    _normalize_filters,
+    can_stream,
+    iter_file,
+)
+
+logger = logging.getLogger(__name__)
+
+MEMORY_PLAN_ENV = "KAGGLEEASE_MEMORY_PLAN"
+PLAN_MODES = ("auto", "stream", "warn", "off")
+SAMPLE_ROWS = 10_000
+# Used when a format cannot be sampled cheaply (plain JSON, Excel)
+EXPANSION_FACTOR = 5
+# Text/SQLite files this many times smaller than the budget skip sampling
+SAFE_EXPANSION_FACTOR = 10
+
+STRATEGIES = ("full", "downcast", "categorical", "stream", "refuse")
+
+
+class LoadPlan(namedtuple("LoadPlan", [
+    "strategy", "rows", "estimated_bytes", "downcast_bytes", "categorical_bytes",
+    "budget_bytes", "categorical_columns", "sampled",
+])):
+    """
+    Outcome of plan_load(). Sizes are estimated in-memory bytes of the full
+    result with default dtypes, after numeric downcasting, and after also
+    turning `categorical_columns` into categoricals. `budget_bytes` is the
+    share of available RAM a single load may use.
+    """
+
+    def __str__(self) -> str:
+        fmt = ProgressBar._format_bytes
+        lines = [
+            f"Memory plan: {self.strategy}",
+            f"  rows (estimated):      {self.rows:,}" + ("" if self.sampled else " (from file size)"),
+            f"  default dtypes:        {fmt(self.estimated_bytes)}",
+            f"  downcast numerics:     {fmt(self.downcast_bytes)}",
+            f"  + categorical strings: {fmt(self.categorical_bytes)}",
+            f"  budget:                {fmt(self.budget_bytes)}",
+        ]
+        return "\n".join(lines)
+
+
+def resolve_mode(memory_plan: Optional[str]) -> str:
+    """load()'s memory_plan argument, defaulting to KAGGLEEASE_MEMORY_PLAN or "auto"."""
+    mode = memory_plan or os.environ.get(MEMORY_PLAN_ENV, "").strip().lower() or "auto"
+    if mode not in PLAN_MODES:
+        raise ValueError(f"memory_plan must be one of {PLAN_MODES}, got {mode!r}")
+    return mode
+
+
+def available_memory() -> Optional[int]:
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except Exception as e:
+        logger.debug(f"Could not read available memory: {e}")
+        return None
+
+
+def precheck(total_size: int, memory_plan: Optional[str] = None) -> None:
+    """
+    Pre-download check on the listed (on-disk) size. Only the legacy "warn"
+    mode acts on it; the planner itself runs once the file is local.
+    """
+    if resolve_mode(memory_plan) == "warn":
+        check_memory_safety(total_size)
+
+
+def _sample(path: str, sample_rows: int, columns, dnf, **kwargs) -> Optional[pd.DataFrame]:
+    """First `sample_rows` rows (unfiltered, projected to the needed columns)."""
+    if not can_stream(path):
+        return None
+    chunks = iter_file(path, batch_rows=sample_rows, columns=_needed_columns(columns, dnf), **kwargs)
+    try:
+        return next(chunks, None)
+    finally:
+        chunks.close()
+
+
+def _count_rows(path: str, sample_len: int) -> int:
+    """Row count from metadata where the format has it, else from bytes per line."""
+    f_lower = format_name(path)
+    if f_lower.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(seekable(path), memory_map=not is_packed(path)).metadata.num_rows
+    if f_lower.endswith(ARROW_IPC_EXTS):
+        return _ipc_num_rows(path)
+    if f_lower.endswith(('.sqlite', '.db')):
+        if is_packed(path):
+            return sample_len
+        conn = sqlite3.connect(path)
+        try:
+            table = _first_sqlite_table(conn)
+            return conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] if table else 0
+        finally:
+            conn.close()
+
+    # Text formats: average line length of the sampled rows (plus a CSV header)
+    lines = sample_len + (1 if f_lower.endswith('.csv') else 0)
+    sampled_bytes = 0
+    with open_packed(path) as f:
+        for _ in range(lines):
+            line = f.readline()
+            if not line:
+                break
+            sampled_bytes += len(line)
+    if not sampled_bytes:
+        return sample_len
+    return max(sample_len, int(uncompressed_size(path) / (sampled_bytes / lines)))
+
+
+def plan_load(
+    path: str,
+    budget_bytes: Optional[int] = None,
+    sample_rows: int = SAMPLE_ROWS,
+    stream_fallback: bool = False,
+    optimizable: bool = True,
+    columns: Optional[List[str]] = None,
+    filters=None,
+    **kwargs,
+) -> LoadPlan:
+    """
+    Estimates the in-memory size of loading `path` and picks a strategy.
+
+    The first `sample_rows` rows are parsed to measure bytes per row with
+    default dtypes, after downcasting numerics, and after converting
+    low-cardinality strings to categoricals. That is scaled by the row count
+    (from Parquet/SQLite metadata, or file size / bytes per line for text),
+    and by the share of sampled rows that pass `filters`. The first strategy
+    that fits the budget wins: "full", "downcast", "categorical"; otherwise
+    "stream" when stream_fallback is set, else "refuse".
+
+    Args:
+        path (str): Local file.
+        budget_bytes (int, optional): Defaults to MEMORY_THRESHOLD of available RAM.
+        sample_rows (int): Rows to parse for the estimate.
+        stream_fallback (bool): Choose "stream" instead of "refuse".
+        optimizable (bool): Whether dtype strategies can be applied (pandas results).
+        columns, filters, **kwargs: The reader options of the actual load.
+    """
+    if budget_bytes is None:
+        available = available_memory()
+        budget_bytes = int(available * MEMORY_THRESHOLD) if available else None
+
+    # Compressed files and archive members are sized by what they inflate to
+    file_size = uncompressed_size(path)
+    if budget_bytes is None or (
+        not format_name(path).endswith('.parquet') and file_size * SAFE_EXPANSION_FACTOR <= budget_bytes
+    ):
+        estimated = file_size * EXPANSION_FACTOR
+        return LoadPlan("full", 0, estimated, estimated, estimated, budget_bytes or 0, [], False)
+
+    dnf = _normalize_filters(filters)
+    sample = _sample(path, sample_rows, columns, dnf, **kwargs)
+
+    if sample is None or not len(sample):
+        estimated = file_size * EXPANSION_FACTOR
+        rows, sampled, downcast_bytes, categorical_bytes, categorical = 0, False, estimated, estimated, []
+    else:
+        rows = len(sample) if len(sample) < sample_rows else _count_rows(path, len(sample))
+        if dnf:
+            rows = int(rows * len(_apply_pandas(sample, None, dnf)) / len(sample))
+        if columns is not None:
+            sample = sample[[c for c in columns if c in sample.columns]]
+        scale = rows / len(sample)
+        estimated = int(frame_bytes(sample) * scale)
+        optimized = downcast_numeric(sample.copy())
+        downcast_bytes = int(frame_bytes(optimized) * scale)
+        categorical = categorical_candidates(optimized)
+        categorical_bytes = int(frame_bytes(to_categorical(optimized, categorical)) * scale)
+        sampled = True
+
+    def plan(strategy):
+        return LoadPlan(strategy, rows, estimated, downcast_bytes, categorical_bytes,
+                        budget_bytes, categorical, sampled)
+
+    if estimated <= budget_bytes:
+        return plan("full")
+    if optimizable and downcast_bytes <= budget_bytes:
+        return plan("downcast")
+    if optimizable and categorical_bytes <= budget_bytes:
+        return plan("categorical")
+    return plan("stream" if stream_fallback else "refuse")
+
+
+def plan_optimizer(plan: LoadPlan) -> DtypeOptimizer:
+    """The dtype changes a "downcast" or "categorical" plan was estimated with."""
+    categorical = plan.categorical_columns if plan.strategy == "categorical" else []
+    return DtypeOptimizer(categorical_columns=categorical, strings=False, dates=False)
@@ -1,10 +1,6 @@
 import sys
 import logging
 from typing import Optional
-try:
-    import psutil
-except ImportError:
-    psutil = None
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +66,11 @@ def check_memory_safety(file_size_bytes: int):
     Check if the file size is safe to load into memory based on available RAM.
     Warns the user if the file size exceeds 50% of available memory.
     """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
     if psutil:
         try:
             available_ram = psutil.virtual_memory().available
@@ -0,0 +1,803 @@
+import io
+import os
+import json
+import logging
+import sqlite3
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .archives import as_local_file, format_name, is_packed, open_packed, seekable
+from .errors import DataFormatError, UnsupportedFormatError
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Supported extensions for auto-loading
+TABULAR_EXTS = ('.csv', '.parquet', '.feather', '.arrow', '.ipc', '.json', '.jsonl', '.ndjson', '.xlsx', '.xls', '.sqlite', '.db')
+JSON_LINES_EXTS = ('.jsonl', '.ndjson')
+# Arrow IPC (file or stream format) and Feather, read through memory maps
+ARROW_IPC_EXTS = ('.feather', '.arrow', '.ipc')
+
+# Default rows per DataFrame when streaming
+DEFAULT_BATCH_ROWS = 100_000
+# Chunks iter_arrow() reads ahead to type columns that start out all null
+SCHEMA_LOOKAHEAD = 16
+
+# Result backends for load(engine=...)
+BACKENDS = ("pandas", "arrow")
+
+# Options of pyarrow's Table/RecordBatch.to_pandas(), accepted as reader kwargs
+# for the formats converted from Arrow (Parquet streams, Arrow IPC/Feather)
+TO_PANDAS_OPTIONS = (
+    "types_mapper", "use_threads", "split_blocks", "self_destruct", "date_as_object",
+    "timestamp_as_object", "strings_to_categorical", "categories", "integer_object_nulls",
+    "zero_copy_only", "deduplicate_objects", "ignore_metadata", "coerce_temporal_nanoseconds",
+    "maps_as_pydicts",
+)
+
+
+def _is_json_lines(path: str) -> bool:
+    """
+    True for .jsonl/.ndjson files, or .json files whose first two non-blank
+    lines are each a complete JSON document.
+    """
+    if format_name(path).endswith(JSON_LINES_EXTS):
+        return True
+    try:
+        with _opened(path, text=True) as src, _as_text(src) as f:
+            lines = []
+            for line in f:
+                if line.strip():
+                    lines.append(line)
+                if len(lines) == 2:
+                    break
+        if len(lines) < 2 or not lines[0].lstrip().startswith("{"):
+            return False
+        for line in lines:
+            json.loads(line)
+        return True
+    except (OSError, ValueError, DataFormatError):
+        return False
+
+
+@contextmanager
+def _opened(path: str, text: bool = False):
+    """
+    What to hand a parser for `path`: the path itself for plain files, else a
+    stream decompressing the compressed file or archive member as it is read
+    (see archives.open_packed), decoded as UTF-8 with text=True.
+    """
+    if not is_packed(path):
+        yield path
+        return
+    with open_packed(path) as stream:
+        if not text:
+            yield stream
+            return
+        wrapper = io.TextIOWrapper(stream, encoding="utf-8", errors="ignore")
+        try:
+            yield wrapper
+        finally:
+            wrapper.detach()
+
+
+@contextmanager
+def _as_text(src):
+    if isinstance(src, str):
+        with open(src, "r", encoding="utf-8", errors="ignore") as f:
+            yield f
+    else:
+        yield src
+
+
+def is_tabular(name: str) -> bool:
+    """
+    True for supported tabular files, also compressed (train.csv.gz,
+    train.csv.zip) or inside an archive (data.zip/train.csv).
+    """
+    return format_name(name).endswith(TABULAR_EXTS)
+
+
+def can_stream(path: str) -> bool:
+    """True for formats iter_file() reads incrementally (not by slicing a full read)."""
+    f_lower = format_name(path)
+    return f_lower.endswith(('.csv', '.parquet', '.sqlite', '.db') + ARROW_IPC_EXTS) or (
+        f_lower.endswith(('.json',) + JSON_LINES_EXTS) and _is_json_lines(path)
+    )
+
+
+def _mapped(path: str):
+    """
+    pyarrow source for `path`: a read-only memory map for plain files, so
+    processes reading the same cached file share its page-cache pages and
+    uncompressed Arrow data is used in place; compressed files and archive
+    members are decompressed (see archives.seekable).
+    """
+    import pyarrow as pa
+    return seekable(path) if is_packed(path) else pa.memory_map(path, "r")
+
+
+def _parquet_options(path: str, kwargs: dict) -> dict:
+    """Memory-maps plain Parquet files unless another engine was requested."""
+    if not is_packed(path) and kwargs.get("engine", "auto") in ("auto", "pyarrow"):
+        kwargs.setdefault("memory_map", True)
+    return kwargs
+
+
+def _parquet_filters(dnf, kwargs: dict):
+    """Row-group filters for pyarrow as an expression, so NULLs are treated as in pandas."""
+    if not dnf:
+        return None
+    return _arrow_expression(dnf) if kwargs.get("engine", "auto") in ("auto", "pyarrow") else dnf
+
+
+def _ipc_batches(path: str) -> Tuple["pa.Schema", Iterator["pa.RecordBatch"]]:
+    """
+    Schema and record batches of an Arrow IPC file or stream, or a Feather
+    file. Batches of a memory-mapped uncompressed file are zero-copy views.
+    """
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    source = _mapped(path)
+    try:
+        reader = ipc.open_file(source)
+        return reader.schema, (reader.get_batch(i) for i in range(reader.num_record_batches))
+    except pa.ArrowInvalid:
+        pass
+    source.seek(0)
+    try:
+        reader = ipc.open_stream(source)
+        return reader.schema, iter(reader)
+    except pa.ArrowInvalid:
+        pass
+    # Feather V1 predates the IPC format
+    import pyarrow.feather as feather
+    source.seek(0)
+    try:
+        table = feather.read_table(source)
+    except pa.ArrowInvalid as e:
+        raise DataFormatError(f"'{os.path.basename(path)}' is not an Arrow IPC or Feather file: {e}") from e
+    return table.schema, iter(table.to_batches())
+
+
+def _ipc_num_rows(path: str) -> int:
+    """
+    Rows of an Arrow IPC/Feather file. The IPC file format is counted from
+    its record batch headers without decoding (or decompressing) any batch;
+    streams and Feather V1 are read one batch at a time.
+    """
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    try:
+        return ipc.open_file(_mapped(path)).count_rows()
+    except (pa.ArrowInvalid, AttributeError):
+        # Not the file format, or a pyarrow without count_rows()
+        _, batches = _ipc_batches(path)
+        return sum(batch.num_rows for batch in batches)
+
+
+def _read_ipc(path: str, columns: Optional[List[str]] = None) -> "pa.Table":
+    import pyarrow as pa
+    schema, batches = _ipc_batches(path)
+    table = pa.Table.from_batches(list(batches), schema=schema)
+    return table if columns is None else table.select(list(columns))
+
+
+def _nullable_types_mapper():
+    import pyarrow as pa
+    mapping = {
+        pa.int8(): pd.Int8Dtype(), pa.int16(): pd.Int16Dtype(), pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(), pa.uint8(): pd.UInt8Dtype(), pa.uint16(): pd.UInt16Dtype(),
+        pa.uint32(): pd.UInt32Dtype(), pa.uint64(): pd.UInt64Dtype(), pa.bool_(): pd.BooleanDtype(),
+        pa.float32(): pd.Float32Dtype(), pa.float64(): pd.Float64Dtype(),
+        pa.string(): pd.StringDtype(), pa.large_string(): pd.StringDtype(),
+    }
+    return mapping.get
+
+
+def _to_pandas(data, path: str, kwargs: dict) -> pd.DataFrame:
+    """
+    Converts an Arrow table or batch read from `path` to pandas with load()'s
+    reader kwargs: dtype_backend picks the dtypes as pandas' own readers do,
+    to_pandas() options pass through, and anything else is rejected rather
+    than failing inside pyarrow.
+    """
+    options = dict(kwargs)
+    dtype_backend = options.pop("dtype_backend", None)
+    unknown = sorted(k for k in options if k not in TO_PANDAS_OPTIONS)
+    if unknown:
+        raise DataFormatError(
+            f"Reader options {unknown} do not apply to '{os.path.basename(path)}'.",
+            fix_suggestion=f"Arrow-based files accept dtype_backend and pyarrow's to_pandas() options: {', '.join(TO_PANDAS_OPTIONS)}.",
+        )
+    if dtype_backend == "pyarrow":
+        options.setdefault("types_mapper", pd.ArrowDtype)
+    elif dtype_backend == "numpy_nullable":
+        options.setdefault("types_mapper", _nullable_types_mapper())
+    elif dtype_backend is not None:
+        raise ValueError(f"dtype_backend must be 'pyarrow' or 'numpy_nullable', got {dtype_backend!r}")
+    return data.to_pandas(**options)
+
+
+def _arrow_csv_options(path: str, kwargs: dict, needed: Optional[List[str]]):
+    """
+    Translates pandas read_csv kwargs to pyarrow.csv (read, parse, convert)
+    options for engine="arrow". Options pyarrow has no equivalent for raise
+    DataFormatError instead of being silently ignored.
+    """
+    import pyarrow.csv as pa_csv
+    options = dict(kwargs)
+    options.pop("dtype_backend", None)  # the result is Arrow already
+    read = {"use_threads": True}
+    parse = {}
+    convert = {}
+
+    for name in ("sep", "delimiter"):
+        value = options.pop(name, None)
+        if value is not None:
+            parse["delimiter"] = value
+    for name, target in (("quotechar", "quote_char"), ("escapechar", "escape_char")):
+        if name in options:
+            parse[target] = options.pop(name)
+    if "encoding" in options:
+        read["encoding"] = options.pop("encoding")
+
+    skip = options.pop("skiprows", 0) or 0
+    header = options.pop("header", "infer")
+    names = options.pop("names", None)
+    if names is not None:
+        read["column_names"] = list(names)
+        if header == 0:
+            skip += 1
+    elif header is None:
+        read["autogenerate_column_names"] = True
+    elif isinstance(header, int) and not isinstance(header, bool):
+        skip += header
+    elif header != "infer":
+        options["header"] = header
+    if not isinstance(skip, int):
+        options["skiprows"] = skip
+    elif skip:
+        read["skip_rows"] = skip
+
+    usecols = options.pop("usecols", None)
+    include = needed or (list(usecols) if usecols is not None else None)
+    if include:
+        convert["include_columns"] = include
+    if "na_values" in options:
+        na_values = options.pop("na_values")
+        convert["null_values"] = [na_values] if isinstance(na_values, str) else list(na_values)
+        convert["strings_can_be_null"] = True
+    for name in ("true_values", "false_values"):
+        if name in options:
+            convert[name] = list(options.pop(name))
+
+    if options:
+        raise DataFormatError(
+            f"CSV options {sorted(options)} are not supported with engine='arrow' for '{os.path.basename(path)}'.",
+            fix_suggestion="Use engine='pandas' for them (pandas' read_csv supports every option).",
+        )
+    return pa_csv.ReadOptions(**read), pa_csv.ParseOptions(**parse), pa_csv.ConvertOptions(**convert)
+
+
+def _first_sqlite_table(conn: sqlite3.Connection) -> Optional[str]:
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+    table_name = cursor.fetchone()
+    return table_name[0] if table_name else None
+
+
+# Row filters use the pyarrow/pandas convention: a list of (column, op, value)
+# tuples that are AND-ed, or a list of such lists that are OR-ed (DNF).
+FILTER_OPS = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def _normalize_filters(filters) -> Optional[List[List[Tuple]]]:
+    """Validates filters and returns them in disjunctive normal form."""
+    if not filters:
+        return None
+    filters = list(filters)
+    dnf = filters if isinstance(filters[0], list) else [filters]
+    for conjunction in dnf:
+        for predicate in conjunction:
+            if len(predicate) != 3 or predicate[1] not in FILTER_OPS:
+                raise DataFormatError(
+                    f"Invalid filter {predicate!r}.",
+                    fix_suggestion=f"Use (column, op, value) tuples with op in {FILTER_OPS}."
+                )
+    return [[tuple(p) for p in conjunction] for conjunction in dnf]
+
+
+def _filter_columns(dnf: Optional[List[List[Tuple]]]) -> List[str]:
+    return [] if not dnf else list(dict.fromkeys(p[0] for conj in dnf for p in conj))
+
+
+def _needed_columns(columns: Optional[List[str]], dnf) -> Optional[List[str]]:
+    """Columns that must be read: the projection plus any column used by a filter."""
+    if columns is None:
+        return None
+    return list(dict.fromkeys(list(columns) + _filter_columns(dnf)))
+
+
+def _pandas_predicate(series: pd.Series, op: str, value) -> pd.Series:
+    if op in ("==", "="):
+        return series == value
+    if op == "!=":
+        return series != value
+    if op == "<":
+        return series < value
+    if op == "<=":
+        return series <= value
+    if op == ">":
+        return series > value
+    if op == ">=":
+        return series >= value
+    if op == "in":
+        return series.isin(list(value))
+    return ~series.isin(list(value))
+
+
+def _apply_pandas(df: pd.DataFrame, columns: Optional[List[str]], dnf) -> pd.DataFrame:
+    """Applies row filters, then the column projection, to a DataFrame."""
+    if dnf:
+        mask = None
+        for conjunction in dnf:
+            conj_mask = None
+            for col, op, value in conjunction:
+                pred = _pandas_predicate(df[col], op, value)
+                conj_mask = pred if conj_mask is None else (conj_mask & pred)
+            mask = conj_mask if mask is None else (mask | conj_mask)
+        df = df[mask.fillna(False).astype(bool)]
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def _arrow_expression(dnf):
+    """
+    The filters as a pyarrow expression with pandas' semantics: negated
+    predicates keep missing values, and empty `in` lists match nothing.
+    """
+    import pyarrow.compute as pc
+
+    def predicate(col, op, value):
+        field = pc.field(col)
+        if op in ("==", "="):
+            return field == value
+        if op == "!=":
+            return (field != value) | field.is_null()
+        if op == "<":
+            return field < value
+        if op == "<=":
+            return field <= value
+        if op == ">":
+            return field > value
+        if op == ">=":
+            return field >= value
+        values = list(value)
+        if not values:
+            # An empty value set has no type to compare against
+            return pc.scalar(op == "not in")
+        if op == "in":
+            return field.isin(values)
+        return ~field.isin(values) | field.is_null()
+
+    expression = None
+    for conjunction in dnf:
+        conj = None
+        for col, op, value in conjunction:
+            pred = predicate(col, op, value)
+            conj = pred if conj is None else (conj & pred)
+        expression = conj if expression is None else (expression | conj)
+    return expression
+
+
+def _apply_arrow(table: "pa.Table", columns: Optional[List[str]], dnf) -> "pa.Table":
+    if dnf:
+        table = table.filter(_arrow_expression(dnf))
+    if columns is not None:
+        table = table.select(list(columns))
+    return table
+
+
+def _sqlite_query(table_name: str, columns: Optional[List[str]], dnf) -> Tuple[str, list]:
+    """
+    Builds a parameterized SELECT with the projection and filters pushed
+    down, matching pandas: negated predicates keep NULLs and empty `in`
+    lists match nothing (`not in` everything).
+    """
+    def ident(name: str) -> str:
+        return '"' + str(name).replace('"', '""') + '"'
+
+    select = ", ".join(ident(c) for c in columns) if columns else "*"
+    query = f"SELECT {select} FROM {ident(table_name)}"
+    params: list = []
+    if dnf:
+        ors = []
+        for conjunction in dnf:
+            ands = []
+            for col, op, value in conjunction:
+                if op in ("in", "not in"):
+                    values = list(value)
+                    if not values:
+                        ands.append("1=1" if op == "not in" else "1=0")
+                        continue
+                    clause = f"{ident(col)} {op.upper()} ({', '.join('?' for _ in values)})"
+                    params.extend(values)
+                else:
+                    clause = f"{ident(col)} {'=' if op == '==' else op} ?"
+                    params.append(value)
+                if op in ("!=", "not in"):
+                    clause = f"({clause} OR {ident(col)} IS NULL)"
+                ands.append(clause)
+            ors.append("(" + " AND ".join(ands) + ")")
+        query += " WHERE " + " OR ".join(ors)
+    return query, params
+
+
+def read_file(
+    full_selected_path: str,
+    backend: str = "pandas",
+    columns: Optional[List[str]] = None,
+    filters=None,
+    **kwargs,
+) -> Union[pd.DataFrame, "pa.Table", str]:
+    """
+    Reads a local file based on its extension.
+
+    `columns` and `filters` are pushed down as far as each format allows:
+    Parquet prunes columns and row groups, CSV reads only the needed columns
+    (`usecols`) and filters chunk by chunk, SQLite runs a generated
+    SELECT ... WHERE, and Excel uses `usecols`. JSON is filtered after parsing.
+
+    With backend="arrow" the result is a pyarrow.Table (see read_arrow). With
+    the pandas backend, dtype_backend="pyarrow" also switches CSV parsing to
+    the multithreaded pyarrow parser unless a parser engine was given. Arrow
+    IPC/Feather files take dtype_backend and pyarrow's to_pandas() options
+    (see TO_PANDAS_OPTIONS); other reader kwargs raise DataFormatError.
+    """
+    if backend == "arrow":
+        return read_arrow(full_selected_path, columns=columns, filters=filters, **kwargs)
+
+    dnf = _normalize_filters(filters)
+    needed = _needed_columns(columns, dnf)
+    f_lower = format_name(full_selected_path)
+    logger.info(f"Loading {os.path.basename(full_selected_path)}...")
+
+    if f_lower.endswith('.csv'):
+        if kwargs.get("dtype_backend") == "pyarrow":
+            kwargs.setdefault("engine", "pyarrow")
+        if needed is not None:
+            kwargs["usecols"] = needed
+        with _opened(full_selected_path) as src:
+            if dnf and kwargs.get("engine") != "pyarrow" and "chunksize" not in kwargs:
+                # Filter while parsing so only matching rows are ever held in memory
+                with pd.read_csv(src, chunksize=DEFAULT_BATCH_ROWS, **kwargs) as reader:
+                    parts = [_apply_pandas(chunk, columns, dnf) for chunk in reader]
+                return pd.concat(parts) if parts else pd.DataFrame(columns=columns)
+            df = pd.read_csv(src, **kwargs)
+    elif f_lower.endswith('.parquet'):
+        return pd.read_parquet(
+            seekable(full_selected_path), columns=columns, filters=_parquet_filters(dnf, kwargs),
+            **_parquet_options(full_selected_path, kwargs)
+        )
+    elif f_lower.endswith(ARROW_IPC_EXTS):
+        return _to_pandas(_apply_arrow(_read_ipc(full_selected_path, needed), columns, dnf), full_selected_path, kwargs)
+    elif f_lower.endswith(('.json',) + JSON_LINES_EXTS):
+        if "lines" not in kwargs and _is_json_lines(full_selected_path):
+            kwargs["lines"] = True
+        with _opened(full_selected_path, text=True) as src:
+            df = pd.read_json(src, **kwargs)
+    elif f_lower.endswith(('.xlsx', '.xls')):
+        if needed is not None:
+            kwargs["usecols"] = needed
+        df = pd.read_excel(seekable(full_selected_path), **kwargs)
+    elif f_lower.endswith(('.sqlite', '.db')):
+        with as_local_file(full_selected_path) as local:
+            conn = sqlite3.connect(local)
+            try:
+                # Try to get the first table name
+                table_name = _first_sqlite_table(conn)
+                if table_name:
+                    query, params = _sqlite_query(table_name, columns, dnf)
+                    return pd.read_sql_query(query, conn, params=params, **kwargs)
+            finally:
+                conn.close()
+        return full_selected_path # Return path if no tables found
+    else:
+        logger.warning(f"Unsupported format for auto-loading: {f_lower}. Returning path.")
+        return full_selected_path
+
+    if (columns is None and not dnf) or not isinstance(df, pd.DataFrame):
+        return df
+    return _apply_pandas(df, columns, dnf)
+
+
+def iter_file(full_selected_path: str, batch_rows: int = DEFAULT_BATCH_ROWS, backend: str = "pandas", **kwargs) -> Union[Iterator[pd.DataFrame], "pa.RecordBatchReader"]:
+    """
+    Streams a local file as DataFrames of at most `batch_rows` rows.
+
+    CSV uses the pandas chunked reader, Parquet is read batch by batch from
+    its row groups, JSON Lines uses the chunked JSON reader and SQLite pages
+    through a cursor, so memory stays bounded by the batch size. Plain JSON
+    and Excel cannot be streamed and are sliced after a full read.
+
+    With backend="arrow" a pyarrow.RecordBatchReader is returned instead
+    (see iter_arrow).
+
+    Raises:
+        UnsupportedFormatError: For non-tabular files or SQLite files without tables.
+    """
+    if batch_rows is None or batch_rows <= 0:
+        raise ValueError("batch_rows must be a positive integer.")
+    if backend == "arrow":
+        return iter_arrow(full_selected_path, batch_rows=batch_rows, **kwargs)
+    return _iter_pandas(full_selected_path, batch_rows, **kwargs)
+
+
+def _iter_pandas(
+    full_selected_path: str,
+    batch_rows: int,
+    columns: Optional[List[str]] = None,
+    filters=None,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    dnf = _normalize_filters(filters)
+    needed = _needed_columns(columns, dnf)
+    project = columns is not None or bool(dnf)
+    f_lower = format_name(full_selected_path)
+    logger.info(f"Streaming {os.path.basename(full_selected_path)} in batches of {batch_rows} rows...")
+
+    if f_lower.endswith('.csv'):
+        kwargs.pop("chunksize", None)
+        if needed is not None:
+            kwargs["usecols"] = needed
+        with _opened(full_selected_path) as src, pd.read_csv(src, chunksize=batch_rows, **kwargs) as reader:
+            for chunk in reader:
+                yield _apply_pandas(chunk, columns, dnf) if project else chunk
+
+    elif f_lower.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(seekable(full_selected_path), memory_map=not is_packed(full_selected_path))
+        for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=needed):
+            df = _to_pandas(batch, full_selected_path, kwargs)
+            yield _apply_pandas(df, columns, dnf) if project else df
+
+    elif f_lower.endswith(ARROW_IPC_EXTS):
+        _, batches = _ipc_batches(full_selected_path)
+        for batch in _split_batches(batches, batch_rows, columns, dnf):
+            yield _to_pandas(batch, full_selected_path, kwargs)
+
+    elif f_lower.endswith(('.json',) + JSON_LINES_EXTS) and _is_json_lines(full_selected_path):
+        kwargs.pop("chunksize", None)
+        kwargs.pop("lines", None)
+        with _opened(full_selected_path, text=True) as src, \
+                pd.read_json(src, lines=True, chunksize=batch_rows, **kwargs) as reader:
+            for chunk in reader:
+                yield _apply_pandas(chunk, columns, dnf) if project else chunk
+
+    elif f_lower.endswith(('.sqlite', '.db')):
+        with as_local_file(full_selected_path) as local:
+            conn = sqlite3.connect(local)
+            try:
+                table_name = _first_sqlite_table(conn)
+                if not table_name:
+                    raise UnsupportedFormatError(f"No tables found in SQLite file '{os.path.basename(full_selected_path)}'.")
+                kwargs.pop("chunksize", None)
+                query, params = _sqlite_query(table_name, columns, dnf)
+                yield from pd.read_sql_query(query, conn, params=params, chunksize=batch_rows, **kwargs)
+            finally:
+                conn.close()
+
+    elif f_lower.endswith(('.json', '.xlsx', '.xls')):
+        logger.warning(
+            f"{os.path.basename(full_selected_path)} cannot be streamed natively; "
+            "reading it fully and yielding slices."
+        )
+        df = read_file(full_selected_path, columns=columns, filters=filters, **kwargs)
+        for start in range(0, len(df), batch_rows):
+            yield df.iloc[start:start + batch_rows]
+
+    else:
+        raise UnsupportedFormatError(
+            f"Streaming is not supported for '{os.path.basename(full_selected_path)}'.",
+            fix_suggestion="Stream CSV, Parquet, Arrow/Feather, JSON Lines or SQLite files, or load without stream=True."
+        )
+
+
+def read_arrow(full_selected_path: str, columns: Optional[List[str]] = None, filters=None, **kwargs) -> "pa.Table":
+    """
+    Reads a local file into a pyarrow.Table without going through pandas.
+
+    CSV uses pyarrow's multithreaded parser (only the needed columns are
+    converted), Parquet is read with pyarrow.parquet (column and row-group
+    pruning), Arrow IPC/Feather files are memory-mapped (zero-copy when
+    uncompressed) and JSON Lines is read with pyarrow.json. Excel, SQLite and plain JSON
+    have no Arrow reader; they are parsed with pandas and converted.
+    Extra kwargs go to pyarrow.parquet.read_table for Parquet and to the
+    pandas reader for the converted formats; pandas CSV options (sep,
+    encoding, header, names, na_values...) are translated to pyarrow's.
+    """
+    import pyarrow as pa
+    dnf = _normalize_filters(filters)
+    needed = _needed_columns(columns, dnf)
+    f_lower = format_name(full_selected_path)
+    logger.info(f"Loading {os.path.basename(full_selected_path)} with Arrow...")
+
+    if f_lower.endswith('.csv'):
+        import pyarrow.csv as pa_csv
+        read_options, parse_options, convert_options = _arrow_csv_options(full_selected_path, kwargs, needed)
+        with _opened(full_selected_path) as src:
+            table = pa_csv.read_csv(
+                src, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+            )
+        return _apply_arrow(table, columns, dnf)
+    elif f_lower.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        kwargs.setdefault("memory_map", not is_packed(full_selected_path))
+        return pq.read_table(seekable(full_selected_path), columns=columns, filters=_parquet_filters(dnf, kwargs), **kwargs)
+    elif f_lower.endswith(ARROW_IPC_EXTS):
+        return _apply_arrow(_read_ipc(full_selected_path, needed), columns, dnf)
+    elif f_lower.endswith(('.json',) + JSON_LINES_EXTS) and _is_json_lines(full_selected_path):
+        import pyarrow.json as pa_json
+        with _opened(full_selected_path) as src:
+            return _apply_arrow(pa_json.read_json(src), columns, dnf)
+
+    df = read_file(full_selected_path, columns=columns, filters=filters, **kwargs)
+    if not isinstance(df, pd.DataFrame):
+        raise UnsupportedFormatError(
+            f"'{os.path.basename(full_selected_path)}' cannot be read as an Arrow table.",
+            fix_suggestion="Use engine='pandas', or load a CSV/Parquet/JSON Lines file."
+        )
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _split_batches(batches, batch_rows: int, columns: Optional[List[str]] = None, dnf=None):
+    """
+    Applies filters/projection and re-slices record batches so none exceeds
+    batch_rows rows (slicing is zero-copy).
+    """
+    import pyarrow as pa
+    for batch in batches:
+        if dnf or columns is not None:
+            batch = _apply_arrow(pa.Table.from_batches([batch]), columns, dnf).combine_chunks()
+            batch = batch.to_batches()[0] if batch.num_rows else None
+            if batch is None:
+                continue
+        for offset in range(0, batch.num_rows, batch_rows):
+            yield batch.slice(offset, batch_rows)
+
+
+def _closing(batches, stack: ExitStack):
+    with stack:
+        yield from batches
+
+
+def _project_schema(schema: "pa.Schema", columns: Optional[List[str]]) -> "pa.Schema":
+    import pyarrow as pa
+    return schema if columns is None else pa.schema([schema.field(c) for c in columns])
+
+
+def iter_arrow(
+    full_selected_path: str,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    columns: Optional[List[str]] = None,
+    filters=None,
+    **kwargs,
+) -> "pa.RecordBatchReader":
+    """
+    Opens a local file as a pyarrow.RecordBatchReader yielding batches of at
+    most `batch_rows` rows. CSV is parsed incrementally, Parquet is read
+    row group by row group and Arrow IPC batch by batch from a memory map.
+    JSON Lines and SQLite go through the chunked pandas readers; a column
+    that is all null in the first chunks is typed by reading ahead up to
+    SCHEMA_LOOKAHEAD chunks (text if still unknown). Plain JSON and Excel are
+    read whole and sliced.
+    """
+    import pyarrow as pa
+    dnf = _normalize_filters(filters)
+    needed = _needed_columns(columns, dnf)
+    f_lower = format_name(full_selected_path)
+
+    if f_lower.endswith('.csv'):
+        import pyarrow.csv as pa_csv
+        read_options, parse_options, convert_options = _arrow_csv_options(full_selected_path, kwargs, needed)
+        # Keeps a decompressing stream open until the batches are consumed
+        stack = ExitStack()
+        src = stack.enter_context(_opened(full_selected_path))
+        reader = pa_csv.open_csv(
+            src, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+        )
+        return pa.RecordBatchReader.from_batches(
+            _project_schema(reader.schema, columns), _closing(_split_batches(reader, batch_rows, columns, dnf), stack)
+        )
+    elif f_lower.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(seekable(full_selected_path), memory_map=not is_packed(full_selected_path))
+        batches = parquet_file.iter_batches(batch_size=batch_rows, columns=needed)
+        return pa.RecordBatchReader.from_batches(
+            _project_schema(parquet_file.schema_arrow, columns), _split_batches(batches, batch_rows, columns, dnf)
+        )
+    elif f_lower.endswith(ARROW_IPC_EXTS):
+        schema, batches = _ipc_batches(full_selected_path)
+        return pa.RecordBatchReader.from_batches(
+            _project_schema(schema, columns), _split_batches(batches, batch_rows, columns, dnf)
+        )
+    elif f_lower.endswith(('.json', '.xlsx', '.xls')) and not (
+            f_lower.endswith(('.json',) + JSON_LINES_EXTS) and _is_json_lines(full_selected_path)):
+        # Plain JSON and Excel are parsed whole anyway; typing the whole table avoids guessing from a slice
+        logger.warning(
+            f"{os.path.basename(full_selected_path)} cannot be streamed natively; "
+            "reading it fully and yielding slices."
+        )
+        table = read_arrow(full_selected_path, columns=columns, filters=filters, **kwargs)
+        return pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=batch_rows))
+
+    # JSON Lines and SQLite: the chunked pandas readers, converted batch by batch
+    frames = _iter_pandas(full_selected_path, batch_rows, columns=columns, filters=filters, **kwargs)
+    buffered, schema = [], None
+    for df in frames:
+        batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+        buffered.append(batch)
+        schema = batch.schema if schema is None else _fill_null_fields(schema, batch.schema)
+        # Columns that are all null so far have no type yet; read ahead a little to find one
+        if not any(pa.types.is_null(field.type) for field in schema) or len(buffered) >= SCHEMA_LOOKAHEAD:
+            break
+    if schema is None:
+        return pa.RecordBatchReader.from_batches(pa.schema([]), iter(()))
+    # Still untyped after the look-ahead: text holds whatever comes later
+    schema = pa.schema([
+        field.with_type(pa.string()) if pa.types.is_null(field.type) and len(buffered) >= SCHEMA_LOOKAHEAD else field
+        for field in schema
+    ])
+
+    def _batches():
+        for batch in buffered:
+            yield _conform_batch(batch, schema, full_selected_path)
+        for df in frames:
+            yield _conform_batch(pa.RecordBatch.from_pandas(df, preserve_index=False), schema, full_selected_path)
+
+    return pa.RecordBatchReader.from_batches(schema, _batches())
+
+
+def _fill_null_fields(schema: "pa.Schema", other: "pa.Schema") -> "pa.Schema":
+    """`schema` with its null-typed (so far all-null) fields typed as in `other`."""
+    import pyarrow as pa
+    fields = []
+    for field in schema:
+        index = other.get_field_index(field.name)
+        if pa.types.is_null(field.type) and index >= 0:
+            field = field.with_type(other.field(index).type)
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _conform_batch(batch: "pa.RecordBatch", schema: "pa.Schema", path: str) -> "pa.RecordBatch":
+    """Casts a converted chunk to the stream's schema (a chunk can type a column differently)."""
+    import pyarrow as pa
+    if batch.schema.equals(schema):
+        return batch
+    arrays = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        column = batch.column(index) if index >= 0 else pa.nulls(batch.num_rows, field.type)
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise DataFormatError(
+                    f"Column '{field.name}' of '{os.path.basename(path)}' changes type from {field.type} "
+                    f"to {column.type} while streaming.",
+                    fix_suggestion="Stream with a larger batch_rows, or use engine='pandas'.",
+                ) from e
+        arrays.append(column)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def list_tabular_files(file_names: List[str]) -> List[str]:
+    """Filters names down to supported tabular formats (see is_tabular)."""
+    return [f for f in file_names if is_tabular(f)]
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 from .auth import setup_auth
 import re
 import logging
@@ -30,17 +30,25 @@ def _format_size(bytes_size: int) -> str:
     else:
         return f"{bytes_size / (1024 ** 3):.2f} GB"
 
-import functools
 
-@functools.lru_cache(maxsize=32)
+def _fetch_results(query: str, top: int, timeout: int) -> List[Dict]:
+    from .client import KaggleClient
+    return KaggleClient().search_datasets(query, top=top, timeout=timeout, raise_errors=True)
+
+
 def search(query: str, top: int = 5, timeout: int = 30) -> List[Dict[str, Union[str, int]]]:
     """
     Searches for datasets on Kaggle.
 
+    Results are cached across calls and processes (see
+    configure_search_cache()); failed searches are not cached. Offline, or
+    when Kaggle cannot be reached, the local catalog (see sync_catalog())
+    answers instead.
+
     Args:
         query (str): The search query.
         top (int): The maximum number of results to return.
-        timeout (int): Timeout in seconds for the API call (ignored).
+        timeout (int): Timeout in seconds for the API call.
 
     Returns:
         list: A list of dictionaries, where each dictionary contains
@@ -48,9 +56,20 @@ def search(query: str, top: int = 5, timeout: int = 30) -> List[Dict[str, Union[
               if the search fails.
     """
     try:
-        from .client import KaggleClient
-        client = KaggleClient()
-        results = client.search_datasets(query, top=top)
+        from .catalog import catalog_search, prefer_catalog
+        from .metadata import offline_mode
+        from .search_cache import cached_search
+        results = catalog_search(query, top) if prefer_catalog() else []
+        if not results:
+            try:
+                results = cached_search(query, top, lambda: _fetch_results(query, top, timeout))
+            except Exception as e:
+                results = catalog_search(query, top)
+                if not results:
+                    raise
+                logger.warning(f"Search failed ({e}); using the local catalog.")
+            if not results and offline_mode():
+                results = catalog_search(query, top)
 
         # Additional safety check for None or invalid return values
         if not results:
@@ -78,3 +97,81 @@ def search(query: str, top: int = 5, timeout: int = 30) -> List[Dict[str, Union[
         
         # Return empty list instead of crashing, per "No stacktraces" for supporting features
         return []
+
+SEARCH_PAGE_SIZE = 20  # results per /datasets/list page fetched by iter_search
+
+
+def iter_search(
+    query: str = "",
+    filters: Optional[Dict] = None,
+    max_results: Optional[int] = None,
+    page_size: int = SEARCH_PAGE_SIZE,
+    prefetch: bool = True,
+    timeout: int = 30,
+) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    Lazily pages through Kaggle's dataset search, for crawls too large for search().
+
+    Only the current page and, with prefetch, the next one (fetched in the
+    background while the current one is consumed) are held in memory. Handles
+    already yielded are skipped, as pages can shift while they are read.
+
+    Args:
+        query (str): The search query; "" lists every dataset matching `filters`.
+        filters (dict, optional): Server-side filters: file_type ("csv",
+            "sqlite", "json", "bigQuery", "parquet"), license ("cc", "gpl",
+            "odb", "other"), sort_by ("relevance", "hottest", "votes",
+            "updated", "active", "published"), min_size / max_size (bytes or
+            e.g. "500MB"), tags (tag ids) and user (owner).
+        max_results (int, optional): Stop after this many results.
+        page_size (int): Results per API request.
+        prefetch (bool): Fetch the next page while the current one is consumed.
+        timeout (int): Timeout in seconds for each API request.
+
+    Yields:
+        dict: handle, title, size (bytes) and votes of each dataset.
+
+    Raises:
+        ValueError: For unknown filters or values (raised immediately).
+        NetworkError: If a page cannot be fetched.
+    """
+    from .client import KaggleClient, _filter_params
+    _filter_params(filters)
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    return _iter_pages(KaggleClient(), query, filters, max_results, page_size, prefetch, timeout)
+
+
+def _iter_pages(client, query, filters, max_results, page_size, prefetch, timeout) -> Iterator[Dict]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(page: int) -> List[Dict]:
+        return client.search_page(query, page=page, page_size=page_size, filters=filters, timeout=timeout)
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kaggleease-search") if prefetch else None
+    seen = set()
+    page = 1
+    pending = pool.submit(fetch, page) if pool else None
+    try:
+        while max_results is None or len(seen) < max_results:
+            results = pending.result() if pending else fetch(page)
+            last = len(results) < page_size
+            # Skip the prefetch when this page already satisfies max_results
+            if pool and not last and (max_results is None or len(seen) + len(results) < max_results):
+                pending = pool.submit(fetch, page + 1)
+            else:
+                pending = None
+            logger.debug(f"Search '{query}' page {page}: {len(results)} results")
+            for dataset in results:
+                if dataset["handle"] in seen:
+                    continue
+                seen.add(dataset["handle"])
+                yield dataset
+                if max_results is not None and len(seen) >= max_results:
+                    return
+            if last:
+                return
+            page += 1
+    finally:
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,350 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600  # 1 hour
+DEFAULT_NEGATIVE_TTL = 60  # empty results may be a fluke; retry soon
+DEFAULT_STALE_TTL = 24 * 3600  # how long past its TTL a result may be served while refreshing
+DEFAULT_MAXSIZE = 256
+TTL_ENV = "KAGGLEEASE_SEARCH_TTL"
+DB_NAME = "search.sqlite"
+JSON_DIR = "search"
+STORES = ("sqlite", "json", "memory")
+
+SearchEntry = namedtuple("SearchEntry", ["results", "fetched_at"])
+SearchEntry.__doc__ = "Raw search results (sizes in bytes) and when they were fetched (epoch seconds)."
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    key TEXT PRIMARY KEY,
+    results TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+_config = {
+    "ttl": None,
+    "negative_ttl": DEFAULT_NEGATIVE_TTL,
+    "stale_ttl": DEFAULT_STALE_TTL,
+    "maxsize": DEFAULT_MAXSIZE,
+    "store": "sqlite",
+    "enabled": True,
+}
+_config_lock = threading.Lock()
+
+
+def configure_search_cache(
+    ttl: Optional[float] = None,
+    negative_ttl: Optional[float] = None,
+    stale_ttl: Optional[float] = None,
+    maxsize: Optional[int] = None,
+    store: Union[str, object, None] = None,
+    enabled: Optional[bool] = None,
+) -> None:
+    """
+    Configures the cache behind search() and the "Did you mean" suggestions.
+
+    Results live in a per-process LRU backed by an on-disk store shared by
+    every process using the same cache directory.
+
+    Args:
+        ttl (float, optional): Seconds results are served without asking
+            Kaggle. Defaults to KAGGLEEASE_SEARCH_TTL or one hour.
+        negative_ttl (float, optional): Seconds an empty result is trusted.
+            Defaults to one minute.
+        stale_ttl (float, optional): Seconds past `ttl` during which cached
+            results are still returned while a background refresh runs
+            (stale-while-revalidate). 0 disables it. Defaults to one day.
+        maxsize (int, optional): Queries kept in memory. Defaults to 256.
+        store (str or object, optional): "sqlite" (default), "json",
+            "memory" (no persistence), or any object with get(key),
+            put(key, entry) and clear() methods.
+        enabled (bool, optional): Set to False to always query Kaggle.
+    """
+    with _config_lock:
+        if ttl is not None:
+            _config["ttl"] = float(ttl)
+        if negative_ttl is not None:
+            _config["negative_ttl"] = float(negative_ttl)
+        if stale_ttl is not None:
+            _config["stale_ttl"] = float(stale_ttl)
+        if maxsize is not None:
+            _config["maxsize"] = int(maxsize)
+            _caches.clear()
+        if store is not None:
+            if isinstance(store, str) and store not in STORES:
+                raise ValueError(f"store must be one of {STORES} or a store object, got {store!r}")
+            _config["store"] = store
+            _caches.clear()
+        if enabled is not None:
+            _config["enabled"] = bool(enabled)
+
+
+def get_ttl() -> float:
+    """Returns the effective search TTL in seconds."""
+    if _config["ttl"] is not None:
+        return _config["ttl"]
+    try:
+        return float(os.environ.get(TTL_ENV, DEFAULT_TTL))
+    except ValueError:
+        return float(DEFAULT_TTL)
+
+
+class SQLiteSearchStore:
+    """Search results in one SQLite file, safe to share between processes."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[SearchEntry]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT results, fetched_at FROM searches WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        return SearchEntry(json.loads(row[0]), row[1]) if row else None
+
+    def put(self, key: str, entry: SearchEntry) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                (key, json.dumps(entry.results), entry.fetched_at),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM searches")
+            conn.commit()
+        finally:
+            conn.close()
+
+
+class JSONSearchStore:
+    """Search results as one JSON file per query, for filesystems where SQLite misbehaves."""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[SearchEntry]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        return SearchEntry(data["results"], data["fetched_at"]) if data.get("key") == key else None
+
+    def put(self, key: str, entry: SearchEntry) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "results": entry.results, "fetched_at": entry.fetched_at}, f)
+        os.replace(tmp, path)
+
+    def clear(self) -> None:
+        if self.directory.is_dir():
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+class SearchCache:
+    """
+    Two-level cache of search results: an in-memory LRU in front of an
+    optional persistent store. Store errors are logged and treated as misses;
+    fetch errors are never cached.
+    """
+
+    def __init__(self, store=None, maxsize: int = DEFAULT_MAXSIZE):
+        self.store = store
+        self.maxsize = maxsize
+        self._memory: "OrderedDict[str, SearchEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stats = {"hits": 0, "negative_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, size=len(self._memory))
+
+    def _lookup(self, key: str) -> Optional[SearchEntry]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        if self.store is None:
+            return None
+        try:
+            entry = self.store.get(key)
+        except Exception as e:
+            logger.debug(f"Search cache read failed: {e}")
+            return None
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: SearchEntry) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    def _save(self, key: str, results: List[Dict]) -> None:
+        entry = SearchEntry(results, time.time())
+        self._remember(key, entry)
+        if self.store is not None:
+            try:
+                self.store.put(key, entry)
+            except Exception as e:
+                logger.debug(f"Search cache write failed: {e}")
+
+    def _revalidate(self, key: str, fetch: Callable[[], List[Dict]]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._save(key, fetch())
+                self._count("refreshes")
+            except Exception as e:
+                self._count("errors")
+                logger.debug(f"Background search refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name="kaggleease-search-refresh", daemon=True).start()
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], List[Dict]],
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        offline: bool = False,
+    ) -> List[Dict]:
+        """
+        Returns cached results for `key`, calling `fetch` when they are missing
+        or expired. Offline, any cached results are returned regardless of age
+        and a miss returns [] without fetching.
+
+        Raises:
+            Exception: Whatever `fetch` raises, unless expired results can be served instead.
+        """
+        ttl = get_ttl() if ttl is None else ttl
+        negative_ttl = _config["negative_ttl"] if negative_ttl is None else negative_ttl
+        stale_ttl = _config["stale_ttl"] if stale_ttl is None else stale_ttl
+
+        entry = self._lookup(key)
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if offline or age < (ttl if entry.results else negative_ttl):
+                self._count("hits" if entry.results else "negative_hits")
+                return [dict(r) for r in entry.results]
+            if entry.results and age < ttl + stale_ttl:
+                self._count("stale_hits")
+                self._revalidate(key, fetch)
+                return [dict(r) for r in entry.results]
+
+        self._count("misses")
+        if offline:
+            return []
+        try:
+            results = fetch()
+        except Exception:
+            self._count("errors")
+            if entry is not None and entry.results:
+                logger.warning("Search failed; serving expired cached results.")
+                return [dict(r) for r in entry.results]
+            raise
+        self._save(key, results)
+        return [dict(r) for r in results]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.store is not None:
+            try:
+                self.store.clear()
+            except Exception as e:
+                logger.debug(f"Search cache clear failed: {e}")
+
+
+_caches: Dict[Tuple[Path, int], SearchCache] = {}
+
+
+def _make_store(cache_dir: Path):
+    store = _config["store"]
+    if store == "sqlite":
+        return SQLiteSearchStore(cache_dir / DB_NAME)
+    if store == "json":
+        return JSONSearchStore(cache_dir / JSON_DIR)
+    if store == "memory":
+        return None
+    return store
+
+
+def get_search_cache() -> SearchCache:
+    """Returns the SearchCache bound to the current cache directory and store."""
+    cache_dir = get_cache_dir()
+    key = (cache_dir, id(_config["store"]))
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches.setdefault(key, SearchCache(_make_store(cache_dir), _config["maxsize"]))
+    return cache
+
+
+def cached_search(query: str, top: int, fetch: Callable[[], List[Dict]]) -> List[Dict]:
+    """Runs `fetch` for a search through the configured cache (if enabled)."""
+    from .metadata import offline_mode
+    if not _config["enabled"]:
+        return fetch()
+    key = f"{top}:{' '.join(query.lower().split())}"
+    return get_search_cache().get_or_fetch(key, fetch, offline=offline_mode())
+
+
+def clear_search_cache() -> None:
+    """Drops every cached search result, in memory and on disk."""
+    get_search_cache().clear()
+
+
+def search_cache_stats() -> Dict[str, int]:
+    """Hit/miss counters of this process's search cache."""
+    return get_search_cache().stats()
@@ -0,0 +1,164 @@
+import os
+import threading
+import logging
+from typing import Dict, Optional, Iterable
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the shared connection pool
+DEFAULT_POOL_SIZE = 16
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Process-wide session state, guarded by _session_lock
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+_session_config = {
+    "pool_size": DEFAULT_POOL_SIZE,
+    "max_retries": DEFAULT_MAX_RETRIES,
+    "backoff_factor": DEFAULT_BACKOFF_FACTOR,
+    "status_forcelist": RETRY_STATUS_CODES,
+    "keep_alive": True,
+}
+
+
+def _build_session(config: Dict) -> "requests.Session":
+    """
+    Builds a requests Session with a pooled, retrying HTTP adapter mounted
+    for both http:// and https://.
+    """
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=config["max_retries"],
+        connect=config["max_retries"],
+        read=config["max_retries"],
+        status=config["max_retries"],
+        backoff_factor=config["backoff_factor"],
+        status_forcelist=tuple(config["status_forcelist"]),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=config["pool_size"],
+        pool_maxsize=config["pool_size"],
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not config["keep_alive"]:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def configure_session(
+    pool_size: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+    status_forcelist: Optional[Iterable[int]] = None,
+    keep_alive: Optional[bool] = None,
+) -> None:
+    """
+    Configures the shared HTTP session used for all Kaggle API calls.
+
+    Any argument left as None keeps its current value. The existing session
+    (if any) is closed and rebuilt lazily on next use.
+
+    Args:
+        pool_size (int, optional): Max pooled connections per host.
+        max_retries (int, optional): Retries on connection errors and retryable statuses.
+        backoff_factor (float, optional): Exponential backoff factor between retries.
+        status_forcelist (Iterable[int], optional): HTTP statuses that trigger a retry
+            (default: 429 and 5xx).
+        keep_alive (bool, optional): Set to False to close connections after each request.
+    """
+    updates = {
+        "pool_size": pool_size,
+        "max_retries": max_retries,
+        "backoff_factor": backoff_factor,
+        "status_forcelist": tuple(status_forcelist) if status_forcelist is not None else None,
+        "keep_alive": keep_alive,
+    }
+    with _session_lock:
+        for key, value in updates.items():
+            if value is not None:
+                _session_config[key] = value
+        _close_locked()
+
+
+def get_session() -> "requests.Session":
+    """
+    Returns the process-wide pooled session, creating it on first use.
+
+    The session is rebuilt after a fork so that child processes never share
+    sockets with their parent.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+
+    with _session_lock:
+        if _session is None or _session_pid != pid:
+            logger.debug(f"Creating pooled HTTP session (pool_size={_session_config['pool_size']})")
+            _session = _build_session(_session_config)
+            _session_pid = pid
+        return _session
+
+
+def _close_locked() -> None:
+    """Closes the current session. Caller must hold _session_lock."""
+    global _session, _session_pid
+    if _session is not None and _session_pid == os.getpid():
+        try:
+            _session.close()
+        except Exception as e:
+            logger.debug(f"Failed to close HTTP session: {e}")
+    _session = None
+    _session_pid = None
+
+
+def close_session() -> None:
+    """Closes the shared session and releases all pooled connections."""
+    with _session_lock:
+        _close_locked()
+
+
+def session_stats() -> Dict[str, int]:
+    """
+    Returns connection reuse counters for the shared session.
+
+    Returns:
+        dict: {'requests': ..., 'connections_opened': ..., 'connections_reused': ...,
+               'pools': ...}, aggregated over every host pool of the session.
+    """
+    stats = {"requests": 0, "connections_opened": 0, "connections_reused": 0, "pools": 0}
+    session = _session
+    if session is None or _session_pid != os.getpid():
+        return stats
+
+    seen = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        try:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats["pools"] += 1
+                stats["requests"] += int(pool.num_requests)
+                stats["connections_opened"] += int(pool.num_connections)
+        except Exception as e:
+            logger.debug(f"Could not read connection pool stats: {e}")
+
+    stats["connections_reused"] = max(0, stats["requests"] - stats["connections_opened"])
+    return stats
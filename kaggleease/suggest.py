@@ -0,0 +1,215 @@
+"""
+Local "Did you mean" suggestions and implicit slug resolution.
+
+Handles the user has loaded, listed or downloaded before, plus the local
+catalog, are matched against a mistyped handle by edit distance. Kaggle's
+search API is only asked when no local handle is a confident match.
+Implicit resolution only accepts a local handle with exactly the given slug.
+"""
+import time
+import logging
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Generator, List, Optional, Tuple
+
+from .cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Below this similarity (0-1) a handle is not suggested at all
+MIN_SCORE = 0.6
+# At or above it, a local match is trusted without asking Kaggle
+CONFIDENT_SCORE = 0.85
+# A dataset with the right slug but another owner is still a good guess
+OTHER_OWNER_WEIGHT = 0.9
+# Seconds the locally known handles are reused before being re-read
+LOCAL_TTL = 30
+CATALOG_CANDIDATES = 500
+
+Suggestion = namedtuple("Suggestion", ["handle", "score", "source"])
+Suggestion.__doc__ = "A handle similar to a mistyped one: similarity (0-1) and where it was found."
+
+_local: Dict[Path, Tuple[float, Dict[str, str]]] = {}
+_local_lock = threading.Lock()
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Damerau-Levenshtein (optimal string alignment) distance between a and b,
+    or limit + 1 as soon as it is known to exceed `limit`.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _ratio(a: str, b: str) -> float:
+    if a == b:
+        return 1.0
+    longest = max(len(a), len(b))
+    if not longest:
+        return 0.0
+    limit = int(longest * (1 - MIN_SCORE))
+    return max(0.0, 1 - _edit_distance(a, b, limit) / longest)
+
+
+def similarity(query: str, handle: str) -> float:
+    """
+    How alike a mistyped handle and a known one are (0-1). Slugs are
+    compared, so 'titanc' matches 'owner/titanic'; naming another owner
+    scales the score by OTHER_OWNER_WEIGHT.
+    """
+    q_owner, _, q_slug = query.strip().strip("/").lower().rpartition("/")
+    h_owner, _, h_slug = handle.strip().strip("/").lower().rpartition("/")
+    score = _ratio(q_slug, h_slug)
+    if q_owner and q_owner != h_owner:
+        score *= OTHER_OWNER_WEIGHT
+    return score
+
+
+def _read_local_handles() -> Dict[str, str]:
+    """Handle -> source of every dataset and competition used on this machine."""
+    handles: Dict[str, str] = {}
+    try:
+        from .metadata import get_metadata_cache
+        for h in get_metadata_cache().handles():
+            handles.setdefault(h, "recent")
+    except Exception as e:
+        logger.debug(f"Could not read recent handles: {e}")
+    try:
+        from .eviction import _access_log, _cached_dirs
+        for _, h in _access_log():
+            handles.setdefault(h, "recent")
+        for h, _, _ in _cached_dirs():
+            handles.setdefault(h, "cache")
+    except Exception as e:
+        logger.debug(f"Could not read cached handles: {e}")
+    return handles
+
+
+def _local_handles() -> Dict[str, str]:
+    key = get_cache_dir()
+    with _local_lock:
+        cached = _local.get(key)
+        if cached is not None and time.monotonic() - cached[0] < LOCAL_TTL:
+            return cached[1]
+    handles = _read_local_handles()
+    with _local_lock:
+        _local[key] = (time.monotonic(), handles)
+    return handles
+
+
+def suggest_handles(query: str, top: int = 3) -> List[Suggestion]:
+    """
+    Known handles similar to `query`, best first, without any network call.
+
+    Candidates are handles used on this machine (loaded, listed or cached
+    downloads) and the local catalog; `query` itself is never suggested.
+
+    Args:
+        query (str): A mistyped 'owner/slug' handle or bare slug.
+        top (int): Maximum number of suggestions.
+
+    Returns:
+        List[Suggestion]: Matches scoring at least MIN_SCORE.
+    """
+    target = query.strip().strip("/").lower()
+    candidates = dict(_local_handles())
+    votes: Dict[str, int] = {}
+    try:
+        from .catalog import get_catalog
+        for handle, count in get_catalog().candidates(target, limit=CATALOG_CANDIDATES):
+            candidates.setdefault(handle, "catalog")
+            votes[handle] = count
+    except Exception as e:
+        logger.debug(f"Catalog lookup for suggestions failed: {e}")
+
+    scored = []
+    for handle, source in candidates.items():
+        if handle.lower() == target:
+            continue
+        score = similarity(target, handle)
+        if score >= MIN_SCORE:
+            scored.append(Suggestion(handle, score, source))
+    scored.sort(key=lambda s: (-s.score, -votes.get(s.handle, 0), s.handle))
+    return scored[:top]
+
+
+def _confident(suggestions: List[Suggestion]) -> bool:
+    return bool(suggestions) and suggestions[0].score >= CONFIDENT_SCORE
+
+
+def _local_resolution(slug: str) -> Optional[str]:
+    """
+    A locally known dataset handle whose slug is exactly `slug`, or None.
+    Near misses are only ever suggested, never loaded: 'sales-2024' must
+    not silently load a cached 'acme/sales-2023'.
+    """
+    exact = [s for s in suggest_handles(slug, top=5) if "/" in s.handle and s.score == 1.0]
+    if not exact:
+        return None
+    logger.debug(f"Resolved '{slug}' locally ({exact[0].source})")
+    return exact[0].handle
+
+
+def _merge(remote: List[Dict], local: List[Suggestion], top: int) -> List[Dict]:
+    known = {r["handle"].lower() for r in remote}
+    return (remote + [{"handle": s.handle} for s in local if s.handle.lower() not in known])[:top]
+
+
+def resolve_slug(slug: str, timeout: int = 30) -> Optional[str]:
+    """
+    Resolves a bare slug that is neither a dataset nor a competition to a
+    dataset handle: a local dataset with exactly that slug, else Kaggle's
+    top search hit.
+    """
+    return _with_search(_resolution_steps(slug), timeout)
+
+
+def did_you_mean(handle: str, top: int = 3, timeout: int = 30) -> List[Dict]:
+    """
+    Suggestions for a handle that was not found, as search()-style dicts.
+    Kaggle's search is only asked (for the slug) when no local match is confident.
+    """
+    return _with_search(_suggestion_steps(handle, top), timeout)
+
+
+def _resolution_steps(slug: str) -> Generator:
+    """resolve_slug() as listing steps; yields ("search", query, top) when needed."""
+    resolved = _local_resolution(slug)
+    if resolved:
+        return resolved
+    results = yield ("search", slug, 1)
+    return results[0]["handle"] if results else None
+
+
+def _suggestion_steps(handle: str, top: int) -> Generator:
+    """did_you_mean() as listing steps; yields ("search", query, top) when needed."""
+    local = suggest_handles(handle, top=top)
+    if _confident(local):
+        return [{"handle": s.handle} for s in local]
+    remote = yield ("search", _slug(handle), top)
+    return _merge(remote, local, top)
+
+
+def _with_search(steps: Generator, timeout: int):
+    from .listing import _drive
+    from .search import search
+    return _drive(steps, lambda _, query, top: search(query, top=top, timeout=timeout))
+
+
+def _slug(handle: str) -> str:
+    return handle.strip().strip("/").rsplit("/", 1)[-1]
@@ -37,10 +37,39 @@ def pytest_sessionstart(session):
 
 # --- Fixtures for test-level control ---
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """
+    Point KaggleEase's own cache (metadata, indexes) at a per-test directory.
+    """
+    cache_dir = tmp_path / "kaggleease-cache"
+    monkeypatch.setenv("KAGGLEEASE_CACHE_DIR", str(cache_dir))
+    monkeypatch.delenv("KAGGLEEASE_OFFLINE", raising=False)
+    # Single files go through the (mocked) kagglehub rather than the network
+    monkeypatch.setenv("KAGGLEEASE_DOWNLOADER", "kagglehub")
+    return cache_dir
+
 @pytest.fixture(autouse=True)
 def mock_kagglehub():
     return sys.modules["kagglehub"]
 
+@pytest.fixture
+def dataset_frame():
+    """Contents of the train.csv written by dataset_dir; test modules override it."""
+    import pandas as pd
+    return pd.DataFrame({"a": [1, 2, 3]})
+
+@pytest.fixture
+def dataset_dir(tmp_path, dataset_frame, mock_kagglehub):
+    """
+    A downloaded dataset: tmp_path holding train.csv (dataset_frame), returned
+    by the mocked kagglehub.dataset_download.
+    """
+    dataset_frame.to_csv(tmp_path / "train.csv", index=False)
+    mock_kagglehub.dataset_download.return_value = str(tmp_path)
+    yield tmp_path
+    mock_kagglehub.dataset_download.return_value = "/tmp/mock/dataset"
+
 @pytest.fixture(autouse=True)
 def mock_requests():
     return sys.modules["requests"]
@@ -68,6 +97,7 @@ def mock_client(monkeypatch):
     mock_instance.search_datasets.return_value = [
         {"handle": "test/dataset", "title": "Test Dataset", "size": 1024, "votes": 10}
     ]
+    mock_instance.dataset_version.return_value = 1
     
     import kaggleease.client
     monkeypatch.setattr(kaggleease.client, "KaggleClient", lambda: mock_instance)
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from kaggleease import aio
+from kaggleease.errors import DatasetNotFoundError
+
+
+def test_aload_returns_dataframe(dataset_dir, monkeypatch):
+    async def list_files(self, handle, parallel=None):
+        return [{"name": "train.csv", "size": 10, "type": "dataset"}]
+
+    monkeypatch.setattr(aio.AsyncKaggleClient, "list_files", list_files)
+    df = asyncio.run(aio.aload("test/dataset"))
+    assert list(df["a"]) == [1, 2, 3]
+
+
+def test_aload_keeps_error_types(monkeypatch, mock_client):
+    async def list_files(self, handle, parallel=None):
+        raise DatasetNotFoundError(f"Dataset or Competition '{handle}' not found or inaccessible.")
+
+    # Suggestions go through search() (search cache, local catalog) like the sync path
+    mock_client.search_datasets.return_value = [{"handle": "owner/close-match", "title": "t", "size": 1, "votes": 1}]
+    monkeypatch.setattr(aio.AsyncKaggleClient, "list_files", list_files)
+
+    with pytest.raises(DatasetNotFoundError) as exc:
+        asyncio.run(aio.aload("owner/typo"))
+    assert "owner/close-match" in exc.value.fix_suggestion
+
+
+def test_asearch_formats_results(monkeypatch):
+    async def search_datasets(self, query, top=5):
+        return [{"handle": "a/b", "title": "B", "size": 2048, "votes": 3}]
+
+    monkeypatch.setattr(aio.AsyncKaggleClient, "search_datasets", search_datasets)
+    results = asyncio.run(aio.asearch("b"))
+    assert results == [{"handle": "a/b", "title": "B", "size": "2.0 KB", "votes": 3}]
+
+
+def test_aload_resolves_bare_slug_like_load(dataset_dir, monkeypatch, mock_client):
+    listed = []
+
+    async def list_files(self, handle, parallel=None):
+        listed.append(handle)
+        if "/" not in handle:
+            raise DatasetNotFoundError(f"Dataset or Competition '{handle}' not found or inaccessible.")
+        return [{"name": "train.csv", "size": 10, "type": "dataset"}]
+
+    async def dataset_version(self, handle):
+        return 1
+
+    mock_client.search_datasets.return_value = [{"handle": "owner/sales", "title": "t", "size": 1, "votes": 1}]
+    monkeypatch.setattr(aio.AsyncKaggleClient, "list_files", list_files)
+    monkeypatch.setattr(aio.AsyncKaggleClient, "dataset_version", dataset_version)
+
+    df = asyncio.run(aio.aload("sales"))
+    assert listed == ["sales", "owner/sales"]
+    assert list(df["a"]) == [1, 2, 3]
+
+
+def test_async_list_files_of_a_version(monkeypatch):
+    calls = []
+
+    async def get(self, url, params=None):
+        calls.append((url, params))
+        return type("Response", (), {"status_code": 200, "json": lambda self: {"files": []}})()
+
+    monkeypatch.setattr(aio.AsyncKaggleClient, "_get", get)
+    monkeypatch.setattr(aio.AsyncKaggleClient, "_ensure_auth", lambda self: None)
+    asyncio.run(aio.AsyncKaggleClient().list_files("owner/data", version=4))
+    assert calls == [(f"{aio.AsyncKaggleClient.BASE_URL}/datasets/list/files/owner/data", {"datasetVersionNumber": 4})]
+
+
+def test_aload_passes_load_options_through(dataset_dir, monkeypatch, mock_kagglehub):
+    listed = []
+
+    async def list_files(self, handle, parallel=None, version=None):
+        listed.append((handle, version))
+        return [{"name": "train.csv", "size": 10, "type": "dataset"}]
+
+    monkeypatch.setattr(aio.AsyncKaggleClient, "list_files", list_files)
+    mock_kagglehub.dataset_download.reset_mock()
+    df = asyncio.run(aio.aload("o/s", version=2, cache_first=False))
+    assert list(df["a"]) == [1, 2, 3]
+    assert listed == [("o/s", 2)]
+    assert mock_kagglehub.dataset_download.call_args.args[0] == "o/s/versions/2"
+
+    df = asyncio.run(aio.aload("o/s", files="*.csv", source_column="source"))
+    assert list(df["source"]) == ["train.csv"] * 3
+
+
+def test_aload_streams_only_on_threads(dataset_dir, monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    async def list_files(self, handle, parallel=None):
+        return [{"name": "train.csv", "size": 10, "type": "dataset"}]
+
+    monkeypatch.setattr(aio.AsyncKaggleClient, "list_files", list_files)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError, match="process pool"):
+            asyncio.run(aio.aload("o/s", stream=True, executor=executor))
+
+    chunks = asyncio.run(aio.aload("o/s", stream=True, batch_rows=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+
+def test_listing_cache_is_read_off_the_event_loop(monkeypatch):
+    import threading
+    from kaggleease import listing
+
+    threads = []
+    cached_listing = listing._cached_listing
+
+    def recording(handle):
+        threads.append(threading.current_thread().name)
+        return cached_listing(handle)
+
+    async def list_files(self, handle, parallel=None):
+        return [{"name": "train.csv", "size": 10, "type": "dataset"}]
+
+    async def dataset_version(self, handle):
+        return 1
+
+    monkeypatch.setattr(listing, "_cached_listing", recording)
+    monkeypatch.setattr(aio.AsyncKaggleClient, "list_files", list_files)
+    monkeypatch.setattr(aio.AsyncKaggleClient, "dataset_version", dataset_version)
+    asyncio.run(aio._aget_dataset_files(aio.AsyncKaggleClient(), "o/s"))
+    assert threads and all(name.startswith("kaggleease-io") for name in threads)
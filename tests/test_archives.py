@@ -0,0 +1,130 @@
+import bz2
+import gzip
+import io
+import os
+import sqlite3
+import zipfile
+
+import pandas as pd
+import pytest
+
+from kaggleease.archives import format_name, split_archive_path, uncompressed_size
+from kaggleease.errors import DataFormatError
+from kaggleease.readers import is_tabular, iter_file, read_file
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"id": range(10), "name": [f"n{i}" for i in range(10)]})
+
+
+def _csv_bytes(frame):
+    return frame.to_csv(index=False).encode()
+
+
+def test_names_of_packed_files(tmp_path):
+    archive = tmp_path / "data.zip"
+    archive.write_bytes(b"")
+    assert split_archive_path(str(archive / "train" / "a.csv")) == (str(archive), "train/a.csv")
+    assert format_name("train.csv.gz") == "train.csv"
+    assert format_name("Train.CSV.zip") == "train.csv"
+    assert is_tabular("data.zip/sub/train.parquet")
+    assert not is_tabular("images.zip")
+
+
+def test_gzip_and_bz2_csv(tmp_path, frame):
+    gz = tmp_path / "data.csv.gz"
+    gz.write_bytes(gzip.compress(_csv_bytes(frame)))
+    bz = tmp_path / "data.csv.bz2"
+    bz.write_bytes(bz2.compress(_csv_bytes(frame)))
+
+    pd.testing.assert_frame_equal(read_file(str(gz)), frame)
+    chunks = list(iter_file(str(bz), batch_rows=4))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert uncompressed_size(str(gz)) == len(_csv_bytes(frame))
+
+
+def test_gzip_trailer_not_trusted_past_4gb(tmp_path, frame, monkeypatch):
+    from kaggleease import archives
+    gz = tmp_path / "data.csv.gz"
+    gz.write_bytes(gzip.compress(_csv_bytes(frame)))
+    # Pretend the file could inflate past 4GB, where the trailer wraps around
+    monkeypatch.setattr(archives, "MAX_DEFLATE_RATIO", 2**32)
+
+    assert uncompressed_size(str(gz)) == gz.stat().st_size * archives.ASSUMED_RATIO
+
+
+def test_zip_members_without_extraction(tmp_path, frame):
+    archive = tmp_path / "data.zip"
+    parquet = io.BytesIO()
+    frame.to_parquet(parquet)
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("train.csv", _csv_bytes(frame))
+        zf.writestr("nested/test.parquet", parquet.getvalue())
+        zf.writestr("rows.jsonl", frame.to_json(orient="records", lines=True))
+
+    pd.testing.assert_frame_equal(read_file(os.path.join(archive, "train.csv")), frame)
+    pd.testing.assert_frame_equal(read_file(os.path.join(archive, "nested", "test.parquet")), frame)
+    pd.testing.assert_frame_equal(read_file(os.path.join(archive, "rows.jsonl")), frame)
+    table = read_file(os.path.join(archive, "train.csv"), backend="arrow", columns=["id"])
+    assert table.column_names == ["id"]
+    reader = iter_file(os.path.join(archive, "train.csv"), batch_rows=4, backend="arrow")
+    assert reader.read_all().num_rows == 10
+    assert sorted(os.listdir(tmp_path)) == ["data.zip"]
+
+
+def test_ambiguous_archive_needs_a_member(tmp_path, frame):
+    archive = tmp_path / "parts.csv.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.csv", _csv_bytes(frame))
+        zf.writestr("b.csv", _csv_bytes(frame))
+    with pytest.raises(DataFormatError):
+        read_file(str(archive))
+
+
+def test_sqlite_member(tmp_path, frame):
+    db = tmp_path / "data.sqlite"
+    with sqlite3.connect(db) as conn:
+        frame.to_sql("people", conn, index=False)
+    archive = tmp_path / "data.sqlite.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(db, "data.sqlite")
+    os.remove(db)
+
+    pd.testing.assert_frame_equal(read_file(str(archive)), frame)
+
+
+def test_zstd_csv(tmp_path, frame):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "data.csv.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(_csv_bytes(frame)))
+    pd.testing.assert_frame_equal(read_file(str(path)), frame)
+
+
+def test_7z_member(tmp_path, frame):
+    py7zr = pytest.importorskip("py7zr")
+    source = tmp_path / "train.csv"
+    frame.to_csv(source, index=False)
+    archive = tmp_path / "data.7z"
+    with py7zr.SevenZipFile(archive, "w") as sz:
+        sz.write(source, "train.csv")
+    pd.testing.assert_frame_equal(read_file(os.path.join(archive, "train.csv")), frame)
+
+
+def test_load_resolves_member_of_unextracted_zip(tmp_path, frame, mock_kagglehub, mock_client):
+    from kaggleease import load
+    download = tmp_path / "download"
+    download.mkdir()
+    with zipfile.ZipFile(download / "bundle.zip", "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("train.csv", _csv_bytes(frame))
+        zf.writestr("README.txt", "not data")
+    mock_client.list_files.return_value = [{"name": "bundle.zip", "size": 100, "type": "dataset"}]
+    mock_kagglehub.dataset_download.return_value = str(download)
+    try:
+        df = load("test/dataset")
+        shards = load("test/dataset", files="*.csv", source_column="source", parse_workers=1)
+    finally:
+        mock_kagglehub.dataset_download.return_value = "/tmp/mock/dataset"
+
+    pd.testing.assert_frame_equal(df, frame)
+    assert list(shards["source"].unique()) == ["bundle.zip/train.csv"]
@@ -5,4 +5,10 @@ def test_mocked_download(mock_kagglehub, mock_auth, mock_client):
     from kaggleease import load
     load("test/dataset")
     
+    mock_kagglehub.dataset_download.assert_called_with("test/dataset", path="train.csv")
+
+def test_download_all_fetches_whole_dataset(mock_kagglehub, mock_auth, mock_client):
+    from kaggleease import load
+    load("test/dataset", download_all=True)
+
     mock_kagglehub.dataset_download.assert_called_with("test/dataset")
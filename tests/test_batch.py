@@ -0,0 +1,88 @@
+import time
+
+import pandas as pd
+import pytest
+
+from kaggleease.batch import load_many
+from kaggleease.errors import DatasetNotFoundError, NetworkError
+
+
+def test_load_many_returns_frames_and_timings(dataset_dir):
+    res = load_many(["one/a", "two/b"], max_workers=2, parse_executor="thread")
+
+    assert list(res) == ["one/a", "two/b"]
+    assert all(isinstance(v, pd.DataFrame) for v in res.values())
+    assert set(res.timings["one/a"]) == {"metadata", "download", "parse", "total"}
+
+
+def test_load_many_return_exceptions(dataset_dir, mock_client):
+    def list_files(handle):
+        if handle == "bad/one":
+            raise DatasetNotFoundError("nope")
+        return [{"name": "train.csv", "size": 1, "type": "dataset"}]
+
+    mock_client.list_files.side_effect = list_files
+    res = load_many(["good/one", "bad/one"], parse_executor="thread", return_exceptions=True)
+
+    assert isinstance(res["good/one"], pd.DataFrame)
+    assert isinstance(res.errors["bad/one"], DatasetNotFoundError)
+
+    with pytest.raises(DatasetNotFoundError):
+        load_many(["bad/one"], parse_executor="thread")
+
+
+def test_load_many_parses_in_processes(dataset_dir):
+    res = load_many(["one/a", "two/b"], parse_workers=2, parse_executor="process")
+
+    assert list(res) == ["one/a", "two/b"]
+    pd.testing.assert_frame_equal(res["one/a"], pd.DataFrame({"a": [1, 2, 3]}))
+
+
+def test_load_many_repeated_handles(dataset_dir):
+    res = load_many(["one/a", "one/a", ("two/b", "train.csv"), ("two/b", "train.csv")], parse_executor="thread")
+    assert list(res) == ["one/a", "two/b"]
+
+    with pytest.raises(ValueError, match="two/b"):
+        load_many([("two/b", "train.csv"), ("two/b", "test.csv")], parse_executor="thread")
+
+
+def test_load_many_returns_path_when_parsing_fails(dataset_dir, monkeypatch):
+    from kaggleease import batch
+
+    def broken(path, **kwargs):
+        raise UnicodeDecodeError("utf-8", b"", 0, 1, "bad byte")
+
+    monkeypatch.setattr(batch, "_read_local", broken)
+    res = load_many(["one/a"], parse_executor="thread")
+    assert res["one/a"] == str(dataset_dir)
+
+
+def test_load_many_passes_load_options_through(dataset_dir, mock_client, mock_kagglehub):
+    mock_kagglehub.dataset_download.reset_mock()
+    res = load_many(["o/s"], version=2, cache_first=False, parse_executor="thread")
+
+    assert isinstance(res["o/s"], pd.DataFrame)
+    mock_client.list_files.assert_called_with("o/s", version=2)
+    assert mock_kagglehub.dataset_download.call_args.args[0] == "o/s/versions/2"
+
+    res = load_many(["o/s"], files="*.csv", source_column="source", parse_executor="thread")
+    assert list(res["o/s"]["source"]) == ["train.csv"] * 3
+
+
+def test_load_many_streams_only_on_threads(dataset_dir):
+    with pytest.raises(ValueError, match="parse_executor"):
+        load_many(["o/s"], stream=True)
+
+    res = load_many(["o/s"], stream=True, batch_rows=2, parse_executor="thread")
+    assert [len(chunk) for chunk in res["o/s"]] == [2, 1]
+
+
+def test_load_many_parse_timeout_is_an_error(dataset_dir, monkeypatch):
+    from kaggleease import batch
+
+    def slow(path, **kwargs):
+        time.sleep(2)
+
+    monkeypatch.setattr(batch, "_read_local", slow)
+    with pytest.raises(NetworkError, match="within 0.5s"):
+        load_many(["o/s"], timeout=0.5, parse_executor="thread")
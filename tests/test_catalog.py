@@ -0,0 +1,80 @@
+import json
+
+from click.testing import CliRunner
+
+from kaggleease import catalog
+from kaggleease.cli import cli
+from kaggleease.errors import NetworkError
+from kaggleease.search import search
+
+DATASETS = [
+    {"handle": "a/titanic", "title": "Titanic Survival", "size": 60000, "votes": 5},
+    {"handle": "b/titanic-extended", "title": "Titanic passengers, extended", "size": 900000, "votes": 900},
+    {"handle": "c/house-prices", "title": "House Prices", "size": 400000, "votes": 50},
+    {"handle": "d/iris", "title": "Iris Species", "size": 5000, "votes": 300},
+]
+
+
+def _serve(mock_client, datasets):
+    calls = []
+
+    def search_page(query, page=1, page_size=20, filters=None, timeout=30):
+        calls.append((page, filters))
+        return datasets[(page - 1) * page_size:page * page_size]
+    mock_client.search_page.side_effect = search_page
+    return calls
+
+
+def test_sync_and_search_offline(mock_client, monkeypatch):
+    _serve(mock_client, DATASETS)
+    assert catalog.sync_catalog(page_size=2) == catalog.SyncResult(4, 4, 0)
+
+    assert [d["handle"] for d in catalog.catalog_search("titanic")] == ["b/titanic-extended", "a/titanic"]
+    assert [d["handle"] for d in catalog.catalog_search("titan surv")] == ["a/titanic"]
+    assert catalog.catalog_search("titanic", sort_by="size")[0]["size"] == 900000
+    assert catalog.catalog_search("nothing-like-this") == []
+
+    monkeypatch.setenv("KAGGLEEASE_OFFLINE", "1")
+    mock_client.search_datasets.reset_mock()
+    assert search("iris")[0]["handle"] == "d/iris"
+    mock_client.search_datasets.assert_not_called()
+
+
+def test_incremental_sync_stops_at_known_datasets(mock_client):
+    calls = _serve(mock_client, DATASETS)
+    catalog.sync_catalog(page_size=2)
+    assert calls[0][1]["sort_by"] == "updated"
+
+    changed = [dict(DATASETS[0], votes=6)] + DATASETS[1:]
+    calls = _serve(mock_client, changed)
+    assert catalog.sync_catalog(page_size=2) == catalog.SyncResult(4, 0, 1)
+    calls = _serve(mock_client, changed)
+    assert catalog.sync_catalog(page_size=2) == catalog.SyncResult(2, 0, 0)
+    assert len(calls) <= 2
+    assert catalog.catalog_search("titanic survival")[0]["votes"] == 6
+
+
+def test_catalog_answers_when_api_fails_or_preferred(mock_client):
+    _serve(mock_client, DATASETS)
+    catalog.sync_catalog()
+    mock_client.search_datasets.side_effect = NetworkError("down")
+    assert search("house")[0]["handle"] == "c/house-prices"
+
+    mock_client.search_datasets.side_effect = None
+    mock_client.search_datasets.reset_mock()
+    catalog.configure_catalog(prefer=True)
+    try:
+        assert search("iris species")[0]["handle"] == "d/iris"
+        mock_client.search_datasets.assert_not_called()
+    finally:
+        catalog._config["prefer"] = None
+
+
+def test_catalog_cli(mock_client):
+    _serve(mock_client, DATASETS)
+    runner = CliRunner()
+    result = runner.invoke(cli, ["catalog", "sync", "--max-results", "3"])
+    assert result.exit_code == 0 and "3 new" in result.output
+    found = json.loads(runner.invoke(cli, ["catalog", "search", "house", "--json"]).output)
+    assert found[0]["handle"] == "c/house-prices"
+    assert json.loads(runner.invoke(cli, ["catalog", "info", "--json"]).output)["datasets"] == 3
@@ -0,0 +1,40 @@
+import json
+
+from click.testing import CliRunner
+
+from kaggleease.cli import cli
+
+
+def test_search_plain_text(mock_client):
+    result = CliRunner().invoke(cli, ["search", "test"])
+    assert result.exit_code == 0
+    header, row = result.output.splitlines()
+    assert header.split() == ["handle", "title", "size", "votes"]
+    assert row.startswith("test/dataset")
+
+
+def test_search_json(mock_client):
+    result = CliRunner().invoke(cli, ["search", "json-query", "--json"])
+    assert json.loads(result.output)[0]["handle"] == "test/dataset"
+
+
+def test_files_json(mock_client):
+    result = CliRunner().invoke(cli, ["files", "test/dataset", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [{"name": "train.csv", "size": 1024, "type": "dataset"}]
+
+
+def test_info(mock_client):
+    result = CliRunner().invoke(cli, ["info", "test/dataset", "--json"])
+    summary = json.loads(result.output)
+    assert summary["type"] == "dataset"
+    assert summary["files"] == 1
+    assert summary["local_path"] is None
+
+
+def test_files_not_found_exits_nonzero(mock_client):
+    mock_client.list_files.side_effect = Exception("404 not found")
+    mock_client.search_datasets.return_value = []
+    result = CliRunner().invoke(cli, ["files", "missing/dataset"])
+    assert result.exit_code == 1
+    assert "not found" in result.output.lower()
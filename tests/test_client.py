@@ -0,0 +1,142 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import kaggleease.client as client_mod
+from kaggleease.client import KaggleClient  # real class, captured before fixtures patch it
+from kaggleease.errors import DatasetNotFoundError
+
+
+def _fake_session(routes, delays=None):
+    """A session whose get() answers by URL substring, optionally after a delay."""
+    delays = delays or {}
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        for fragment, (status, payload) in routes.items():
+            if fragment in url:
+                time.sleep(delays.get(fragment, 0))
+                resp = MagicMock(status_code=status)
+                resp.json.return_value = payload
+                return resp
+        return MagicMock(status_code=404)
+
+    session = MagicMock()
+    session.get.side_effect = get
+    session.calls = calls
+    return session
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client_mod._endpoint_memo.clear()
+    c = KaggleClient()
+    c.auth = ("user", "key")
+    return c
+
+
+def test_serial_falls_through_to_competition(client, monkeypatch):
+    session = _fake_session({"competitions/storage": (200, [{"name": "train.csv", "totalBytes": 10}])})
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+
+    files = client.list_files("titanic", parallel=False)
+    assert files == [{"name": "train.csv", "size": 10, "type": "competition"}]
+    assert client_mod._endpoint_memo["titanic"] == "competition"
+
+
+def test_parallel_competition_when_not_a_dataset(client, monkeypatch):
+    session = _fake_session(
+        {
+            "datasets/list/files": (404, None),
+            "competitions/storage": (200, {"files": [{"name": "a.csv", "totalBytes": 1}]}),
+            "datasets/list": (200, []),
+        },
+        delays={"competitions/storage": 0.2},
+    )
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+
+    start = time.perf_counter()
+    files = client.list_files("someone/comp", parallel=True)
+    # Both endpoints were queried at once
+    assert time.perf_counter() - start < 0.4
+    assert files[0]["type"] == "competition"
+    assert client_mod._endpoint_memo["someone/comp"] == "competition"
+
+
+@pytest.mark.parametrize("competition, expected", [
+    ((200, {"files": [{"name": "a.csv", "totalBytes": 1}]}), "competition"),
+    ((404, None), "dataset"),
+])
+def test_parallel_search_starts_with_the_probes(client, monkeypatch, competition, expected):
+    session = _fake_session(
+        {
+            "competitions/storage": competition,
+            "datasets/list": (200, [{"ref": "titanic", "totalBytes": 5}]),
+        },
+        delays={"competitions/storage": 0.2, "datasets/list": 0.2},
+    )
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+
+    start = time.perf_counter()
+    files = client.list_files("titanic", parallel=True)
+
+    # One round trip for both, and search only answers when the competition probe is empty
+    assert time.perf_counter() - start < 0.35
+    assert files[0]["type"] == expected
+    assert len(session.calls) == 2
+
+
+def test_parallel_dataset_takes_precedence(client, monkeypatch):
+    session = _fake_session(
+        {
+            "datasets/list/files": (200, {"files": [{"name": "d.csv", "totalBytes": 1}]}),
+            "competitions/storage": (200, {"files": [{"name": "c.csv", "totalBytes": 1}]}),
+        },
+        delays={"datasets/list/files": 0.2},
+    )
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+
+    files = client.list_files("someone/both", parallel=True)
+    assert files[0]["type"] == "dataset"
+    assert client_mod._endpoint_memo["someone/both"] == "dataset"
+
+
+def test_endpoint_memo_is_bounded(client, monkeypatch):
+    session = _fake_session({"competitions/storage": (200, [])})
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+    monkeypatch.setattr(client_mod, "ENDPOINT_MEMO_SIZE", 2)
+
+    for slug in ("a", "b", "c"):
+        client.list_files(slug)
+    assert list(client_mod._endpoint_memo) == ["b", "c"]
+
+
+def test_remembered_endpoint_is_used_directly(client, monkeypatch):
+    session = _fake_session({"competitions/storage": (200, [])})
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+
+    client.list_files("titanic")
+    session.calls.clear()
+    client.list_files("titanic")
+    assert len(session.calls) == 1 and "competitions/storage" in session.calls[0]
+
+
+def test_parallel_not_found(client, monkeypatch):
+    session = _fake_session({"datasets/list/files": (404, None), "datasets/list": (200, [])})
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+
+    with pytest.raises(DatasetNotFoundError):
+        client.list_files("nobody/nothing", parallel=True)
+
+
+def test_list_files_of_a_version(client, monkeypatch):
+    session = _fake_session({"datasets/list/files": (200, [{"name": "old.csv", "totalBytes": 1}])})
+    monkeypatch.setattr(client_mod, "get_session", lambda: session)
+
+    files = client.list_files("owner/data", version=3)
+    assert files[0]["name"] == "old.csv"
+    assert session.get.call_args.kwargs["params"] == {"datasetVersionNumber": 3}
+    # Pinned versions are not remembered as the handle's endpoint
+    assert "owner/data" not in client_mod._endpoint_memo
@@ -0,0 +1,57 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from kaggleease import load
+from kaggleease.combine import match_files
+from kaggleease.errors import DataFormatError
+
+
+@pytest.fixture
+def sharded_dir(tmp_path, mock_kagglehub):
+    (tmp_path / "train").mkdir()
+    for i in (1, 2, 10):
+        pd.DataFrame({"id": [i], "x": [i * 1.5]}).to_csv(tmp_path / "train" / f"part-{i}.csv", index=False)
+    # A later shard gained a column
+    pd.DataFrame({"id": [11], "x": [0.5], "extra": ["e"]}).to_csv(tmp_path / "train" / "part-11.csv", index=False)
+    (tmp_path / "README.md").write_text("docs")
+    mock_kagglehub.dataset_download.return_value = str(tmp_path)
+    yield tmp_path
+    mock_kagglehub.dataset_download.return_value = "/tmp/mock/dataset"
+
+
+def test_match_files_natural_order():
+    names = ["train/part-10.csv", "train/part-2.csv", "test/part-1.csv", "train/notes.txt"]
+    assert match_files(names, "train/*.csv") == ["train/part-2.csv", "train/part-10.csv"]
+    assert match_files(names, "part-1*.csv") == ["test/part-1.csv", "train/part-10.csv"]
+
+
+def test_concat_with_source_column(sharded_dir):
+    df = load("owner/shards", files="train/*.csv", source_column="source", parse_workers=2)
+
+    assert df["id"].tolist() == [1, 2, 10, 11]
+    assert df["source"].astype(str).tolist()[-1] == "train/part-11.csv"
+    # Union schema: missing column filled with nulls
+    assert df["extra"].isna().sum() == 3
+
+
+def test_schema_intersection_and_strict(sharded_dir):
+    df = load("owner/shards", files="train/*.csv", schema="intersection", parse_workers=1)
+    assert list(df.columns) == ["id", "x"]
+
+    with pytest.raises(DataFormatError):
+        load("owner/shards", files="train/*.csv", schema="strict", parse_workers=1)
+
+
+def test_arrow_concat_and_dict(sharded_dir):
+    table = load("owner/shards", files="*.csv", engine="arrow", parse_workers=2)
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 4
+
+    parts = load("owner/shards", files=["train/part-1.csv", "train/part-2.csv"], combine="dict", parse_workers=1)
+    assert list(parts) == ["train/part-1.csv", "train/part-2.csv"]
+
+
+def test_no_match_raises(sharded_dir):
+    with pytest.raises(DataFormatError):
+        load("owner/shards", files="valid/*.csv")
@@ -0,0 +1,316 @@
+import base64
+import hashlib
+import importlib
+import io
+import os
+import sys
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import kaggleease.session as session_mod
+from kaggleease import download
+from kaggleease.errors import IntegrityError, NetworkError
+
+PAYLOAD = os.urandom(256 * 1024 + 123)
+
+
+class StandInServer:
+    """Local HTTP server serving PAYLOAD with Range support and fault injection."""
+
+    def __init__(self, ranges=True, drop_after=None, drops=0, payload=PAYLOAD, headers=None,
+                 goog_hash=True, content_md5=False):
+        self.ranges = ranges
+        self.payload = payload
+        self.headers = headers or {}
+        self.drop_after = drop_after  # bytes sent before a dropped response
+        self.drops = drops            # how many responses to drop
+        self.requests = []
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                payload = server.payload
+                start, end = 0, len(payload) - 1
+                header = self.headers.get("Range")
+                partial = server.ranges and header is not None
+                if partial:
+                    first, last = header.split("=")[1].split("-")
+                    start, end = int(first), int(last or end)
+                body = payload[start:end + 1]
+                with server.lock:
+                    server.requests.append((start, end) if partial else None)
+                    drop = server.drops > 0 and len(body) > 1
+                    if drop:
+                        server.drops -= 1
+
+                self.send_response(206 if partial else 200)
+                if partial:
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", '"v1"')
+                if goog_hash:
+                    md5 = base64.b64encode(hashlib.md5(payload).digest()).decode()
+                    self.send_header("x-goog-hash", f"crc32c=AAAAAA==,md5={md5}")
+                if content_md5:
+                    # Per RFC 1864 this covers the body actually sent, not the whole file
+                    self.send_header("Content-MD5", base64.b64encode(hashlib.md5(body).digest()).decode())
+                for name, value in server.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if drop:
+                    body = body[:server.drop_after]
+                    self.close_connection = True
+                self.wfile.write(body)
+                with server.lock:
+                    server.bytes_sent += len(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/file.bin"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _real_requests():
+    """The installed requests package (conftest replaces `requests` with a mock)."""
+    mocked = sys.modules.pop("requests")
+    try:
+        return importlib.import_module("requests")
+    finally:
+        sys.modules["requests"] = mocked
+
+
+REAL_REQUESTS = _real_requests()
+
+
+@pytest.fixture
+def http_session(monkeypatch):
+    """A real pooled session talking to the stand-in server."""
+    monkeypatch.setattr(session_mod, "requests", REAL_REQUESTS)
+    config = dict(session_mod._session_config, max_retries=0)
+    session = session_mod._build_session(config)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def server_factory():
+    servers = []
+
+    def make(**kwargs):
+        servers.append(StandInServer(**kwargs))
+        return servers[-1]
+
+    yield make
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture(autouse=True)
+def small_parts(monkeypatch):
+    monkeypatch.setitem(download._config, "min_part_size", 32 * 1024)
+    monkeypatch.setattr(download, "RETRY_BASE_DELAY", 0)
+    monkeypatch.setattr(download, "CHUNK_SIZE", 4 * 1024)
+
+
+def test_parallel_ranges(tmp_path, http_session, server_factory):
+    server = server_factory()
+    dest = tmp_path / "file.bin"
+
+    download.download_file(server.url, str(dest), session=http_session, connections=4)
+
+    assert dest.read_bytes() == PAYLOAD
+    assert len([r for r in server.requests[1:] if r]) == 4
+    assert not (tmp_path / "file.bin.part").exists()
+    assert not (tmp_path / "file.bin.part.json").exists()
+
+
+def test_dropped_connections_only_refetch_lost_bytes(tmp_path, http_session, server_factory):
+    server = server_factory(drop_after=20 * 1024, drops=3)
+    dest = tmp_path / "file.bin"
+
+    download.download_file(server.url, str(dest), session=http_session, connections=4)
+
+    assert dest.read_bytes() == PAYLOAD
+    # Retries resumed mid-range instead of starting over
+    assert any(start % (len(PAYLOAD) // 4 + 1) for start, _ in filter(None, server.requests[1:]))
+    assert server.bytes_sent < len(PAYLOAD) + 3 * 20 * 1024
+
+
+def test_resume_across_calls(tmp_path, http_session, server_factory, monkeypatch):
+    monkeypatch.setitem(download._config, "part_retries", 0)
+    flaky = server_factory(drop_after=50 * 1024, drops=1)
+    dest = tmp_path / "file.bin"
+
+    with pytest.raises(NetworkError):
+        download.download_file(flaky.url, str(dest), session=http_session, connections=1)
+    assert (tmp_path / "file.bin.part.json").exists()
+
+    flaky.requests.clear()
+    download.download_file(flaky.url, str(dest), session=http_session, connections=1)
+
+    assert dest.read_bytes() == PAYLOAD
+    resumed_from = flaky.requests[1][0]
+    assert resumed_from > 0
+
+
+def test_checksum_mismatch_discards_partial(tmp_path, http_session, server_factory):
+    server = server_factory()
+    dest = tmp_path / "file.bin"
+
+    with pytest.raises(IntegrityError):
+        download.download_file(server.url, str(dest), session=http_session, checksum="sha256:00")
+    assert not dest.exists()
+    assert not (tmp_path / "file.bin.part").exists()
+
+    digest = hashlib.sha256(PAYLOAD).hexdigest()
+    download.download_file(server.url, str(dest), session=http_session, checksum=f"sha256:{digest}")
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_server_without_ranges(tmp_path, http_session, server_factory):
+    server = server_factory(ranges=False)
+    dest = tmp_path / "file.bin"
+
+    download.download_file(server.url, str(dest), session=http_session, connections=4)
+
+    assert dest.read_bytes() == PAYLOAD
+    assert all(r is None for r in server.requests)
+
+
+def test_fetch_file_uses_kagglehub_layout(tmp_path, http_session, server_factory, mock_client, monkeypatch):
+    from kaggleease.cache import find_cached_download
+
+    server = server_factory()
+    monkeypatch.setenv("KAGGLEHUB_CACHE", str(tmp_path / "hub"))
+    monkeypatch.setattr(download, "API_BASE_URL", server.url.rsplit("/", 1)[0])
+    monkeypatch.setattr(download, "get_session", lambda: http_session)
+    mock_client.auth = None
+    mock_client.dataset_version.return_value = 3
+
+    path, version = download.fetch_file("owner/data", "dataset", "sub/train.csv")
+
+    assert version == 3
+    assert path == str(tmp_path / "hub" / "datasets" / "owner" / "data" / "versions" / "3" / "sub" / "train.csv")
+    assert open(path, "rb").read() == PAYLOAD
+    assert find_cached_download("owner/data", file_path="sub/train.csv")[2] == 3
+
+
+def test_cache_first_reload_of_a_single_file_download(tmp_path, http_session, server_factory, mock_client,
+                                                      mock_auth, monkeypatch):
+    from kaggleease import load
+    from kaggleease.cache import find_cached_download
+
+    server = server_factory(payload=b"a,b\n1,2\n")
+    monkeypatch.setenv("KAGGLEHUB_CACHE", str(tmp_path / "hub"))
+    monkeypatch.setenv("KAGGLEEASE_DOWNLOADER", "ranged")
+    monkeypatch.setattr(download, "API_BASE_URL", server.url.rsplit("/", 1)[0])
+    monkeypatch.setattr(download, "get_session", lambda: http_session)
+    mock_client.auth = None
+    mock_client.dataset_version.return_value = 3
+    mock_client.list_files.return_value = [
+        {"name": "train.csv", "size": 8, "type": "dataset"},
+        {"name": "images.zip", "size": 10**9, "type": "dataset"},
+    ]
+
+    assert load("owner/data")["b"].tolist() == [2]
+    assert find_cached_download("owner/data")[2] == 3
+
+    mock_client.list_files.reset_mock()
+    mock_auth.reset_mock()
+    df = load("owner/data", cache_first=True, revalidate=False)
+    assert df["b"].tolist() == [2]
+    mock_client.list_files.assert_not_called()
+    mock_auth.assert_not_called()
+
+
+def test_ranged_content_md5_is_not_used_for_the_whole_file(tmp_path, http_session, server_factory):
+    server = server_factory(goog_hash=False, content_md5=True)
+    dest = tmp_path / "file.bin"
+
+    download.download_file(server.url, str(dest), session=http_session, connections=4)
+
+    assert dest.read_bytes() == PAYLOAD
+
+
+def _zip_bytes(name, data):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("file_path, headers, unwrapped", [
+    ("train.csv", {"Content-Type": "application/zip"}, True),
+    ("train.csv", {"Content-Disposition": 'attachment; filename="train.csv.zip"'}, True),
+    ("arrays.npz", {"Content-Type": "application/octet-stream"}, False),
+    ("arrays.npz", {"Content-Disposition": 'attachment; filename="arrays.npz"'}, False),
+])
+def test_fetch_file_unwraps_only_zipped_responses(tmp_path, http_session, server_factory, mock_client,
+                                                  monkeypatch, file_path, headers, unwrapped):
+    payload = _zip_bytes(file_path, b"a,b\n1,2\n")
+    server = server_factory(payload=payload, headers=headers)
+    monkeypatch.setenv("KAGGLEHUB_CACHE", str(tmp_path / "hub"))
+    monkeypatch.setattr(download, "API_BASE_URL", server.url.rsplit("/", 1)[0])
+    monkeypatch.setattr(download, "get_session", lambda: http_session)
+    mock_client.auth = None
+    mock_client.dataset_version.return_value = 1
+
+    path, _ = download.fetch_file("owner/data", "dataset", file_path)
+
+    assert open(path, "rb").read() == (b"a,b\n1,2\n" if unwrapped else payload)
+
+
+def test_load_fetches_only_the_selected_file(tmp_path, mock_client, monkeypatch):
+    import pandas as pd
+    from kaggleease import load
+
+    root = tmp_path / "versions" / "2"
+    (root / "sub").mkdir(parents=True)
+    pd.DataFrame({"a": [1, 2]}).to_csv(root / "sub" / "train.csv", index=False)
+    mock_client.list_files.return_value = [
+        {"name": "sub/train.csv", "size": 10, "type": "dataset"},
+        {"name": "images.zip", "size": 10**9, "type": "dataset"},
+    ]
+    calls = []
+
+    def fake_fetch(handle, res_type, file_path, version=None):
+        calls.append(file_path)
+        return str(root / "sub" / "train.csv"), 2
+
+    monkeypatch.setenv("KAGGLEEASE_DOWNLOADER", "ranged")
+    monkeypatch.setattr(download, "fetch_file", fake_fetch)
+
+    df = load("owner/data")
+
+    assert calls == ["sub/train.csv"]
+    assert list(df["a"]) == [1, 2]
+
+
+def test_ranged_failure_falls_back_to_kagglehub(tmp_path, mock_kagglehub, monkeypatch):
+    from kaggleease.load import _download
+
+    def failing_fetch(*args, **kwargs):
+        raise NetworkError("connection reset")
+
+    monkeypatch.setenv("KAGGLEEASE_DOWNLOADER", "ranged")
+    monkeypatch.setattr(download, "fetch_file", failing_fetch)
+    local = tmp_path / "comp" / "train.csv"
+    mock_kagglehub.competition_download.return_value = str(local)
+    try:
+        path = _download("titanic", "competition", files=["train.csv"])
+    finally:
+        mock_kagglehub.competition_download.return_value = "/tmp/mock/competition"
+
+    mock_kagglehub.competition_download.assert_called_with("titanic", path="train.csv")
+    assert path == str(tmp_path / "comp")
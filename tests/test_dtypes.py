@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaggleease import load
+from kaggleease.dtypes import DtypeOptimizer, concat_chunks, downcast_numeric
+
+
+@pytest.fixture
+def frame():
+    n = 1000
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "small": np.arange(n) % 7,
+        "ratio": (np.arange(n) % 4) / 4,
+        "age": [None if i % 10 == 0 else i % 90 for i in range(n)],
+        "city": np.array(["paris", "tokyo", "lima"])[np.arange(n) % 3],
+        "name": [f"name-{i}" for i in range(n)],
+        "day": [f"2021-01-{1 + i % 28:02d}" for i in range(n)],
+    })
+
+
+@pytest.fixture
+def dataset_frame(frame):
+    return frame
+
+
+def test_optimize_dtypes_on_load(dataset_dir):
+    df = load("owner/data", optimize_dtypes=True, batch_rows=300)
+
+    assert df["small"].dtype == np.int8
+    assert df["id"].dtype == np.int16
+    assert df["ratio"].dtype == np.float32
+    assert str(df["age"].dtype) == "Int8"
+    assert df["age"].isna().sum() == 100
+    assert isinstance(df["city"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["name"].dtype, pd.StringDtype) and df["name"].dtype.storage == "pyarrow"
+    assert pd.api.types.is_datetime64_any_dtype(df["day"])
+
+    report = df.attrs["dtype_report"]
+    assert report.after_bytes < report.before_bytes
+    assert report.changes["city"][1] == "category"
+
+
+def test_stream_chunks_share_dtypes(dataset_dir):
+    chunks = list(load("owner/data", stream=True, optimize_dtypes=True, batch_rows=250))
+
+    assert len(chunks) == 4
+    # Category codes keep their meaning across chunks
+    first = chunks[0]["city"].cat.categories
+    assert all(list(c["city"].cat.categories[:len(first)]) == list(first) for c in chunks)
+    # Streams use nullable integers so a chunk with gaps keeps the same dtype
+    assert {str(c["small"].dtype) for c in chunks} == {"Int8"}
+    assert {str(c["age"].dtype) for c in chunks} == {"Int8"}
+
+
+def test_numeric_dtype_only_widens():
+    opt = DtypeOptimizer(strings=False, dates=False)
+    a = opt.apply(pd.DataFrame({"x": [1, 2]}))
+    b = opt.apply(pd.DataFrame({"x": [1, 40_000]}))
+    c = opt.apply(pd.DataFrame({"x": [3, 4]}))
+    assert (a["x"].dtype, b["x"].dtype, c["x"].dtype) == (np.int8, np.int32, np.int32)
+    assert concat_chunks([a, b, c])["x"].tolist() == [1, 2, 1, 40_000, 3, 4]
+
+
+def test_later_chunks_are_cast_to_pinned_dtype():
+    opt = DtypeOptimizer(strings=False, dates=False, nullable_integers=True)
+    a = opt.apply(pd.DataFrame({"x": [1, 2, 3]}))
+    b = opt.apply(pd.DataFrame({"x": [1.0, np.nan, 100.0]}))
+    c = opt.apply(pd.DataFrame({"x": [1.0, np.nan, 300.0]}))
+    d = opt.apply(pd.DataFrame({"x": [4, 5, 6]}))
+    assert [str(f["x"].dtype) for f in (a, b, c, d)] == ["Int8", "Int8", "Int16", "Int16"]
+    assert concat_chunks([a, b, c, d])["x"].isna().sum() == 2
+
+
+
+def test_floats_only_narrow_without_loss():
+    exact = pd.Series([0.25, 0.5, 1.75])
+    lossy = pd.Series([123456.789, 48.8566123, 1.5])
+
+    assert downcast_numeric(pd.DataFrame({"x": exact}))["x"].dtype == np.float32
+    df = downcast_numeric(pd.DataFrame({"x": lossy}))
+    assert df["x"].dtype == np.float64
+    pd.testing.assert_series_equal(df["x"], lossy, check_names=False)
+
+    optimizer = DtypeOptimizer(categorical_columns=[], strings=False, dates=False)
+    assert optimizer.apply(pd.DataFrame({"x": exact}))["x"].dtype == np.float32
+    # A later chunk that float32 cannot hold exactly widens the column
+    assert optimizer.apply(pd.DataFrame({"x": lossy}))["x"].tolist() == lossy.tolist()
+
+def test_unparseable_later_dates_are_kept_as_text(caplog):
+    opt = DtypeOptimizer(strings=False, categorical_columns=[])
+    a = opt.apply(pd.DataFrame({"day": ["2021-01-01", "2021-01-02"]}))
+    b = opt.apply(pd.DataFrame({"day": ["2021-01-03", "03/01/2021"]}))
+    c = opt.apply(pd.DataFrame({"day": ["2021-01-05", "2021-01-06"]}))
+
+    assert pd.api.types.is_datetime64_any_dtype(a["day"])
+    assert b["day"].tolist() == ["2021-01-03", "03/01/2021"]
+    assert c["day"].tolist() == ["2021-01-05", "2021-01-06"]
+    assert "not ISO-8601 dates" in caplog.text
+
+
+def test_arrow_engine_ignores_option(dataset_dir):
+    table = load("owner/data", engine="arrow", optimize_dtypes=True)
+    assert table.num_rows == 1000
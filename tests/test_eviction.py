@@ -0,0 +1,174 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from kaggleease import eviction
+from kaggleease.cli import cli
+from kaggleease.locks import entry_lock
+
+
+@pytest.fixture
+def hub(tmp_path, monkeypatch):
+    root = tmp_path / "hub"
+    monkeypatch.setenv("KAGGLEHUB_CACHE", str(root))
+    monkeypatch.setitem(eviction._config, "max_bytes", None)
+    return root
+
+
+def _dataset(root, handle, size, version=1):
+    base = root / "datasets" / handle
+    (base / "versions" / str(version)).mkdir(parents=True)
+    (base / "versions" / str(version) / "data.csv").write_bytes(b"x" * size)
+    (base / f"{version}.complete").touch()
+
+
+def _competition(root, slug, size):
+    (root / "competitions" / slug).mkdir(parents=True)
+    (root / "competitions" / slug / "train.csv").write_bytes(b"x" * size)
+    (root / "competitions" / f"{slug}.complete").touch()
+
+
+def _accessed(handles, monkeypatch):
+    for i, handle in enumerate(handles):
+        with monkeypatch.context() as m:
+            m.setattr(eviction.time, "time", lambda i=i: 1_000_000 + i)
+            eviction.record_access(handle)
+
+
+def test_parse_size():
+    assert eviction.parse_size("20GB") == 20 * 1024**3
+    assert eviction.parse_size("1.5 MiB") == int(1.5 * 1024**2)
+    assert eviction.parse_size(512) == 512
+    with pytest.raises(ValueError):
+        eviction.parse_size("lots")
+
+
+def test_prune_evicts_least_recently_used_and_keeps_pins(hub, monkeypatch):
+    from kaggleease.cache import find_cached_download
+    _dataset(hub, "a/old", 400)
+    _dataset(hub, "a/pinned", 400)
+    _competition(hub, "titanic", 400)
+    _dataset(hub, "a/new", 400)
+    _accessed(["a/pinned", "a/old", "titanic", "a/new"], monkeypatch)
+    eviction.pin_dataset("a/pinned")
+
+    assert [e.handle for e in eviction.cache_entries()] == ["a/new", "titanic", "a/old", "a/pinned"]
+    assert [e.handle for e in eviction.prune_cache(1000, dry_run=True)] == ["a/old", "titanic"]
+
+    evicted = eviction.prune_cache(1000)
+
+    assert [e.handle for e in evicted] == ["a/old", "titanic"]
+    assert sorted(e.handle for e in eviction.cache_entries()) == ["a/new", "a/pinned"]
+    assert find_cached_download("titanic") is None
+    assert not (hub / "competitions" / "titanic.complete").exists()
+    assert os.listdir(hub / eviction.TRASH_DIR) == []
+
+
+def test_prune_skips_entries_locked_by_a_download(hub, monkeypatch):
+    _dataset(hub, "a/busy", 400)
+    _dataset(hub, "a/idle", 400)
+    _accessed(["a/busy", "a/idle"], monkeypatch)
+
+    lock = entry_lock("a/busy", "dataset")
+    assert lock.acquire(blocking=False)
+    try:
+        evicted = eviction.prune_cache(500)
+    finally:
+        lock.release()
+
+    assert [e.handle for e in evicted] == ["a/idle"]
+
+
+def _prune_worker(cache_dir, hub_dir, queue):
+    os.environ["KAGGLEEASE_CACHE_DIR"] = cache_dir
+    os.environ["KAGGLEHUB_CACHE"] = hub_dir
+    try:
+        queue.put([e.handle for e in eviction.prune_cache(1000)])
+    except Exception as e:
+        queue.put(repr(e))
+
+
+def test_concurrent_pruners_evict_each_entry_once(hub, isolated_cache_dir):
+    for i in range(6):
+        _dataset(hub, f"a/d{i}", 400)
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=_prune_worker, args=(str(isolated_cache_dir), str(hub), queue)) for _ in range(3)]
+    for w in workers:
+        w.start()
+    results = [queue.get(timeout=60) for _ in workers]
+    for w in workers:
+        w.join(timeout=60)
+
+    assert all(isinstance(r, list) for r in results), results
+    evicted = [h for r in results for h in r]
+    assert len(evicted) == len(set(evicted)) == 4
+    assert len(eviction.cache_entries()) == 2
+
+
+def test_load_records_access_and_enforces_budget(hub, tmp_path, mock_kagglehub, monkeypatch):
+    from kaggleease import load
+    _dataset(hub, "a/stale", 4000)
+    download = tmp_path / "download"
+    download.mkdir()
+    (download / "train.csv").write_text("a\n1\n")
+    monkeypatch.setenv(eviction.BUDGET_ENV, "1KB")
+    mock_kagglehub.dataset_download.return_value = str(download)
+    try:
+        load("test/dataset")
+    finally:
+        mock_kagglehub.dataset_download.return_value = "/tmp/mock/dataset"
+
+    assert eviction._access_log()[("dataset", "test/dataset")][0] is not None
+    assert not (hub / "datasets" / "a" / "stale").exists()
+
+
+def test_reuse_does_not_walk_the_cache(hub, monkeypatch):
+    _dataset(hub, "a/one", 400)
+    monkeypatch.setitem(eviction._config, "max_bytes", 10**9)
+    pruned = []
+    monkeypatch.setattr(eviction, "prune_cache", lambda **kw: pruned.append(kw))
+
+    eviction.after_download("a/one", "dataset")
+    eviction.after_download("a/one", "dataset")
+    assert len(pruned) == 1
+
+    # A new download changes the entry's size
+    (hub / "datasets" / "a" / "one" / "versions" / "1" / "more.csv").write_bytes(b"x" * 10)
+    eviction.after_download("a/one", "dataset")
+    assert len(pruned) == 2
+
+    # So does a new budget
+    monkeypatch.setitem(eviction._config, "max_bytes", 10**8)
+    eviction.after_download("a/one", "dataset")
+    assert len(pruned) == 3
+
+
+def test_prune_empties_leftover_trash(hub):
+    leftover = hub / eviction.TRASH_DIR / "abc" / "sub"
+    leftover.mkdir(parents=True)
+    (leftover / "data.csv").write_text("x")
+
+    eviction.prune_cache(10**9)
+    assert os.listdir(hub / eviction.TRASH_DIR) == []
+
+
+def test_cache_cli(hub):
+    _dataset(hub, "a/one", 2048)
+    _competition(hub, "titanic", 1024)
+    runner = CliRunner()
+
+    assert runner.invoke(cli, ["cache", "pin", "a/one"]).exit_code == 0
+    listing = json.loads(runner.invoke(cli, ["cache", "ls", "--json"]).output)
+    assert {e["handle"]: e["pinned"] for e in listing} == {"a/one": True, "titanic": False}
+
+    usage = json.loads(runner.invoke(cli, ["cache", "du", "--json"]).output)
+    assert usage["size"] == 3072 and usage["entries"] == 2 and usage["budget"] is None
+
+    result = runner.invoke(cli, ["cache", "prune", "--max-size", "2KB"])
+    assert result.exit_code == 0
+    assert "Evicted titanic" in result.output
+    assert runner.invoke(cli, ["cache", "prune"]).exit_code != 0
@@ -0,0 +1,63 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("pandas", "pyarrow", "kagglehub", "IPython", "psutil")
+
+# Generous ceiling for `import kaggleease` on its own; the eager package took
+# most of a second, the lazy one a few milliseconds.
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _run(code: str) -> dict:
+    """Runs code in a fresh interpreter (real modules, no conftest mocks)."""
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _probe(statement: str) -> str:
+    return (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+
+
+def test_package_import_is_lazy():
+    result = _run(_probe("import kaggleease"))
+    assert result["heavy"] == []
+
+
+def test_search_does_not_import_data_stack():
+    result = _run(_probe("from kaggleease import search"))
+    assert result["heavy"] == []
+
+
+def test_load_is_resolved_on_first_access():
+    result = _run(_probe("import kaggleease.load; assert callable(kaggleease.load)"))
+    assert "pandas" in result["heavy"]
+
+
+def test_import_time_budget():
+    # Best of three to ride out a cold filesystem cache
+    elapsed = min(_run(_probe("import kaggleease"))["elapsed"] for _ in range(3))
+    if elapsed > IMPORT_BUDGET_SECONDS:
+        pytest.fail(f"import kaggleease took {elapsed:.3f}s (budget {IMPORT_BUDGET_SECONDS}s)")
+
+
+def test_cli_metadata_commands_skip_data_stack():
+    result = _run(_probe("from kaggleease.cli import cli"))
+    assert result["heavy"] == []
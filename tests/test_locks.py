@@ -0,0 +1,126 @@
+import errno
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from kaggleease import download, locks
+from kaggleease.errors import NetworkError
+
+
+def test_single_flight_across_threads(tmp_path, monkeypatch):
+    from kaggleease.load import _download
+
+    target = tmp_path / "versions" / "1" / "train.csv"
+    fetches = []
+    active = []
+
+    def fake_fetch(handle, res_type, file_path, version=None):
+        if not target.exists():
+            active.append(1)
+            assert len(active) == 1, "two downloads of the same file overlapped"
+            time.sleep(0.2)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("a\n1\n")
+            fetches.append(threading.get_ident())
+            active.pop()
+        return str(target), 1
+
+    monkeypatch.setenv("KAGGLEEASE_DOWNLOADER", "ranged")
+    monkeypatch.setattr(download, "fetch_file", fake_fetch)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(_download("o/d", "dataset", files=["train.csv"])))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(fetches) == 1
+    assert results == [str(tmp_path / "versions" / "1")] * 4
+
+
+def _hold_download_lock(cache_dir, log_path):
+    os.environ["KAGGLEEASE_CACHE_DIR"] = cache_dir
+    with locks.download_lock("o/d", "dataset", "v1-train.csv"):
+        with open(log_path, "a") as f:
+            f.write(f"start {time.time()}\n")
+        time.sleep(0.2)
+        with open(log_path, "a") as f:
+            f.write(f"end {time.time()}\n")
+
+
+def test_single_flight_across_processes(tmp_path, isolated_cache_dir):
+    log_path = tmp_path / "log"
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_hold_download_lock, args=(str(isolated_cache_dir), str(log_path))) for _ in range(3)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join(timeout=60)
+
+    events = [line.split()[0] for line in log_path.read_text().splitlines()]
+    assert events == ["start", "end"] * 3
+
+
+def test_download_blocks_eviction_of_its_entry(isolated_cache_dir):
+    with locks.download_lock("o/d", "dataset", "v1-*"):
+        evictor = locks.entry_lock("o/d", "dataset")
+        assert not evictor.acquire(blocking=False)
+        # Other targets of the same dataset can still be downloaded
+        with locks.download_lock("o/d", "dataset", "v1-other.csv", timeout=1):
+            pass
+    assert evictor.acquire(blocking=False)
+    evictor.release()
+
+
+def test_lock_timeout_raises_network_error(tmp_path, monkeypatch):
+    from kaggleease.load import _single_flight
+
+    held = locks.FileLock(locks.lock_path("dataset-o__d-v1-train.csv"))
+    assert held.acquire()
+    monkeypatch.setitem(download._config, "lock_timeout", 0.2)
+    try:
+        with pytest.raises(NetworkError):
+            with _single_flight("o/d", "dataset", 1, "train.csv"):
+                pass
+    finally:
+        held.release()
+
+
+
+def test_download_timeout_is_not_a_lock_timeout():
+    from kaggleease.load import _single_flight
+
+    with pytest.raises(TimeoutError, match="read timed out"):
+        with _single_flight("o/d", "dataset", 1, "train.csv"):
+            raise TimeoutError("read timed out")
+    # The lock was released on the way out
+    lock = locks.FileLock(locks.lock_path("dataset-o__d-v1-train.csv"))
+    assert lock.acquire(blocking=False)
+    lock.release()
+
+def test_marker_fallback_recovers_stale_locks(tmp_path, monkeypatch):
+    def no_os_locks(fd, shared=False):
+        raise OSError(errno.ENOLCK, "No locks available")
+
+    monkeypatch.setattr(locks, "_try_lock", no_os_locks)
+    path = tmp_path / "x.lock"
+    marker = tmp_path / "x.lock.owner"
+
+    dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    marker.write_text(json.dumps({"pid": int(dead.stdout), "host": locks.socket.gethostname(), "since": 0}))
+    lock = locks.FileLock(path)
+    assert lock.acquire(blocking=False)
+    assert json.loads(marker.read_text())["pid"] == os.getpid()
+
+    assert not locks.FileLock(path).acquire(blocking=False)
+    lock.release()
+    assert not marker.exists()
@@ -0,0 +1,127 @@
+import pytest
+
+from kaggleease import metadata
+from kaggleease.errors import NetworkError
+from kaggleease.load import _get_dataset_files
+
+
+@pytest.fixture(autouse=True)
+def reset_metadata_config():
+    yield
+    metadata._config.update({"ttl": None, "offline": None, "enabled": True})
+
+
+def test_listing_is_served_from_cache(mock_client):
+    first = _get_dataset_files("test/dataset")
+    second = _get_dataset_files("test/dataset")
+
+    assert mock_client.list_files.call_count == 1
+    assert second == first
+    assert second[0][0].name == "train.csv"
+    assert second[2] == "dataset"
+
+
+def test_stale_entry_revalidated_by_version(mock_client):
+    mock_client.dataset_version.return_value = 7
+    metadata.configure_metadata_cache(ttl=0)
+
+    _get_dataset_files("test/dataset")  # miss -> list, records v7
+    assert metadata.get_metadata_cache().get("test/dataset").version == 7
+    _get_dataset_files("test/dataset")  # stale, version unchanged -> no list
+    _get_dataset_files("test/dataset")
+
+    assert mock_client.list_files.call_count == 1
+    mock_client.dataset_version.return_value = 8
+    _get_dataset_files("test/dataset")  # stale, new version -> list
+    assert mock_client.list_files.call_count == 2
+    assert metadata.get_metadata_cache().get("test/dataset").version == 8
+
+
+def test_offline_mode(mock_client, monkeypatch):
+    _get_dataset_files("test/dataset")
+    monkeypatch.setenv("KAGGLEEASE_OFFLINE", "1")
+    metadata.configure_metadata_cache(ttl=0)
+
+    files, _, _, _ = _get_dataset_files("test/dataset")
+    assert files[0].name == "train.csv"
+    assert mock_client.list_files.call_count == 1
+
+    with pytest.raises(NetworkError):
+        _get_dataset_files("other/dataset")
+
+
+def test_cache_lives_under_cache_dir(isolated_cache_dir):
+    _get_dataset_files("test/dataset")
+    assert (isolated_cache_dir / metadata.DB_NAME).exists()
+
+
+def _fake_kagglehub_download(root, owner, slug, version, files):
+    base = root / "datasets" / owner / slug
+    version_dir = base / "versions" / str(version)
+    version_dir.mkdir(parents=True)
+    for name, content in files.items():
+        (version_dir / name).write_text(content)
+    (base / f"{version}.complete").write_text("")
+    return version_dir
+
+
+def test_cache_first_skips_network(mock_client, mock_auth, monkeypatch, tmp_path):
+    from kaggleease import load
+
+    hub = tmp_path / "kagglehub"
+    monkeypatch.setenv("KAGGLEHUB_CACHE", str(hub))
+    _fake_kagglehub_download(hub, "owner", "data", 1, {"train.csv": "a\n1\n"})
+    _fake_kagglehub_download(hub, "owner", "data", 2, {"train.csv": "a\n2\n"})
+
+    df = load("owner/data", cache_first=True, revalidate=False)
+    assert df["a"].tolist() == [2]
+
+    df = load("owner/data", version=1, cache_first=True, revalidate=False)
+    assert df["a"].tolist() == [1]
+
+    mock_client.list_files.assert_not_called()
+    mock_auth.assert_not_called()
+
+
+def test_incomplete_download_is_not_served(monkeypatch, tmp_path):
+    from kaggleease.cache import find_cached_download
+
+    monkeypatch.setenv("KAGGLEHUB_CACHE", str(tmp_path / "empty"))
+    assert find_cached_download("owner/data") is None
+
+    # Incomplete downloads (no marker) are never served
+    version_dir = tmp_path / "empty" / "datasets" / "owner" / "data" / "versions" / "1"
+    version_dir.mkdir(parents=True)
+    assert find_cached_download("owner/data") is None
+
+
+def test_pinned_version_bypasses_latest_listing(mock_client):
+    _get_dataset_files("test/dataset")
+    _get_dataset_files("test/dataset", version=3)
+
+    assert mock_client.list_files.call_count == 2
+    mock_client.list_files.assert_called_with("test/dataset", version=3)
+
+
+def test_background_revalidation_is_deduplicated(mock_client, mock_auth):
+    import threading
+    from kaggleease.load import _revalidate_in_background
+
+    _get_dataset_files("test/dataset")
+    mock_client.list_files.reset_mock()
+    mock_client.dataset_version.reset_mock()
+
+    # Fresh listing: no thread, no request
+    _revalidate_in_background("test/dataset", "test/dataset", "dataset", 1)
+    assert mock_client.dataset_version.call_count == 0
+
+    metadata.configure_metadata_cache(ttl=0)
+    release = threading.Event()
+    mock_client.dataset_version.side_effect = lambda handle: release.wait(5) and 2
+    for _ in range(5):
+        _revalidate_in_background("test/dataset", "test/dataset", "dataset", 1)
+    release.set()
+    for thread in [t for t in threading.enumerate() if t.name == "kaggleease-revalidate"]:
+        thread.join(5)
+
+    assert mock_client.dataset_version.call_count == 1
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaggleease import load, planner
+from kaggleease.dtypes import concat_chunks, frame_bytes
+from kaggleease.errors import InsufficientMemoryError
+
+
+@pytest.fixture
+def frame():
+    n = 20_000
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "score": np.arange(n) % 100,
+        "city": np.array(["paris", "tokyo", "lima", "oslo"])[np.arange(n) % 4],
+        "note": [f"row-{i}" for i in range(n)],
+    })
+
+
+@pytest.fixture
+def csv_path(tmp_path, frame):
+    path = tmp_path / "train.csv"
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def dataset_frame(frame):
+    return frame
+
+
+def _budgets(csv_path):
+    plan = planner.plan_load(csv_path, budget_bytes=1, sample_rows=1000)
+    return plan.estimated_bytes, plan.downcast_bytes, plan.categorical_bytes
+
+
+def test_estimate_tracks_real_footprint(csv_path, frame):
+    estimated, downcast, categorical = _budgets(csv_path)
+    assert estimated == pytest.approx(frame_bytes(frame), rel=0.2)
+    assert categorical < downcast < estimated
+
+
+def test_strategy_ladder(csv_path):
+    estimated, downcast, categorical = _budgets(csv_path)
+
+    def strategy(budget, **kwargs):
+        return planner.plan_load(csv_path, budget_bytes=budget, sample_rows=1000, **kwargs).strategy
+
+    assert strategy(estimated * 2) == "full"
+    assert strategy(downcast + 1) == "downcast"
+    assert strategy(categorical + 1) == "categorical"
+    assert strategy(categorical // 2) == "refuse"
+    assert strategy(categorical // 2, stream_fallback=True) == "stream"
+    assert strategy(downcast + 1, optimizable=False) == "refuse"
+
+
+def test_filters_and_columns_shrink_estimate(csv_path):
+    full = planner.plan_load(csv_path, budget_bytes=1, sample_rows=1000)
+    narrow = planner.plan_load(
+        csv_path, budget_bytes=1, sample_rows=1000, columns=["id"], filters=[("score", "<", 10)]
+    )
+    assert narrow.rows == pytest.approx(full.rows / 10, rel=0.1)
+    assert narrow.estimated_bytes < full.estimated_bytes / 20
+
+
+def test_load_applies_plan(dataset_dir, csv_path, frame, monkeypatch):
+    _, _, categorical = _budgets(csv_path)
+    monkeypatch.setattr(planner, "available_memory", lambda: int((categorical + 1) / planner.MEMORY_THRESHOLD))
+
+    df = load("owner/data", batch_rows=3000)
+    assert isinstance(df["city"].dtype, pd.CategoricalDtype)
+    assert df["score"].dtype == np.int8
+    pd.testing.assert_frame_equal(df.astype(frame.dtypes.to_dict()), frame)
+
+
+def test_load_refuses_or_streams(dataset_dir, monkeypatch):
+    monkeypatch.setattr(planner, "available_memory", lambda: 1000)
+
+    with pytest.raises(InsufficientMemoryError) as exc:
+        load("owner/data")
+    assert "Memory plan: refuse" in str(exc.value)
+
+    chunks = load("owner/data", memory_plan="stream", batch_rows=5000)
+    assert sum(len(c) for c in chunks) == 20_000
+
+
+def test_concat_chunks_keeps_categories():
+    a = pd.DataFrame({"c": pd.Categorical(["x", "y"])})
+    b = pd.DataFrame({"c": pd.Categorical(["z"])})
+    out = concat_chunks([a, b])
+    assert isinstance(out["c"].dtype, pd.CategoricalDtype)
+    assert out["c"].tolist() == ["x", "y", "z"]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_arrow_ipc_rows_counted_without_decoding(tmp_path, frame, stream, monkeypatch):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    path = tmp_path / "train.arrow"
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    options = ipc.IpcWriteOptions(compression="lz4")
+    open_writer = ipc.new_stream if stream else ipc.new_file
+    with pa.OSFile(str(path), "wb") as sink, open_writer(sink, table.schema, options=options) as writer:
+        writer.write_table(table, max_chunksize=5000)
+    if not stream:
+        # The file format is counted from batch headers alone
+        monkeypatch.setattr(ipc.RecordBatchFileReader, "get_batch", None, raising=False)
+
+    assert planner._count_rows(str(path), 1000) == len(frame)
@@ -0,0 +1,384 @@
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from kaggleease.readers import iter_file, read_file
+from kaggleease.errors import DataFormatError, UnsupportedFormatError
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"id": range(10), "name": [f"n{i}" for i in range(10)]})
+
+
+def _collect(path, **kwargs):
+    chunks = list(iter_file(str(path), batch_rows=4, **kwargs))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def test_stream_csv(tmp_path, frame):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    pd.testing.assert_frame_equal(_collect(path), frame)
+
+
+def test_stream_parquet(tmp_path, frame):
+    path = tmp_path / "data.parquet"
+    frame.to_parquet(path, row_group_size=3)
+    pd.testing.assert_frame_equal(_collect(path), frame)
+
+
+def _write_ipc(path, frame, stream=False, batch_rows=None):
+    import pyarrow as pa
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    open_writer = pa.ipc.new_stream if stream else pa.ipc.new_file
+    with pa.OSFile(str(path), "wb") as sink, open_writer(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=batch_rows)
+
+
+@pytest.mark.parametrize("name,stream", [("data.feather", False), ("data.arrow", False), ("data.ipc", True)])
+def test_stream_arrow_ipc(tmp_path, frame, name, stream):
+    path = tmp_path / name
+    _write_ipc(path, frame, stream=stream)
+    pd.testing.assert_frame_equal(read_file(str(path)), frame)
+    pd.testing.assert_frame_equal(_collect(path), frame)
+    assert iter_file(str(path), batch_rows=4, backend="arrow").read_all().num_rows == 10
+
+
+def test_arrow_ipc_is_memory_mapped(tmp_path):
+    import pyarrow as pa
+    big = pd.DataFrame({"x": range(1_000_000)})
+    path = tmp_path / "big.arrow"
+    _write_ipc(path, big, batch_rows=250_000)
+
+    before = pa.total_allocated_bytes()
+    table = read_file(str(path), backend="arrow")
+    # Columns point into the mapped file instead of freshly allocated memory
+    assert table.num_rows == 1_000_000
+    assert pa.total_allocated_bytes() - before < 1024 * 1024
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_feather_v1(tmp_path, frame):
+    import pyarrow.feather as feather
+    path = tmp_path / "old.feather"
+    feather.write_feather(frame, str(path), version=1)
+    pd.testing.assert_frame_equal(read_file(str(path)), frame)
+
+
+def test_parquet_is_memory_mapped(tmp_path, frame, monkeypatch):
+    import pyarrow.parquet as pq
+    path = tmp_path / "data.parquet"
+    frame.to_parquet(path)
+    seen = []
+    read_table = pq.read_table
+    monkeypatch.setattr(pq, "read_table", lambda *a, **kw: seen.append(kw.get("memory_map")) or read_table(*a, **kw))
+    read_file(str(path), backend="arrow")
+    assert seen == [True]
+    pd.testing.assert_frame_equal(read_file(str(path)), frame)
+
+
+def test_stream_json_lines(tmp_path, frame):
+    path = tmp_path / "data.jsonl"
+    frame.to_json(path, orient="records", lines=True)
+    pd.testing.assert_frame_equal(_collect(path), frame)
+
+
+def test_stream_sqlite(tmp_path, frame):
+    path = tmp_path / "data.sqlite"
+    with sqlite3.connect(path) as conn:
+        frame.to_sql("people", conn, index=False)
+    pd.testing.assert_frame_equal(_collect(path), frame)
+
+
+def test_json_lines_detected_in_json_extension(tmp_path, frame):
+    path = tmp_path / "data.json"
+    frame.to_json(path, orient="records", lines=True)
+    pd.testing.assert_frame_equal(read_file(str(path)), frame)
+
+
+def test_stream_unsupported(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"\x89PNG")
+    with pytest.raises(UnsupportedFormatError):
+        next(iter_file(str(path)))
+
+
+def test_load_stream(tmp_path, frame, mock_kagglehub, mock_client):
+    from kaggleease import load
+    frame.to_csv(tmp_path / "train.csv", index=False)
+    mock_kagglehub.dataset_download.return_value = str(tmp_path)
+    try:
+        chunks = list(load("test/dataset", stream=True, batch_rows=5))
+    finally:
+        mock_kagglehub.dataset_download.return_value = "/tmp/mock/dataset"
+    assert [len(c) for c in chunks] == [5, 5]
+
+
+def test_arrow_engine_returns_table(tmp_path, frame):
+    import pyarrow as pa
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+
+    table = read_file(str(path), backend="arrow")
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 10
+
+    reader = iter_file(str(path), batch_rows=4, backend="arrow")
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert [b.num_rows for b in reader] == [4, 4, 2]
+
+
+def test_arrow_engine_translates_csv_options(tmp_path, frame):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False, sep=";")
+
+    table = read_file(str(path), backend="arrow", sep=";", na_values=["n3"])
+    assert table.column_names == ["id", "name"]
+    assert table.column("name").null_count == 1
+    renamed = iter_file(str(path), batch_rows=4, backend="arrow", delimiter=";", names=["a", "b"], header=0)
+    assert renamed.read_all().column_names == ["a", "b"]
+    with pytest.raises(DataFormatError, match="thousands"):
+        read_file(str(path), backend="arrow", sep=";", thousands=",")
+
+
+def test_pandas_reader_engines_pass_through():
+    from kaggleease.load import _normalize_engine
+    for engine in ("c", "odf", "calamine", "pyxlsb"):
+        kwargs = {}
+        assert _normalize_engine(engine, kwargs) == "pandas"
+        assert kwargs == {"engine": engine}
+    assert _normalize_engine("arrow", {}) == "arrow"
+
+
+def test_arrow_engine_parquet_stream(tmp_path, frame):
+    path = tmp_path / "data.parquet"
+    frame.to_parquet(path, row_group_size=3)
+    reader = iter_file(str(path), batch_rows=4, backend="arrow")
+    assert reader.read_all().num_rows == 10
+
+
+def test_arrow_stream_types_columns_null_in_the_first_batch(tmp_path):
+    path = tmp_path / "data.sqlite"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER, score REAL, note TEXT)")
+        rows = [(i, None if i < 6 else i / 2, None if i < 6 else f"n{i}") for i in range(10)]
+        conn.executemany("INSERT INTO t VALUES (?, ?, ?)", rows)
+
+    table = iter_file(str(path), batch_rows=4, backend="arrow").read_all()
+
+    assert table.num_rows == 10
+    assert str(table.schema.field("score").type) == "double"
+    assert table.column("note").to_pylist()[-1] == "n9"
+
+
+def test_arrow_stream_of_an_empty_table(tmp_path):
+    path = tmp_path / "data.sqlite"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER, note TEXT)")
+
+    table = iter_file(str(path), batch_rows=4, backend="arrow").read_all()
+
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "note"]
+
+
+def test_arrow_stream_reads_json_lines_in_chunks(tmp_path, frame, monkeypatch):
+    from kaggleease import readers
+    path = tmp_path / "data.jsonl"
+    frame.to_json(path, orient="records", lines=True)
+    monkeypatch.setattr(readers, "read_arrow", None)  # never read whole
+
+    reader = iter_file(str(path), batch_rows=4, backend="arrow")
+
+    assert [b.num_rows for b in reader] == [4, 4, 2]
+
+
+def test_pyarrow_dtype_backend(tmp_path, frame):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    df = read_file(str(path), dtype_backend="pyarrow")
+    assert isinstance(df["id"].dtype, pd.ArrowDtype)
+
+
+@pytest.mark.parametrize("name", ["data.feather", "data.parquet"])
+def test_arrow_based_files_take_dtype_backend(tmp_path, frame, name):
+    path = tmp_path / name
+    if name.endswith(".parquet"):
+        frame.to_parquet(path)
+    else:
+        _write_ipc(path, frame)
+
+    chunks = list(iter_file(str(path), batch_rows=4, dtype_backend="pyarrow"))
+    assert all(isinstance(c["name"].dtype, pd.ArrowDtype) for c in chunks)
+    nullable = next(iter(iter_file(str(path), batch_rows=4, dtype_backend="numpy_nullable")))
+    assert str(nullable["id"].dtype) == "Int64"
+    with pytest.raises(DataFormatError, match="sep"):
+        next(iter(iter_file(str(path), batch_rows=4, sep=";")))
+    if name.endswith(".feather"):
+        assert isinstance(read_file(str(path), dtype_backend="pyarrow")["id"].dtype, pd.ArrowDtype)
+        with pytest.raises(DataFormatError):
+            read_file(str(path), sep=";")
+
+
+def test_columnar_cache_roundtrip(tmp_path, frame, isolated_cache_dir, monkeypatch):
+    from kaggleease import columnar
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+
+    first = columnar.read_with_columnar_cache(str(path))
+    artifacts = list((isolated_cache_dir / columnar.ARTIFACT_DIR).glob("*.arrow"))
+    assert len(artifacts) == 1
+
+    # A hit must not touch the CSV parser
+    monkeypatch.setattr(columnar, "read_file", lambda *a, **k: pytest.fail("source was re-parsed"))
+    pd.testing.assert_frame_equal(columnar.read_with_columnar_cache(str(path)), first)
+
+
+def test_columnar_cache_invalidated_on_change(tmp_path, frame, isolated_cache_dir):
+    from kaggleease import columnar
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    columnar.read_with_columnar_cache(str(path))
+
+    frame.head(3).to_csv(path, index=False)
+    assert len(columnar.read_with_columnar_cache(str(path))) == 3
+    assert len(list((isolated_cache_dir / columnar.ARTIFACT_DIR).glob("*.arrow"))) == 1
+
+
+@pytest.mark.parametrize("dtype_backend", ["pyarrow", "numpy_nullable"])
+def test_columnar_cache_hit_keeps_dtype_backend(tmp_path, frame, isolated_cache_dir, dtype_backend):
+    from kaggleease import columnar
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    first = columnar.read_with_columnar_cache(str(path), dtype_backend=dtype_backend)
+    second = columnar.read_with_columnar_cache(str(path), dtype_backend=dtype_backend)
+    assert second.dtypes.tolist() == first.dtypes.tolist()
+
+
+def test_columnar_cache_evicts_least_recently_used(tmp_path, frame, isolated_cache_dir, monkeypatch):
+    from kaggleease import columnar
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.csv"
+        frame.to_csv(path, index=False)
+        paths.append(str(path))
+    columnar.read_with_columnar_cache(paths[0])
+    artifact_dir = isolated_cache_dir / columnar.ARTIFACT_DIR
+    size = next(artifact_dir.glob("*.arrow")).stat().st_size
+    monkeypatch.setitem(columnar._config, "max_bytes", 2 * size)
+
+    columnar.read_with_columnar_cache(paths[1])
+    for i, artifact in enumerate(sorted(artifact_dir.glob("*.arrow"), key=lambda p: p.stat().st_mtime)):
+        os.utime(artifact, (1000 + i, 1000 + i))
+    columnar.read_with_columnar_cache(paths[0])  # a hit makes "a" the most recent
+    columnar.read_with_columnar_cache(paths[2])
+
+    remaining = {p.name for p in artifact_dir.glob("*.arrow")}
+    assert remaining == {columnar._artifact_path(p, "pandas", {}).name for p in (paths[0], paths[2])}
+
+
+@pytest.mark.parametrize("backend", ["pandas", "arrow"])
+def test_columnar_cache_serves_every_projection(tmp_path, frame, isolated_cache_dir, monkeypatch, backend):
+    from kaggleease import columnar
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    reads = [
+        {"columns": ["name"]},
+        {},
+        {"columns": ["id"], "filters": [("id", ">", 6)]},
+    ]
+    expected = [read_file(str(path), backend=backend, **kwargs) for kwargs in reads]
+
+    columnar.read_with_columnar_cache(str(path), backend=backend, columns=["name"])
+    monkeypatch.setattr(columnar, "read_file", lambda *a, **k: pytest.fail("source was re-parsed"))
+    for kwargs, want in zip(reads * 2, expected * 2):
+        got = columnar.read_with_columnar_cache(str(path), backend=backend, **kwargs)
+        if backend == "arrow":
+            assert got.equals(want)
+        else:
+            pd.testing.assert_frame_equal(got, want)
+    assert len(list((isolated_cache_dir / columnar.ARTIFACT_DIR).glob("*.arrow"))) == 1
+
+
+def _write_as(path, ext, frame):
+    if ext in ("feather", "arrow"):
+        _write_ipc(path, frame, stream=ext == "arrow", batch_rows=2)
+    elif ext == "csv":
+        frame.to_csv(path, index=False)
+    elif ext == "parquet":
+        frame.to_parquet(path, row_group_size=2)
+    elif ext == "jsonl":
+        frame.to_json(path, orient="records", lines=True)
+    elif ext == "xlsx":
+        frame.to_excel(path, index=False)
+    else:
+        with sqlite3.connect(path) as conn:
+            frame.to_sql("people", conn, index=False)
+
+
+FILTER_FORMATS = ["csv", "parquet", "feather", "arrow", "jsonl", "sqlite", "xlsx"]
+
+
+@pytest.mark.parametrize("ext", FILTER_FORMATS)
+def test_projection_and_filters(tmp_path, frame, ext):
+    path = tmp_path / f"data.{ext}"
+    _write_as(path, ext, frame)
+
+    filters = [("id", ">=", 3), ("name", "not in", ["n5"])]
+    df = read_file(str(path), columns=["name"], filters=filters)
+    assert list(df.columns) == ["name"]
+    assert list(df["name"]) == ["n3", "n4", "n6", "n7", "n8", "n9"]
+
+    streamed = pd.concat(iter_file(str(path), batch_rows=3, columns=["name"], filters=filters))
+    assert list(streamed["name"]) == list(df["name"])
+
+    table = read_file(str(path), backend="arrow", columns=["name"], filters=[[("id", "==", 1)], [("id", "==", 8)]])
+    assert table.column("name").to_pylist() == ["n1", "n8"]
+
+
+@pytest.mark.parametrize("ext", FILTER_FORMATS)
+@pytest.mark.parametrize("filters, ids", [
+    ([("tag", "in", [])], []),
+    ([("tag", "not in", [])], [0, 1, 2, 3, 4]),
+    ([("tag", "!=", "a")], [1, 2, 3]),
+    ([("tag", "not in", ["b"])], [0, 1, 3, 4]),
+    ([[("tag", "in", [])], [("id", "==", 2)]], [2]),
+])
+def test_filters_agree_on_empty_lists_and_nulls(tmp_path, ext, filters, ids):
+    path = tmp_path / f"tags.{ext}"
+    _write_as(path, ext, pd.DataFrame({"id": range(5), "tag": ["a", None, "b", None, "a"]}))
+
+    assert list(read_file(str(path), columns=["id"], filters=filters)["id"]) == ids
+    assert [i for chunk in iter_file(str(path), batch_rows=2, columns=["id"], filters=filters) for i in chunk["id"]] == ids
+    table = read_file(str(path), backend="arrow", columns=["id"], filters=filters)
+    assert table.column("id").to_pylist() == ids
+
+
+def test_invalid_filter(tmp_path, frame):
+    from kaggleease.errors import DataFormatError
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    with pytest.raises(DataFormatError):
+        read_file(str(path), filters=[("id", "~", 1)])
+
+
+def test_load_resolves_feather_files(tmp_path, frame, mock_kagglehub, mock_client):
+    from kaggleease import load
+    download = tmp_path / "download"
+    download.mkdir()
+    _write_ipc(download / "train.feather", frame)
+    (download / "README.md").write_text("docs")
+    mock_client.list_files.return_value = [
+        {"name": "README.md", "size": 4, "type": "dataset"},
+        {"name": "train.feather", "size": 1000, "type": "dataset"},
+    ]
+    mock_kagglehub.dataset_download.return_value = str(download)
+    try:
+        df = load("test/dataset")
+    finally:
+        mock_kagglehub.dataset_download.return_value = "/tmp/mock/dataset"
+    pd.testing.assert_frame_equal(df, frame)
@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from kaggleease.cli import cli
+from kaggleease.client import _search_params
+from kaggleease.errors import NetworkError
+from kaggleease.search import iter_search
+
+
+def _pages(total, page_size=3):
+    datasets = [{"handle": f"o/d{i}", "title": f"D{i}", "size": i, "votes": 0} for i in range(total)]
+    calls = []
+
+    def search_page(query, page=1, page_size=page_size, filters=None, timeout=30):
+        calls.append(page)
+        return datasets[(page - 1) * page_size:page * page_size]
+    return search_page, calls
+
+
+def test_filters_map_to_api_params():
+    params = _search_params("", 20, page=2, filters={"file_type": "csv", "license": "cc", "sort_by": "votes",
+                                                     "max_size": "1MB", "tags": [1, 2], "user": None})
+    assert params == {"search": "", "sortBy": "votes", "pageSize": 20, "page": 2, "filetype": "csv",
+                      "license": "cc", "maxSize": 1024**2, "tagids": "1,2"}
+    with pytest.raises(ValueError):
+        _search_params("", 20, filters={"file_type": "xlsx"})
+    with pytest.raises(ValueError):
+        iter_search("x", filters={"colour": "red"})
+
+
+def test_iter_search_pages_lazily(mock_client):
+    mock_client.search_page.side_effect, calls = _pages(7)
+    results = iter_search("q", page_size=3, prefetch=False)
+    assert calls == []
+    assert [r["handle"] for r in results] == [f"o/d{i}" for i in range(7)]
+    assert calls == [1, 2, 3]
+
+
+def test_iter_search_max_results_stops_fetching(mock_client):
+    mock_client.search_page.side_effect, calls = _pages(100)
+    assert len(list(iter_search("q", max_results=5, page_size=3))) == 5
+    assert calls == [1, 2]
+
+
+def test_iter_search_prefetches_next_page(mock_client):
+    fetched = threading.Event()
+    search_page, calls = _pages(6)
+
+    def tracking(query, page=1, **kwargs):
+        if page == 2:
+            fetched.set()
+        return search_page(query, page=page, **kwargs)
+    mock_client.search_page.side_effect = tracking
+
+    results = iter_search("q", page_size=3)
+    next(results)
+    assert fetched.wait(5)
+    results.close()
+
+
+def test_iter_search_skips_duplicates_and_raises_on_failure(mock_client):
+    pages = {1: [{"handle": "o/a"}, {"handle": "o/b"}], 2: [{"handle": "o/b"}, {"handle": "o/c"}]}
+
+    def search_page(query, page=1, **kwargs):
+        if page == 3:
+            raise NetworkError("boom")
+        return pages[page]
+    mock_client.search_page.side_effect = search_page
+
+    seen = []
+    with pytest.raises(NetworkError):
+        for r in iter_search("q", page_size=2):
+            seen.append(r["handle"])
+    assert seen == ["o/a", "o/b", "o/c"]
+
+
+def test_cli_search_with_filters(mock_client):
+    mock_client.search_page.side_effect, _ = _pages(10, page_size=2)
+    result = CliRunner().invoke(cli, ["search", "q", "--top", "2", "--file-type", "csv", "--json"])
+    assert result.exit_code == 0
+    assert [r["handle"] for r in json.loads(result.output)] == ["o/d0", "o/d1"]
+    assert mock_client.search_page.call_args.kwargs["filters"]["file_type"] == "csv"
+    assert CliRunner().invoke(cli, ["search", "q", "--license", "mit"]).exit_code != 0
+
+
+def test_search_is_cached_on_disk(mock_client):
+    from kaggleease import search_cache
+    from kaggleease.search import search
+
+    assert search("titanic")[0]["handle"] == "test/dataset"
+    assert search("  Titanic ")[0]["handle"] == "test/dataset"
+    assert mock_client.search_datasets.call_count == 1
+
+    # Another process: empty memory, same store
+    search_cache._caches.clear()
+    assert search("titanic")[0]["size"] == "1.0 KB"
+    assert mock_client.search_datasets.call_count == 1
+    assert search_cache.search_cache_stats()["hits"] == 1
+
+
+def test_failed_searches_are_not_cached(mock_client):
+    from kaggleease.search import search
+
+    mock_client.search_datasets.side_effect = NetworkError("down")
+    assert search("flaky") == []
+    mock_client.search_datasets.side_effect = None
+    assert search("flaky")[0]["handle"] == "test/dataset"
+
+
+@pytest.mark.parametrize("store", ["sqlite", "json", "memory"])
+def test_search_cache_ttls(store, tmp_path, monkeypatch):
+    from kaggleease import search_cache
+
+    stores = {"sqlite": search_cache.SQLiteSearchStore(tmp_path / "s.sqlite"),
+              "json": search_cache.JSONSearchStore(tmp_path / "search"), "memory": None}
+    cache = search_cache.SearchCache(stores[store])
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "time", lambda: now[0])
+    calls = []
+
+    def fetch(results):
+        def run():
+            calls.append(1)
+            return results
+        return run
+
+    kw = {"ttl": 100, "negative_ttl": 10, "stale_ttl": 50}
+    assert cache.get_or_fetch("empty", fetch([]), **kw) == []
+    assert cache.get_or_fetch("empty", fetch([]), **kw) == []
+    now[0] += 11
+    assert cache.get_or_fetch("empty", fetch([{"handle": "o/a"}]), **kw) == [{"handle": "o/a"}]
+    assert len(calls) == 2
+
+    # Expired but within the stale window: old results now, refreshed in the background
+    now[0] += 120
+    refreshed = threading.Event()
+
+    def slow_fetch():
+        refreshed.set()
+        return [{"handle": "o/b"}]
+    assert cache.get_or_fetch("empty", slow_fetch, **kw) == [{"handle": "o/a"}]
+    assert refreshed.wait(5)
+    for _ in range(100):
+        if cache.stats()["refreshes"]:
+            break
+        time.sleep(0.01)
+    assert cache.get_or_fetch("empty", fetch([]), **kw) == [{"handle": "o/b"}]
+    assert cache.stats()["stale_hits"] == 1 and cache.stats()["negative_hits"] == 1
+
+    cache.clear()
+    assert cache.get_or_fetch("empty", fetch([]), offline=True, **kw) == []
@@ -0,0 +1,44 @@
+import threading
+from unittest.mock import MagicMock
+
+import kaggleease.session as session_mod
+
+
+def test_shared_session_is_reused_across_threads():
+    """All threads (and clients) must share one pooled session."""
+    session_mod.close_session()
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(session_mod.get_session())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(s) for s in seen}) == 1
+
+
+def test_configure_rebuilds_session(monkeypatch):
+    monkeypatch.setattr(session_mod, "_build_session", lambda config: MagicMock())
+    session_mod.close_session()
+    first = session_mod.get_session()
+    session_mod.configure_session(pool_size=4)
+    try:
+        assert session_mod.get_session() is not first
+        assert session_mod._session_config["pool_size"] == 4
+    finally:
+        session_mod.configure_session(pool_size=session_mod.DEFAULT_POOL_SIZE)
+
+
+def test_session_stats_counts_reuse(monkeypatch):
+    pool = MagicMock(num_requests=10, num_connections=2)
+    adapter = MagicMock()
+    adapter.poolmanager.pools = {"kaggle": pool}
+    fake = MagicMock()
+    fake.adapters = {"https://": adapter, "http://": adapter}
+    monkeypatch.setattr(session_mod, "_session", fake)
+    monkeypatch.setattr(session_mod, "_session_pid", session_mod.os.getpid())
+
+    stats = session_mod.session_stats()
+    assert stats["requests"] == 10
+    assert stats["connections_opened"] == 2
+    assert stats["connections_reused"] == 8
+    assert stats["pools"] == 1
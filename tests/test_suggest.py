@@ -0,0 +1,75 @@
+import pytest
+
+from kaggleease import catalog, suggest
+from kaggleease.errors import DatasetNotFoundError
+from kaggleease.listing import _get_dataset_files
+from kaggleease.metadata import get_metadata_cache
+
+FILES = [{"name": "train.csv", "size": 10, "type": "dataset"}]
+
+
+def _remember(*handles):
+    for handle in handles:
+        get_metadata_cache().put(handle, handle, "dataset", FILES)
+
+
+def test_similarity():
+    assert suggest._edit_distance("titanic", "titnaic", 3) == 1
+    assert suggest._edit_distance("titanic", "iris", 2) == 3
+    assert suggest.similarity("owner/titanc", "owner/titanic") > suggest.CONFIDENT_SCORE
+    assert suggest.similarity("titanc", "owner/titanic") > suggest.CONFIDENT_SCORE
+    assert suggest.similarity("someone/titanic", "owner/titanic") == suggest.OTHER_OWNER_WEIGHT
+    assert suggest.similarity("owner/iris", "owner/titanic") < suggest.MIN_SCORE
+
+
+def test_suggestions_from_recent_handles_and_catalog():
+    _remember("owner/titanic-data", "owner/house-prices")
+    catalog.get_catalog().upsert([{"handle": "kaggle/titanic-dataset", "title": "Titanic", "size": 1, "votes": 99}])
+
+    found = suggest.suggest_handles("owner/titanic-dta")
+    assert found[0] == ("owner/titanic-data", found[0].score, "recent")
+    assert suggest.suggest_handles("kaggle/titanic-datset")[0] == ("kaggle/titanic-dataset", 1 - 1 / 15, "catalog")
+    assert "owner/titanic-data" not in [s.handle for s in suggest.suggest_handles("owner/titanic-data")]
+
+def test_did_you_mean_without_network(mock_client):
+    _remember("owner/titanic-data")
+    mock_client.list_files.side_effect = Exception("404 not found")
+    with pytest.raises(DatasetNotFoundError) as exc:
+        _get_dataset_files("owner/titanic-dta")
+    assert "owner/titanic-data" in exc.value.fix_suggestion
+    mock_client.search_datasets.assert_not_called()
+
+
+def test_low_confidence_asks_kaggle(mock_client):
+    mock_client.list_files.side_effect = Exception("404 not found")
+    with pytest.raises(DatasetNotFoundError) as exc:
+        _get_dataset_files("owner/something-else")
+    assert "test/dataset" in exc.value.fix_suggestion
+    mock_client.search_datasets.assert_called_once()
+
+
+def test_implicit_resolution_is_local(mock_client):
+    _remember("owner/titanic-data")
+
+    def list_files(handle):
+        if handle != "owner/titanic-data":
+            raise Exception("404 not found")
+        return FILES
+    mock_client.list_files.side_effect = list_files
+
+    files, _, _, resolved = _get_dataset_files("titanic-data")
+    assert resolved == "owner/titanic-data"
+    mock_client.search_datasets.assert_not_called()
+
+
+def test_near_miss_slug_is_not_auto_resolved(mock_client):
+    _remember("acme/sales-2023")
+    assert suggest.similarity("sales-2024", "acme/sales-2023") >= suggest.CONFIDENT_SCORE
+    assert suggest._local_resolution("sales-2024") is None
+
+    mock_client.search_datasets.return_value = []
+    mock_client.list_files.side_effect = Exception("404 not found")
+    with pytest.raises(DatasetNotFoundError):
+        _get_dataset_files("sales-2024")
+    mock_client.search_datasets.assert_called_once()
+    assert all(c.args[0] != "acme/sales-2023" for c in mock_client.list_files.call_args_list)